@@ -0,0 +1,97 @@
+"""Peak RSS and time of the parse_* functions with text-mode and block reads.
+
+Writes a large service catalogue as JSON, YAML, TOML and INI and loads each
+file in a fresh interpreter, once the way the parse_* functions read files
+before (a text-mode ``read()`` followed by the ``*_string`` parser) and once
+with the binary, block-wise read path they use now. Reports the best wall time
+and the peak resident set size of the loading process (Linux only).
+
+Usage:
+    python benchmarks/bench_file_read.py [--services 100000] [--runs 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TEXT_READ = {
+    "json": "from config_lib.parsers.parser_json import parse_json_with_engine as parse",
+    "yaml": "from config_lib.parsers.parser_yaml import parse_yaml_string as parse",
+    "toml": "from config_lib.parsers.parser_toml import parse_toml_string as parse",
+    "ini": "from config_lib.parsers.parser_ini import parse_ini_string as parse",
+}
+BLOCK_READ = "from config_lib.parser import parse_{name} as parse"
+
+# Peak RSS is read from VmHWM: unlike ru_maxrss it is not inherited from
+# the parent process across exec.
+TIMED_LOAD = (
+    "import time\n"
+    "{import_line}\n"
+    "start = time.perf_counter()\n"
+    "{load_line}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "peak = next(line for line in open('/proc/self/status') if line.startswith('VmHWM'))\n"
+    "print(elapsed, peak.split()[1])\n"
+)
+
+
+def write_sources(directory, service_count):
+    services = {f"service{i}": {"host": f"svc{i}.internal", "port": 8000 + i % 1000, "enabled": True}
+                for i in range(service_count)}
+    texts = {
+        "json": json.dumps({"services": services}, indent=2),
+        "yaml": "services:\n" + "".join(
+            f"  {name}:\n    host: {s['host']}\n    port: {s['port']}\n    enabled: true\n"
+            for name, s in services.items()),
+        "toml": "".join(
+            f'[services.{name}]\nhost = "{s["host"]}"\nport = {s["port"]}\nenabled = true\n'
+            for name, s in services.items()),
+        "ini": "".join(
+            f"[services.{name}]\nhost = {s['host']}\nport = {s['port']}\nenabled = true\n"
+            for name, s in services.items()),
+    }
+    paths = {}
+    for name, text in texts.items():
+        paths[name] = os.path.join(directory, f"app.{name}")
+        with open(paths[name], "w", encoding="utf-8") as f:
+            f.write(text)
+    return paths
+
+
+def measure(import_line, load_line, runs):
+    """Best seconds and peak RSS in KiB over ``runs`` fresh interpreters."""
+    script = TIMED_LOAD.format(import_line=import_line, load_line=load_line)
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                                check=True, cwd=REPO_ROOT).stdout.split()
+        results.append((float(output[0]), int(output[1])))
+    return min(seconds for seconds, _ in results), min(rss for _, rss in results)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--services', type=int, default=100000)
+    arg_parser.add_argument('--runs', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_sources(directory, args.services)
+        print(f"{'format':>6} {'MB':>6} {'text read':>20} {'block read':>20}")
+        for name, path in paths.items():
+            text_read = measure(
+                TEXT_READ[name],
+                f"with open({path!r}, encoding='utf-8') as f: parse(f.read())", args.runs)
+            block_read = measure(BLOCK_READ.format(name=name), f"parse({path!r})", args.runs)
+            size = os.path.getsize(path) / 1e6
+            print(f"{name:>6} {size:>6.1f} "
+                  f"{text_read[0] * 1000:>8.0f} ms {text_read[1] / 1024:>5.0f} MiB "
+                  f"{block_read[0] * 1000:>8.0f} ms {block_read[1] / 1024:>5.0f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Import time of config_lib, measured with ``python -X importtime``.
+
+Imports the package in fresh interpreters, reports the cumulative import
+time of the slowest modules, and fails when the best run of ``config_lib``
+exceeds ``--budget-ms`` or when an optional dependency (pymongo) is
+imported without being used.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs 5] [--budget-ms 50] [--module config_lib]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imported only by the features that need them
+OPTIONAL_MODULES = ('pymongo', 'bson')
+
+
+def import_times(module):
+    """Return ``{module: cumulative microseconds}`` for one fresh import."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, check=True, cwd=REPO_ROOT,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--runs', type=int, default=5)
+    arg_parser.add_argument('--budget-ms', type=float, default=50.0)
+    arg_parser.add_argument('--module', default='config_lib')
+    arg_parser.add_argument('--top', type=int, default=10)
+    args = arg_parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.runs)]
+    best = min(runs, key=lambda times: times[args.module])
+
+    print(f"{'module':<45} {'cumulative ms':>13}")
+    for name, cumulative in sorted(best.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<45} {cumulative / 1000:>13.1f}")
+
+    total_ms = best[args.module] / 1000
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"import {args.module} took {total_ms:.1f} ms, budget is {args.budget_ms:.1f} ms")
+    for name in OPTIONAL_MODULES:
+        if name in best:
+            failures.append(f"import {args.module} imported optional module {name}")
+
+    print(f"\nbest of {args.runs}: {total_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
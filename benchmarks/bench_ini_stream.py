@@ -0,0 +1,72 @@
+"""Streaming INI reader versus whole-file parsing on a large inventory.
+
+Generates a per-host inventory INI file and processes it once with
+``parse_ini`` (whole file in memory) and once with ``iter_ini_sections``,
+reporting time and peak traced memory for each.
+
+Usage:
+    python benchmarks/bench_ini_stream.py [--hosts 50000] [--keys 10]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parser import parse_ini, iter_ini_sections  # noqa: E402
+
+
+def write_inventory(file, host_count, key_count):
+    for host in range(host_count):
+        file.write(f"[hosts.region{host % 10}.host{host}]\n")
+        file.write(f"ip = 10.{host // 65536 % 256}.{host // 256 % 256}.{host % 256}\n")
+        for key in range(key_count):
+            file.write(f"option{key} = value-{host}-{key}\n")
+        file.write("\n")
+
+
+def whole_file(path):
+    hosts = parse_ini(path)["hosts"]
+    return sum(len(region) for region in hosts.values())
+
+
+def streaming(path):
+    return sum(1 for section_path, _ in iter_ini_sections(path) if section_path)
+
+
+def measure(run, path):
+    # Timed without tracing, which would dominate the run time
+    start = time.perf_counter()
+    count = run(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--hosts', type=int, default=50000)
+    arg_parser.add_argument('--keys', type=int, default=10)
+    args = arg_parser.parse_args()
+
+    with tempfile.NamedTemporaryFile('w', suffix='.ini', delete=False, encoding='utf-8') as file:
+        write_inventory(file, args.hosts, args.keys)
+    try:
+        print(f"inventory: {args.hosts} hosts, {os.path.getsize(file.name) / 2 ** 20:.1f} MB")
+        print(f"{'reader':>12} {'hosts':>8} {'seconds':>9} {'peak MB':>9}")
+        for name, run in (("parse_ini", whole_file), ("streaming", streaming)):
+            count, elapsed, peak = measure(run, file.name)
+            print(f"{name:>12} {count:>8} {elapsed:>9.3f} {peak / 2 ** 20:>9.2f}")
+    finally:
+        os.unlink(file.name)
+
+
+if __name__ == '__main__':
+    main()
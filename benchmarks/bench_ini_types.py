@@ -0,0 +1,77 @@
+"""INI value inference with and without a declared type map.
+
+Parses a generated service catalogue whose values mix numbers, booleans,
+addresses, versions, paths and lists, once with the default inference and
+once with an ``INIValueResolver`` that declares the type of every key.
+
+Usage:
+    python benchmarks/bench_ini_types.py [--services 20000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.parser_ini import parse_ini_string, INIValueResolver  # noqa: E402
+
+KEY_TYPES = {
+    "port": int,
+    "weight": float,
+    "enabled": bool,
+    "address": str,
+    "version": str,
+    "owner": str,
+    "path": str,
+    "released": str,
+    "tags": list,
+    "fallback": (str, type(None)),
+}
+
+
+def build_catalogue(service_count):
+    lines = []
+    for i in range(service_count):
+        lines.append(f"[service{i}]")
+        lines.append(f"port = {8000 + i % 1000}")
+        lines.append(f"weight = {i % 7}.5")
+        lines.append(f"enabled = {'true' if i % 3 else 'False'}")
+        lines.append(f"address = 10.0.{i // 256 % 256}.{i % 256}")
+        lines.append(f"version = 1.{i % 12}.{i % 5}")
+        lines.append(f"owner = team-{i % 40}")
+        lines.append(f"path = /srv/service{i}/bin")
+        lines.append(f"released = 2024-{i % 12 + 1:02d}-01")
+        lines.append(f"tags = web, tier{i % 3}")
+        lines.append("fallback = null")
+    return "\n".join(lines)
+
+
+def best_time(run, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--services', type=int, default=20000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    text = build_catalogue(args.services)
+    resolver = INIValueResolver({f"service{i}": KEY_TYPES for i in range(args.services)})
+
+    inferred = best_time(lambda: parse_ini_string(text), args.repeat)
+    declared = best_time(lambda: parse_ini_string(text, value_resolver=resolver), args.repeat)
+
+    print(f"{'mode':>9} {'seconds':>9}")
+    print(f"{'inferred':>9} {inferred:>9.3f}")
+    print(f"{'declared':>9} {declared:>9.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Scaling benchmark for ``parse_json_string``.
+
+Generates service-catalog style documents from 1 KB up to 50 MB and reports
+parse time and throughput for each size. With a linear parser the MB/s
+column stays roughly constant as the input grows.
+
+Usage:
+    python benchmarks/bench_json_parser.py [--max-size-mb 50] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.parser_json import parse_json_string  # noqa: E402
+
+SIZES_KB = [1, 10, 100, 1024, 5 * 1024, 10 * 1024, 50 * 1024]
+
+
+def build_service(index):
+    return (
+        '    {\n'
+        f'      "name": "service-{index}",\n'
+        f'      "host": "10.0.{index % 256}.{index % 200}",\n'
+        f'      "port": {8000 + index % 1000},\n'
+        '      "enabled": true,\n'
+        '      "weight": 0.75,\n'
+        '      "tags": ["prod", "eu-west", "tier-1"],\n'
+        '      "limits": {"cpu": 2.5, "memory": 4096, "burst": null},\n'
+        '      "description": "Service \\"catalog\\" entry \\u00e9"\n'
+        '    }'
+    )
+
+
+def build_document(target_bytes):
+    services = []
+    size = 0
+    index = 0
+    while size < target_bytes:
+        service = build_service(index)
+        services.append(service)
+        size += len(service) + 2
+        index += 1
+    return '{\n  "version": 1,\n  "services": [\n' + ',\n'.join(services) + '\n  ]\n}\n'
+
+
+def measure(text, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_json_string(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--max-size-mb', type=float, default=50)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'size':>10} {'seconds':>10} {'MB/s':>8} {'us/KB':>8}")
+    for size_kb in SIZES_KB:
+        if size_kb > args.max_size_mb * 1024:
+            break
+        text = build_document(size_kb * 1024)
+        repeat = args.repeat if size_kb <= 1024 else 1
+        elapsed = measure(text, repeat)
+        megabytes = len(text) / (1024 * 1024)
+        print(f"{size_kb:>8}KB {elapsed:>10.4f} {megabytes / elapsed:>8.2f} "
+              f"{elapsed * 1e6 / (len(text) / 1024):>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Memory saved by key interning on a corpus of same-shaped configs.
+
+Parses 10,000 per-tenant configs in every supported format, keeps the
+results alive, and reports the retained memory measured with tracemalloc,
+with and without ``intern_keys``.
+
+Usage:
+    python benchmarks/bench_key_interning.py [--count 10000]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.interning import KeyInterner  # noqa: E402
+from config_lib.parsers.parser_json import parse_json_string  # noqa: E402
+from config_lib.parsers.parser_yaml import parse_yaml_string  # noqa: E402
+from config_lib.parsers.parser_toml import parse_toml_string  # noqa: E402
+from config_lib.parsers.parser_ini import parse_ini_string  # noqa: E402
+
+
+def json_config(i):
+    return (
+        f'{{"database": {{"host": "db{i}.internal", "port": {5000 + i % 100}, "user": "tenant{i}", '
+        f'"password": "secret{i}", "is_active": true, "pool_size": {i % 20}}}, '
+        f'"logging": {{"level": "INFO", "output": "stdout", "log_rotation_interval": 24.0}}, '
+        f'"network": {{"timeout": 30, "retries": {i % 5}, "backoff_factor": 1.5}}}}'
+    )
+
+
+def yaml_config(i):
+    return (
+        f"database:\n  host: db{i}.internal\n  port: {5000 + i % 100}\n  user: tenant{i}\n"
+        f"  password: secret{i}\n  is_active: true\n  pool_size: {i % 20}\n"
+        f"logging:\n  level: INFO\n  output: stdout\n  log_rotation_interval: 24.0\n"
+        f"network:\n  timeout: 30\n  retries: {i % 5}\n  backoff_factor: 1.5\n"
+    )
+
+
+def toml_config(i):
+    return (
+        f'[database]\nhost = "db{i}.internal"\nport = {5000 + i % 100}\nuser = "tenant{i}"\n'
+        f'password = "secret{i}"\nis_active = true\npool_size = {i % 20}\n'
+        f'[logging]\nlevel = "INFO"\noutput = "stdout"\nlog_rotation_interval = 24.0\n'
+        f'[network]\ntimeout = 30\nretries = {i % 5}\nbackoff_factor = 1.5\n'
+    )
+
+
+def ini_config(i):
+    return (
+        f"[database]\nhost = db{i}.internal\nport = {5000 + i % 100}\nuser = tenant{i}\n"
+        f"password = secret{i}\nis_active = true\npool_size = {i % 20}\n"
+        f"[logging]\nlevel = INFO\noutput = stdout\nlog_rotation_interval = 24.0\n"
+        f"[network]\ntimeout = 30\nretries = {i % 5}\nbackoff_factor = 1.5\n"
+    )
+
+
+FORMATS = [
+    ("json", json_config, parse_json_string),
+    ("yaml", yaml_config, parse_yaml_string),
+    ("toml", toml_config, parse_toml_string),
+    ("ini", ini_config, parse_ini_string),
+]
+
+
+def retained_bytes(texts, parse, intern_keys):
+    gc.collect()
+    tracemalloc.start()
+    configs = [parse(text, intern_keys=intern_keys) for text in texts]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del configs
+    return current
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--count', type=int, default=10000)
+    args = arg_parser.parse_args()
+
+    print(f"{'format':>6} {'plain MB':>10} {'interned MB':>12} {'saved MB':>9} {'saved %':>8}")
+    for name, build, parse in FORMATS:
+        texts = [build(i) for i in range(args.count)]
+        plain = retained_bytes(texts, parse, None)
+        interned = retained_bytes(texts, parse, KeyInterner())
+        saved = plain - interned
+        print(f"{name:>6} {plain / 2 ** 20:>10.2f} {interned / 2 ** 20:>12.2f} "
+              f"{saved / 2 ** 20:>9.2f} {saved * 100 / plain:>7.1f}%")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Layered config merge with structural sharing versus a deep-copying merge.
+
+Merges a small environment overlay and a host overlay onto a large base
+config, once with ``merge_layers`` and once with a conventional merge that
+deep-copies every layer, reporting time per merge and the memory retained
+by one merged result.
+
+Usage:
+    python benchmarks/bench_layers.py [--services 20000] [--repeat 20]
+"""
+import argparse
+import copy
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.utils import merge_layers  # noqa: E402
+
+
+def deep_copy_merge(layers):
+    def merge(base, overlay):
+        result = copy.deepcopy(base)
+        for key, value in overlay.items():
+            if isinstance(result.get(key), dict) and isinstance(value, dict):
+                result[key] = merge(result[key], value)
+            else:
+                result[key] = copy.deepcopy(value)
+        return result
+
+    merged = {}
+    for layer in layers:
+        merged = merge(merged, layer)
+    return merged
+
+
+def build_layers(service_count):
+    base = {
+        "services": {
+            f"service{i}": {"host": f"svc{i}.internal", "port": 8000 + i % 1000,
+                            "replicas": [1, 2, 3], "limits": {"cpu": 2, "memory": "1Gi"}}
+            for i in range(service_count)
+        },
+        "logging": {"level": "INFO", "output": "stdout"},
+    }
+    env = {"logging": {"level": "WARNING"}, "services": {"service42": {"replicas": [4, 5]}}}
+    host = {"services": {"service7": {"limits": {"cpu": 8}}}}
+    return [base, env, host]
+
+
+def per_merge(merge, layers, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        merge(layers)
+    return (time.perf_counter() - start) / repeat
+
+
+def retained_bytes(merge, layers):
+    gc.collect()
+    tracemalloc.start()
+    merged = merge(layers)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del merged
+    return current
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--services', type=int, default=20000)
+    arg_parser.add_argument('--repeat', type=int, default=20)
+    args = arg_parser.parse_args()
+
+    layers = build_layers(args.services)
+    assert merge_layers(layers) == deep_copy_merge(layers)
+
+    print(f"{'merge':>12} {'ms/merge':>10} {'retained KB':>12}")
+    for name, merge in (("deep copy", deep_copy_merge), ("merge_layers", merge_layers)):
+        repeat = max(1, args.repeat // 10) if merge is deep_copy_merge else args.repeat
+        seconds = per_merge(merge, layers, repeat)
+        print(f"{name:>12} {seconds * 1000:>10.3f} {retained_bytes(merge, layers) / 1024:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
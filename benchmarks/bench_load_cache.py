@@ -0,0 +1,76 @@
+"""Repeated load_config calls with and without the parse cache.
+
+Writes one configuration file per format and loads each one ``--calls``
+times: uncached, through a copy-on-return ``ConfigCache`` and through a
+frozen one, reporting the mean time per call.
+
+Usage:
+    python benchmarks/bench_load_cache.py [--services 200] [--calls 2000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.loader import ConfigCache, load_config  # noqa: E402
+
+
+def build_files(directory, service_count):
+    json_items = ", ".join(
+        f'"service{i}": {{"host": "svc{i}.internal", "port": {8000 + i}, "enabled": true}}'
+        for i in range(service_count)
+    )
+    yaml_items = "".join(
+        f"service{i}:\n  host: svc{i}.internal\n  port: {8000 + i}\n  enabled: true\n"
+        for i in range(service_count)
+    )
+    toml_items = "".join(
+        f'[service{i}]\nhost = "svc{i}.internal"\nport = {8000 + i}\nenabled = true\n'
+        for i in range(service_count)
+    )
+    ini_items = "".join(
+        f"[service{i}]\nhost = svc{i}.internal\nport = {8000 + i}\nenabled = true\n"
+        for i in range(service_count)
+    )
+
+    paths = []
+    for extension, text in (("json", "{" + json_items + "}"), ("yaml", yaml_items),
+                            ("toml", toml_items), ("ini", ini_items)):
+        path = os.path.join(directory, f"app.{extension}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        # Deployed files are not freshly written; skip the racy-mtime checks
+        an_hour_ago = time.time() - 3600
+        os.utime(path, (an_hour_ago, an_hour_ago))
+        paths.append(path)
+    return paths
+
+
+def per_call(path, calls, cache):
+    start = time.perf_counter()
+    for _ in range(calls):
+        load_config(path, cache=cache)
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--services', type=int, default=200)
+    arg_parser.add_argument('--calls', type=int, default=2000)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'format':>6} {'uncached us':>12} {'copied us':>10} {'frozen us':>10}")
+        for path in build_files(directory, args.services):
+            uncached = per_call(path, args.calls, None)
+            copied = per_call(path, args.calls, ConfigCache())
+            frozen = per_call(path, args.calls, ConfigCache(frozen=True))
+            name = path.rsplit(".", 1)[1]
+            print(f"{name:>6} {uncached * 1e6:>12.1f} {copied * 1e6:>10.1f} {frozen * 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
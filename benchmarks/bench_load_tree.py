@@ -0,0 +1,68 @@
+"""Sequential load_config calls versus load_config_tree on a directory tree.
+
+Generates a tree of small configs in every format (3,000 files by default)
+and loads it once file by file and once with ``load_config_tree`` for each
+worker count, reporting the wall time and the slowest files.
+
+Usage:
+    python benchmarks/bench_load_tree.py [--files 3000] [--workers 1 2 4]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.loader import load_config, load_config_tree  # noqa: E402
+
+TEMPLATES = {
+    ".json": '{{"service": {{"name": "svc{i}", "port": {port}, "replicas": [1, 2, 3]}}, "enabled": true}}',
+    ".yaml": "service:\n  name: svc{i}\n  port: {port}\n  replicas:\n    - 1\n    - 2\nenabled: true\n",
+    ".toml": '[service]\nname = "svc{i}"\nport = {port}\nreplicas = [1, 2, 3]\n[flags]\nenabled = true\n',
+    ".ini": "[service]\nname = svc{i}\nport = {port}\nreplicas = 1, 2, 3\n[flags]\nenabled = true\n",
+}
+
+
+def build_tree(root, file_count):
+    extensions = list(TEMPLATES)
+    for i in range(file_count):
+        extension = extensions[i % len(extensions)]
+        directory = os.path.join(root, f"team{i % 30}", f"app{i % 7}")
+        os.makedirs(directory, exist_ok=True)
+        text = TEMPLATES[extension].format(i=i, port=8000 + i % 1000)
+        with open(os.path.join(directory, f"config{i}{extension}"), "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--files', type=int, default=3000)
+    arg_parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, args.files)
+        paths = [os.path.join(directory, name) for directory, _, names in os.walk(root) for name in names]
+
+        start = time.perf_counter()
+        for path in paths:
+            load_config(path)
+        print(f"{'sequential load_config':<28} {time.perf_counter() - start:>8.3f} s")
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            results = load_config_tree(root, workers=workers)
+            elapsed = time.perf_counter() - start
+            errors = sum(result.error is not None for result in results.values())
+            print(f"{f'load_config_tree workers={workers}':<28} {elapsed:>8.3f} s  ({errors} errors)")
+
+        slowest = sorted(results.items(), key=lambda item: -item[1].seconds)[:3]
+        print("slowest files:")
+        for path, result in slowest:
+            print(f"  {os.path.relpath(path, root)}: {result.seconds * 1000:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
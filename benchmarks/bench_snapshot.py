@@ -0,0 +1,86 @@
+"""Cold-start load time of config files versus their compiled snapshots.
+
+Writes the same service catalogue as YAML, TOML, INI and JSON, compiles each
+file with ``compile_snapshot`` and reports the time ``load_config`` takes
+for the source and for the ``.cfgc`` snapshot, each in a fresh interpreter
+so that import and first-call costs are included.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--services 20000] [--runs 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from config_lib.snapshot import compile_snapshot  # noqa: E402
+
+TIMED_LOAD = (
+    "import time; start = time.perf_counter(); "
+    "from config_lib.loader import load_config; "
+    "loaded = time.perf_counter(); load_config({path!r}); end = time.perf_counter(); "
+    "print(end - start, end - loaded)"
+)
+
+
+def write_sources(directory, service_count):
+    services = {f"service{i}": {"host": f"svc{i}.internal", "port": 8000 + i % 1000, "enabled": True}
+                for i in range(service_count)}
+    texts = {
+        "json": json.dumps({"services": services}),
+        "yaml": "services:\n" + "".join(
+            f"  {name}:\n    host: {s['host']}\n    port: {s['port']}\n    enabled: true\n"
+            for name, s in services.items()),
+        "toml": "".join(
+            f'[services.{name}]\nhost = "{s["host"]}"\nport = {s["port"]}\nenabled = true\n'
+            for name, s in services.items()),
+        "ini": "".join(
+            f"[services.{name}]\nhost = {s['host']}\nport = {s['port']}\nenabled = true\n"
+            for name, s in services.items()),
+    }
+    paths = []
+    for extension, text in texts.items():
+        path = os.path.join(directory, f"app.{extension}")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        paths.append(path)
+    return paths
+
+
+def cold_load(path, runs):
+    """Best ``(import and load, load only)`` seconds over fresh interpreters."""
+    times = []
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-c", TIMED_LOAD.format(path=path)],
+                                capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+        times.append(tuple(float(value) for value in result.stdout.split()))
+    return min(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--services', type=int, default=20000)
+    arg_parser.add_argument('--runs', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("milliseconds, import + first load_config (load_config alone)")
+        print(f"{'format':>6} {'source':>18} {'snapshot':>18} {'load speedup':>13}")
+        for path in write_sources(directory, args.services):
+            snapshot = os.path.join(directory, os.path.basename(path) + ".cfgc")
+            compile_snapshot(path, snapshot)
+            source_total, source_load = cold_load(path, args.runs)
+            snapshot_total, snapshot_load = cold_load(snapshot, args.runs)
+            name = path.rsplit(".", 1)[1]
+            print(f"{name:>6} {source_total * 1000:>9.1f} ({source_load * 1000:>6.1f}) "
+                  f"{snapshot_total * 1000:>9.1f} ({snapshot_load * 1000:>6.1f}) "
+                  f"{source_load / snapshot_load:>12.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Startup cost of lazy TOML loading when few tables are used.
+
+Builds a TOML document with 200 tables and compares a full
+``parse_toml_string`` with ``lazy=True`` followed by access to two tables,
+reporting time and the memory retained by the result (tracemalloc).
+
+Usage:
+    python benchmarks/bench_toml_lazy.py [--tables 200] [--keys 50]
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.parser_toml import parse_toml_string  # noqa: E402
+
+
+def build_document(table_count, key_count):
+    sections = []
+    for table in range(table_count):
+        lines = [f"[service_{table}]"]
+        lines.extend(f'option_{key} = "value-{table}-{key}"' for key in range(key_count))
+        lines.append(f"[service_{table}.limits]")
+        lines.append(f"cpu = {table % 8}\nports = [{', '.join(str(8000 + port) for port in range(10))}]")
+        sections.append('\n'.join(lines))
+    return '\n\n'.join(sections) + '\n'
+
+
+def full_load(text):
+    return parse_toml_string(text)
+
+
+def lazy_load(text):
+    config = parse_toml_string(text, lazy=True)
+    config['service_0']
+    config['service_1']
+    return config
+
+
+def measure(load, text):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    config = load(text)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del config
+    return elapsed, retained
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--tables', type=int, default=200)
+    arg_parser.add_argument('--keys', type=int, default=50)
+    args = arg_parser.parse_args()
+
+    text = build_document(args.tables, args.keys)
+    print(f"document: {args.tables} tables, {len(text) / 2 ** 20:.2f} MB")
+    print(f"{'mode':>22} {'seconds':>9} {'retained MB':>12}")
+    for name, load in (("full parse", full_load), ("lazy, 2 tables used", lazy_load)):
+        elapsed, retained = measure(load, text)
+        print(f"{name:>22} {elapsed:>9.4f} {retained / 2 ** 20:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
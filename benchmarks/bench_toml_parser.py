@@ -0,0 +1,62 @@
+"""Benchmark for ``parse_toml_string`` on long arrays.
+
+Parses documents holding one array of integers, one of strings and one of
+inline tables, with up to 100,000 elements each, as single-line and
+multi-line arrays. The elements/s column should stay roughly constant as
+the arrays grow.
+
+Usage:
+    python benchmarks/bench_toml_parser.py [--max-elements 100000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.parser_toml import parse_toml_string  # noqa: E402
+
+ELEMENT_COUNTS = [1000, 10000, 100000]
+
+ELEMENT_BUILDERS = {
+    'integers': lambda index: str(index),
+    'strings': lambda index: f'"host-{index}.example.com"',
+    'tables': lambda index: f'{{ id = {index}, weight = 0.5 }}',
+}
+
+
+def build_document(kind, count, multiline):
+    build = ELEMENT_BUILDERS[kind]
+    separator = ',\n    ' if multiline else ', '
+    return f"[data]\nvalues = [{separator.join(build(index) for index in range(count))}]\n"
+
+
+def best_time(text, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_toml_string(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--max-elements', type=int, default=100000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'elements':>9} {'layout':>10} {'count':>8} {'seconds':>9} {'elements/s':>12}")
+    for kind in ELEMENT_BUILDERS:
+        for multiline in (False, True):
+            for count in ELEMENT_COUNTS:
+                if count > args.max_elements:
+                    continue
+                elapsed = best_time(build_document(kind, count, multiline), args.repeat)
+                layout = 'multiline' if multiline else 'one line'
+                print(f"{kind:>9} {layout:>10} {count:>8} {elapsed:>9.4f} {count / elapsed:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Hot-reload benchmark for ``YAMLDocument.update``.
+
+Builds a YAML file of about 40,000 lines, changes a single value, and
+compares a full ``parse_yaml_string`` with an incremental update that
+re-parses only the edited top-level block.
+
+Usage:
+    python benchmarks/bench_yaml_incremental.py [--lines 40000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_yaml_parser import build_long_document  # noqa: E402
+from config_lib.parsers.parser_yaml import parse_yaml_string  # noqa: E402
+from config_lib.parsers.parser_yaml_incremental import YAMLDocument  # noqa: E402
+
+
+def best_time(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--lines', type=int, default=40000)
+    arg_parser.add_argument('--repeat', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    text = build_long_document(args.lines)
+    edits = [text.replace("port: 8500", f"port: {9000 + i}", 1) for i in range(args.repeat + 1)]
+    document = YAMLDocument(text)
+
+    full = best_time(lambda: parse_yaml_string(edits[0]), args.repeat)
+    edit_iter = iter(edits)
+    incremental = best_time(lambda: document.update(next(edit_iter)), args.repeat)
+
+    print(f"lines: {args.lines}, blocks re-parsed per edit: {document.reparsed_blocks}")
+    print(f"full parse:         {full:.4f} s")
+    print(f"incremental update: {incremental:.4f} s ({full / incremental:.1f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark for ``parse_yaml_string`` on deep and long documents.
+
+Parses a document nested 10 levels deep and flat documents of up to
+100,000 lines, reporting parse time and lines per second. The parser makes
+one pass over the lines, so the lines/s column should stay roughly constant
+as the document grows.
+
+Usage:
+    python benchmarks/bench_yaml_parser.py [--max-lines 100000] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config_lib.parsers.parser_yaml import parse_yaml_string  # noqa: E402
+
+LINE_COUNTS = [1000, 10000, 100000]
+
+
+def build_deep_document(depth, breadth):
+    lines = []
+
+    def emit(level, indent):
+        for index in range(breadth):
+            if level < depth:
+                lines.append(f"{indent}node{index}:")
+                emit(level + 1, indent + '  ')
+            else:
+                lines.append(f"{indent}value{index}: {index}")
+
+    emit(1, '')
+    return '\n'.join(lines)
+
+
+def build_long_document(line_count):
+    lines = []
+    index = 0
+    while len(lines) < line_count:
+        lines.extend([
+            f"service{index}:",
+            f"  host: 10.0.{index % 256}.{index % 200}",
+            f"  port: {8000 + index % 1000}",
+            "  enabled: true",
+            "  weight: 0.75",
+            "  tags:",
+            "    - prod",
+            "    - eu-west",
+            "  limits:",
+            "    cpu: 2.5",
+            "    memory: 4096",
+        ])
+        index += 1
+    return '\n'.join(lines[:line_count])
+
+
+def best_time(text, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_yaml_string(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def report(name, text, repeat):
+    line_count = text.count('\n') + 1
+    elapsed = best_time(text, repeat)
+    print(f"{name:>14} {line_count:>9} {elapsed:>10.4f} {line_count / elapsed:>12.0f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument('--max-lines', type=int, default=100000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    print(f"{'document':>14} {'lines':>9} {'seconds':>10} {'lines/s':>12}")
+    report('deep (10)', build_deep_document(depth=10, breadth=3), args.repeat)
+    for line_count in LINE_COUNTS:
+        if line_count <= args.max_lines:
+            report('flat', build_long_document(line_count), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
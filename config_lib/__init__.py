@@ -1,12 +1,27 @@
 from .loader import load_config
 from .schema import ConfigSchema
 from .validator import ConfigValidator
-from .utils import fill_defaults, mask_secrets
-from .db import MongoDBHandler
+from .utils import fill_defaults, mask_secrets, merge_layers
 from .writer import save_config_to_file
 import os
 
 
+# Imported on first use: pymongo is an optional extra and asyncio is slow to import
+_LAZY_NAMES = {
+    "MongoDBHandler": ".db",
+    "AsyncConfigManager": ".async_loader",
+    "load_config_async": ".async_loader",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(module_name, __name__), name)
+
+
 class ConfigManager:
     def __init__(self, file_path=None, custom_schema=None):
         self.schema = custom_schema or ConfigSchema().get_schema()
@@ -22,6 +37,31 @@ class ConfigManager:
             except Exception as exc:
                 raise RuntimeError(f"Parse error from {file_path}: {exc}") from exc
 
+    @classmethod
+    def from_layers(cls, layers, custom_schema=None, list_strategy="replace"):
+        """Create a manager whose config is ``layers`` merged in order.
+
+        Each layer is a config file path or an already loaded dict, such as
+        ``["base.yaml", "prod.yaml", "host.yaml"]``. See ``merge_layers`` for
+        how values and lists are merged; unchanged subtrees are shared
+        rather than copied.
+        """
+        configs = []
+        for layer in layers:
+            if isinstance(layer, dict):
+                configs.append(layer)
+                continue
+            if not os.path.isfile(layer):
+                raise FileNotFoundError(f"File not found: {layer}")
+            try:
+                configs.append(load_config(layer))
+            except Exception as exc:
+                raise RuntimeError(f"Parse error from {layer}: {exc}") from exc
+
+        manager = cls(custom_schema=custom_schema)
+        manager.config = merge_layers(configs, list_strategy)
+        return manager
+
     def validate(self):
         if self.config is None:
             raise ValueError("Loaded configuration is None. Check the config file.")
@@ -50,6 +90,7 @@ class ConfigManager:
             print("Error: No configuration loaded to save")
             return
 
+        from .db import MongoDBHandler
         try:
             db_handler = MongoDBHandler(mongo_uri, db_name, collection_name)
             db_handler.save_config(name, self.config)
@@ -57,6 +98,7 @@ class ConfigManager:
             print(f"Error saving configuration: {e}")
 
     def load_from_db(self, name, mongo_uri, db_name, collection_name="configs"):
+        from .db import MongoDBHandler
         try:
             db_handler = MongoDBHandler(mongo_uri, db_name, collection_name)
             self.config = db_handler.load_config(name)
@@ -64,6 +106,7 @@ class ConfigManager:
             print(f"Error loading configuration: {e}")
 
     def delete_from_db(self, name, mongo_uri, db_name, collection_name="configs"):
+        from .db import MongoDBHandler
         try:
             db_handler = MongoDBHandler(mongo_uri, db_name, collection_name)
             db_handler.delete_config(name)
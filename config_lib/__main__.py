@@ -0,0 +1,34 @@
+"""Command line interface of config_lib.
+
+Usage:
+    python -m config_lib compile app.yaml [-o app.cfgc] [--validate]
+"""
+import argparse
+import sys
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(prog="python -m config_lib", description="config_lib tools")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = commands.add_parser(
+        "compile", help="write a parsed config file as a binary snapshot for fast loading"
+    )
+    compile_parser.add_argument("source", help="config file to compile")
+    compile_parser.add_argument("-o", "--output", help="snapshot path (default: the source path with .cfgc)")
+    compile_parser.add_argument("--validate", action="store_true",
+                                help="validate the config against the default schema first")
+
+    args = arg_parser.parse_args(argv)
+
+    from .snapshot import compile_snapshot
+    try:
+        compile_snapshot(args.source, args.output, validate=args.validate)
+    except Exception as exc:
+        print(f"Failed to compile {args.source}: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import asyncio
+import os
+import weakref
+from functools import partial
+
+from . import ConfigManager
+from .loader import load_config, _cache_options, _copy_config
+
+# Loads in progress, per event loop: {(path, load options): [future, waiter count]}
+_in_flight = weakref.WeakKeyDictionary()
+
+
+async def load_config_async(file_path, select=None, intern_keys=None, all_documents=False, lazy=False,
+                            file_format=None, executor=None):
+    """Run ``load_config`` on ``executor`` without blocking the event loop.
+
+    ``executor`` defaults to the loop's default thread pool. Parsing in a
+    thread lets the loop run between Python-level parsing steps, but the C
+    JSON decoder holds the GIL for a whole document; a
+    ``ProcessPoolExecutor`` avoids that at the cost of pickling the result
+    back. Concurrent calls for the same path and options share one load;
+    when they do, every caller, the first included, gets its own copy of
+    the result, so no caller sees another's changes. Cancelling one caller
+    does not cancel the shared load.
+    """
+    loop = asyncio.get_running_loop()
+    key = (os.path.abspath(file_path), _cache_options(select, intern_keys, all_documents, lazy, file_format))
+    pending = _in_flight.setdefault(loop, {})
+
+    entry = pending.get(key)
+    if entry is None:
+        load = partial(load_config, file_path, select=select, intern_keys=intern_keys,
+                       all_documents=all_documents, lazy=lazy, file_format=file_format)
+        future = loop.run_in_executor(executor, load)
+        entry = pending[key] = [future, 0]
+        future.add_done_callback(partial(_forget, pending, key))
+    entry[1] += 1
+
+    # _forget runs before any waiter resumes, so the count is final by then
+    config = await asyncio.shield(entry[0])
+    return config if entry[1] == 1 else _copy_config(config)
+
+
+def _forget(pending, key, future):
+    entry = pending.get(key)
+    if entry is not None and entry[0] is future:
+        del pending[key]
+
+
+class AsyncConfigManager(ConfigManager):
+    """ConfigManager for asyncio code: files are read and parsed on an executor.
+
+    The constructor does not load anything; use
+    ``await AsyncConfigManager.from_file(path)`` or ``await manager.load()``.
+    """
+
+    def __init__(self, file_path=None, custom_schema=None, executor=None):
+        super().__init__(custom_schema=custom_schema)
+        self.file_path = file_path
+        self.executor = executor
+
+    @classmethod
+    async def from_file(cls, file_path, custom_schema=None, executor=None):
+        manager = cls(file_path, custom_schema=custom_schema, executor=executor)
+        await manager.load()
+        return manager
+
+    async def load(self, file_path=None):
+        file_path = file_path or self.file_path
+        loop = asyncio.get_running_loop()
+        if not await loop.run_in_executor(self.executor, os.path.isfile, file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        try:
+            self.config = await load_config_async(file_path, executor=self.executor)
+        except Exception as exc:
+            raise RuntimeError(f"Parse error from {file_path}: {exc}") from exc
+
+        self.file_path = file_path
+        return self.config
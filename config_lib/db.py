@@ -1,4 +1,9 @@
-from pymongo import MongoClient, errors
+try:
+    from pymongo import MongoClient, errors
+except ImportError as exc:
+    raise ImportError(
+        "MongoDB support requires pymongo; install it with: pip install 'config_lib[mongodb]'"
+    ) from exc
 
 
 class MongoDBHandler:
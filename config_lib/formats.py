@@ -0,0 +1,253 @@
+import json
+import os
+import re
+from importlib import import_module
+
+# How much of an extensionless file is read to guess its format
+SNIFF_SIZE = 4096
+
+
+class ConfigFormat:
+    """A configuration format known to ``load_config`` and ``save_config_to_file``.
+
+    ``parser``, ``writer`` and ``documents_reader`` are ``"module:function"``
+    references that are imported on first use, so registering a format costs
+    nothing until a file of that format is read or written. ``parser`` takes
+    a file path; ``writer`` takes a config and returns its text (or a list of
+    lines); ``documents_reader`` iterates over the documents of a
+    multi-document file. ``options`` names the ``load_config`` arguments the
+    parser accepts besides ``intern_keys``. ``sniffer`` is called with the
+    first bytes of a file whose extension is not registered.
+    """
+
+    def __init__(self, name, extensions=(), parser=None, writer=None, sniffer=None,
+                 documents_reader=None, options=()):
+        self.name = name
+        self.extensions = tuple(extension.lower() for extension in extensions)
+        self.parser = parser
+        self.writer = writer
+        self.sniffer = sniffer
+        self.documents_reader = documents_reader
+        self.options = frozenset(options)
+        self._resolved = {}
+
+    def __repr__(self):
+        return f"ConfigFormat({self.name!r}, extensions={self.extensions!r})"
+
+    def get_parser(self):
+        return self._resolve('parser')
+
+    def get_writer(self):
+        return self._resolve('writer')
+
+    def get_documents_reader(self):
+        return self._resolve('documents_reader')
+
+    def _resolve(self, role):
+        function = self._resolved.get(role)
+        if function is None:
+            reference = getattr(self, role)
+            if reference is None:
+                raise ValueError(f"Format {self.name} has no {role.replace('_', ' ')}")
+            function = _import_reference(reference) if isinstance(reference, str) else reference
+            self._resolved[role] = function
+        return function
+
+
+_FORMATS = {}
+_EXTENSIONS = {}
+
+
+def register_format(config_format):
+    """Add a format to the registry, replacing any format of the same name."""
+    previous = _FORMATS.pop(config_format.name, None)
+    if previous is not None:
+        for extension in previous.extensions:
+            _EXTENSIONS.pop(extension, None)
+
+    _FORMATS[config_format.name] = config_format
+    for extension in config_format.extensions:
+        _EXTENSIONS[extension] = config_format
+    return config_format
+
+
+def get_format(name):
+    try:
+        return _FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown config format: {name}") from None
+
+
+def format_for_extension(file_path):
+    """Return the format registered for the file's extension, or None."""
+    return _EXTENSIONS.get(os.path.splitext(file_path)[1].lower())
+
+
+def detect_format(file_path):
+    """Choose the format of a file by its extension, or by its content.
+
+    Files whose extension is not registered (``/etc/app/config``) are
+    recognised by the sniffers of the registered formats, tried in
+    registration order. A file whose format cannot be detected, because
+    its content matches no format or it cannot be read, raises ValueError.
+    """
+    config_format = format_for_extension(file_path)
+    if config_format is not None:
+        return config_format
+
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(SNIFF_SIZE)
+    except OSError as exc:
+        raise ValueError(f"Unsupported file format: cannot read {file_path}: {exc}") from exc
+
+    config_format = sniff_format(head)
+    if config_format is None:
+        raise ValueError("Unsupported file format")
+    return config_format
+
+
+def sniff_format(head):
+    for config_format in _FORMATS.values():
+        if config_format.sniffer is not None and config_format.sniffer(head):
+            return config_format
+    return None
+
+
+def _import_reference(reference):
+    module_name, _, attribute = reference.partition(':')
+    return getattr(import_module(module_name), attribute)
+
+
+def _significant_lines(head):
+    # Decoded lines of the sniffed bytes, without blank lines and comments.
+    # The last line may be cut off at SNIFF_SIZE, so it is dropped when
+    # there are others.
+    text = head.decode('utf-8', errors='replace').lstrip('\ufeff')
+    lines = text.splitlines()
+    if len(lines) > 1 and not text.endswith(('\n', '\r')):
+        lines.pop()
+    return [line.strip() for line in lines
+            if line.strip() and not line.lstrip().startswith(('#', ';'))]
+
+
+_TOML_VALUE = re.compile(
+    r"""(?:
+        "(?:[^"\\]|\\.)*" | '[^']*'                      # strings
+        | \[.* | \{.*                                      # arrays and inline tables
+        | true | false | [+-]?(?:inf|nan)
+        | 0x[0-9A-Fa-f_]+ | 0o[0-7_]+ | 0b[01_]+
+        | [+-]?\d[\d_]*(?:\.\d[\d_]*)?(?:[eE][+-]?\d[\d_]*)?
+        | \d{4}-\d{2}-\d{2}(?:[Tt\ ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:[Zz]|[+-]\d{2}:\d{2})?)?
+        | \d{2}:\d{2}:\d{2}(?:\.\d+)?
+    )\s*(?:\#.*)?""",
+    re.VERBOSE,
+)
+_KEY_VALUE = re.compile(r'([^=\[\]{}#;]+?)\s*=\s*(.*)')
+_HEADER = re.compile(r'\[\[?[^\[\]]+\]\]?(?:\s*#.*)?')
+_YAML_LINE = re.compile(r'(?:-(?:\s|$)|[^\s=:#\[\]{}][^=]*?:(?:\s|$))')
+
+
+def _sniff_json(head):
+    lines = _significant_lines(head)
+    if not lines:
+        return False
+    first = lines[0]
+    if first.startswith('{'):
+        return True
+    # "[section]" headers start TOML and INI files too, even with no keys,
+    # while a one-line array such as "[1, 2]" looks like a header
+    return first.startswith('[') and not _is_section_header(first)
+
+
+def _sniff_yaml(head):
+    lines = _significant_lines(head)
+    if not lines:
+        return False
+    return lines[0].startswith(('---', '%YAML')) or bool(_YAML_LINE.match(lines[0]))
+
+
+def _sniff_toml(head):
+    lines = _significant_lines(head)
+    if any(line.startswith('[[') for line in lines):
+        return True
+    values = _key_value_pairs(lines)
+    # Bare text values are INI, not TOML
+    return bool(values) and all(_TOML_VALUE.fullmatch(value) for value in values)
+
+
+def _sniff_ini(head):
+    lines = _significant_lines(head)
+    # Sections without keys load as empty sections
+    return bool(_key_value_pairs(lines)) or (bool(lines) and all(_HEADER.fullmatch(line) for line in lines))
+
+
+def _is_section_header(line):
+    if not _HEADER.fullmatch(line):
+        return False
+    try:
+        json.loads(line)
+    except ValueError:
+        return True
+    return False
+
+
+def _key_value_pairs(lines):
+    # The values of a file made only of "[section]" headers and "key = value"
+    # lines (TOML arrays may continue over several lines), or None.
+    values = []
+    depth = 0
+    for line in lines:
+        if depth > 0:
+            depth += line.count('[') - line.count(']')
+            continue
+        if _HEADER.fullmatch(line):
+            continue
+        match = _KEY_VALUE.fullmatch(line)
+        if not match:
+            return None
+        value = match.group(2)
+        values.append(value)
+        if value.startswith('['):
+            depth = value.count('[') - value.count(']')
+    return values or None
+
+
+def _sniff_snapshot(head):
+    # config_lib.snapshot.MAGIC, repeated here to avoid importing the module
+    return head.startswith(b'CFGC')
+
+
+# Sniffers run in this order: TOML before INI, whose files it also matches
+register_format(ConfigFormat(
+    'snapshot', ('.cfgc',),
+    parser='config_lib.snapshot:load_snapshot',
+    sniffer=_sniff_snapshot,
+))
+register_format(ConfigFormat(
+    'json', ('.json',),
+    parser='config_lib.parser:parse_json',
+    writer='config_lib.writers.writer_json:serialize_json',
+    sniffer=_sniff_json,
+    options=('select',),
+))
+register_format(ConfigFormat(
+    'yaml', ('.yaml', '.yml'),
+    parser='config_lib.parser:parse_yaml',
+    writer='config_lib.writers.writer_yaml:serialize_yaml',
+    sniffer=_sniff_yaml,
+    documents_reader='config_lib.parser:iter_yaml_documents',
+))
+register_format(ConfigFormat(
+    'toml', ('.toml',),
+    parser='config_lib.parser:parse_toml',
+    writer='config_lib.writers.writer_toml:serialize_toml',
+    sniffer=_sniff_toml,
+    options=('lazy',),
+))
+register_format(ConfigFormat(
+    'ini', ('.ini',),
+    parser='config_lib.parser:parse_ini',
+    writer='config_lib.writers.writer_ini:serialize_ini',
+    sniffer=_sniff_ini,
+))
@@ -1,16 +1,300 @@
-from .parser import parse_json, parse_yaml, parse_toml, parse_ini
+import copy
+import hashlib
+import os
+import threading
+from pathlib import Path
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from time import perf_counter, time_ns
+from types import MappingProxyType
 
+from .formats import detect_format, format_for_extension, get_format
+from .parsers.selection import build_selection, apply_selection
 
-def load_config(file_path):
-    if file_path.endswith(".json"):
-        config = parse_json(file_path)
-    elif file_path.endswith(".yaml") or file_path.endswith(".yml"):
-        config = parse_yaml(file_path)
-    elif file_path.endswith(".toml"):
-        config = parse_toml(file_path)
-    elif file_path.endswith(".ini"):
-        config = parse_ini(file_path)
-    else:
-        raise ValueError(f"Unsupported file format")
 
+def load_config(file_path, select=None, intern_keys=None, all_documents=False, lazy=False, cache=None,
+                file_format=None):
+    if cache is not None and cache is not False:
+        # True selects the process-wide default_config_cache
+        if cache is True:
+            cache = default_config_cache
+        return cache.load(file_path, select=select, intern_keys=intern_keys,
+                          all_documents=all_documents, lazy=lazy, file_format=file_format)
+
+    # Chosen by name, by extension, or for unknown extensions by content
+    config_format = get_format(file_format) if file_format is not None else detect_format(file_path)
+
+    if all_documents:
+        return _load_all_documents(file_path, config_format, select, intern_keys)
+
+    options = {}
+    if 'lazy' in config_format.options:
+        # Lazy TOML tables are parsed on first access, or when selected
+        options['lazy'] = lazy
+    if 'select' in config_format.options:
+        # JSON skips unselected subtrees while scanning
+        return config_format.get_parser()(file_path, select=select, intern_keys=intern_keys, **options)
+
+    config = config_format.get_parser()(file_path, intern_keys=intern_keys, **options)
+
+    if select is not None:
+        config = apply_selection(config, build_selection(select))
+
+    return config
+
+
+def _load_all_documents(file_path, config_format, select, intern_keys):
+    # Formats without a documents reader hold exactly one document per file
+    if config_format.documents_reader is None:
+        return [load_config(file_path, select=select, intern_keys=intern_keys, file_format=config_format.name)]
+
+    documents = config_format.get_documents_reader()(file_path, intern_keys=intern_keys)
+    if select is None:
+        return list(documents)
+
+    selection = build_selection(select)
+    return [apply_selection(document, selection) for document in documents]
+
+
+TreeLoadResult = namedtuple('TreeLoadResult', ['config', 'error', 'seconds'])
+
+
+def load_config_tree(root, pattern=None, workers=None, **options):
+    """Load every config file under ``root`` into ``{path: TreeLoadResult}``.
+
+    ``pattern`` is a glob relative to ``root`` (such as ``"**/*.yaml"``);
+    by default every file with the extension of a registered text format
+    (one with a writer) is loaded, so compiled ``.cfgc`` snapshots are left
+    out of the tree: they would repeat their sources. The files
+    are parsed on a process pool of ``workers`` processes (default: one per
+    CPU; 0 or 1 loads them in this process), with ``options`` passed on to
+    ``load_config``. A file that fails to load does not stop the others: its
+    result has ``config=None`` and the error as ``"ExceptionType: message"``.
+    ``seconds`` is the time spent reading and parsing the file.
+    """
+    paths = _find_config_files(root, pattern)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(paths) <= 1:
+        return {path: _load_tree_file(path, options) for path in paths}
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Many small files: hand them out in chunks to keep the IPC overhead low
+    chunk_size = max(1, len(paths) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_load_tree_file, paths, [options] * len(paths), chunksize=chunk_size)
+        return dict(zip(paths, results))
+
+
+def _find_config_files(root, pattern):
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"Directory not found: {root}")
+
+    if pattern is not None:
+        return sorted(str(path) for path in Path(root).glob(pattern) if path.is_file())
+
+    return sorted(
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(root)
+        for name in names
+        if _is_text_config_file(name)
+    )
+
+
+def _is_text_config_file(name):
+    config_format = format_for_extension(name)
+    return config_format is not None and config_format.writer is not None
+
+
+def _load_tree_file(path, options):
+    # Runs in worker processes: errors are returned as text, since not every
+    # parser exception survives pickling.
+    start = perf_counter()
+    try:
+        config = load_config(path, **options)
+    except Exception as exc:
+        return TreeLoadResult(None, f"{type(exc).__name__}: {exc}", perf_counter() - start)
+    return TreeLoadResult(config, None, perf_counter() - start)
+
+
+DEFAULT_CACHE_SIZE = 128
+
+# Files modified this recently may be rewritten again without their mtime
+# changing, so their cached entries are confirmed by content hash.
+_RACY_WINDOW_NS = 2_000_000_000
+
+ConfigCacheStats = namedtuple(
+    'ConfigCacheStats', ['hits', 'content_hits', 'misses', 'evictions', 'maxsize', 'currsize']
+)
+
+
+class _CacheEntry:
+    __slots__ = ('fingerprint', 'digest', 'config', 'racy')
+
+    def __init__(self, fingerprint, digest, config, racy):
+        self.fingerprint = fingerprint
+        self.digest = digest
+        self.config = config
+        self.racy = racy
+
+
+class ConfigCache:
+    """LRU cache of parsed configuration files for ``load_config``.
+
+    An entry is reused while the file's ``(inode, size, mtime_ns)`` is
+    unchanged. When the stat fingerprint differs, or the file was modified
+    too recently for its mtime to be trusted, the content hash decides
+    instead, so touching or re-deploying an identical file does not cause a
+    re-parse. At most ``max_entries`` results are kept, per path and load
+    options.
+
+    Each call returns a deep copy of the cached result, so callers may modify
+    it freely. With ``frozen=True`` every call shares one read-only result:
+    mappings become ``MappingProxyType`` and lists become tuples.
+
+    Loads with ``lazy=True`` bypass the cache: copying or freezing a lazy
+    TOML document would parse every table and defeat the laziness.
+    """
+
+    def __init__(self, max_entries=DEFAULT_CACHE_SIZE, frozen=False):
+        self.max_entries = max_entries
+        self.frozen = frozen
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._content_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def load(self, file_path, select=None, intern_keys=None, all_documents=False, lazy=False,
+             file_format=None):
+        if lazy:
+            return load_config(file_path, select=select, intern_keys=intern_keys,
+                               all_documents=all_documents, lazy=lazy, file_format=file_format)
+
+        path = os.path.abspath(file_path)
+        options = _cache_options(select, intern_keys, all_documents, lazy, file_format)
+
+        def parse():
+            return load_config(path, select=select, intern_keys=intern_keys,
+                               all_documents=all_documents, lazy=lazy, file_format=file_format)
+
+        try:
+            fingerprint = _stat_fingerprint(path)
+        except OSError:
+            # Let the parser report the missing or unreadable file
+            self.invalidate(path)
+            return parse()
+
+        key = (path, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            hit = entry is not None and entry.fingerprint == fingerprint and not entry.racy
+            if entry is not None:
+                self._entries.move_to_end(key)
+            if hit:
+                self._hits += 1
+        if hit:
+            return self._result(entry.config)
+
+        digest = _file_digest(path)
+        if entry is not None and entry.digest == digest:
+            with self._lock:
+                entry.fingerprint = fingerprint
+                entry.racy = _is_racy(fingerprint)
+                self._content_hits += 1
+            return self._result(entry.config)
+
+        config = parse()
+        if self.frozen:
+            config = freeze_config(config)
+
+        # Only keep the result if the file did not change (or vanish) while
+        # it was parsed
+        try:
+            unchanged = _stat_fingerprint(path) == fingerprint
+        except OSError:
+            unchanged = False
+        if unchanged:
+            self._store(key, _CacheEntry(fingerprint, digest, config, _is_racy(fingerprint)))
+        with self._lock:
+            self._misses += 1
+        return self._result(config)
+
+    def invalidate(self, file_path=None):
+        """Drop the cached results of one file, or of every file."""
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                return
+            path = os.path.abspath(file_path)
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            return ConfigCacheStats(self._hits, self._content_hits, self._misses, self._evictions,
+                                    self.max_entries, len(self._entries))
+
+    def _store(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def _result(self, config):
+        return config if self.frozen else _copy_config(config)
+
+
+default_config_cache = ConfigCache()
+
+
+def freeze_config(config):
+    """Return a read-only copy of a parsed configuration tree."""
+    if isinstance(config, Mapping):
+        return MappingProxyType({key: freeze_config(value) for key, value in config.items()})
+    if isinstance(config, list):
+        return tuple(freeze_config(item) for item in config)
     return config
+
+
+# Scalars the parsers produce that can be shared between copies
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None), datetime, date, time)
+
+
+def _copy_config(config):
+    # Much cheaper than copy.deepcopy for plain parsed trees: only the
+    # containers are rebuilt, scalars are shared.
+    if type(config) is dict:
+        return {key: value if type(value) in _IMMUTABLE_TYPES else _copy_config(value)
+                for key, value in config.items()}
+    if type(config) is list:
+        return [item if type(item) in _IMMUTABLE_TYPES else _copy_config(item) for item in config]
+    if type(config) in _IMMUTABLE_TYPES:
+        return config
+    return copy.deepcopy(config)
+
+
+def _cache_options(select, intern_keys, all_documents, lazy, file_format):
+    if select is not None:
+        select = tuple(path if isinstance(path, str) else tuple(path) for path in select)
+    return select, intern_keys, all_documents, lazy, file_format
+
+
+def _stat_fingerprint(path):
+    st = os.stat(path)
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+def _is_racy(fingerprint):
+    return time_ns() - fingerprint[2] < _RACY_WINDOW_NS
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'blake2b').digest()
@@ -1,48 +1,238 @@
-from .parsers.parser_json import parse_json_string, JSONSyntaxError
-from .parsers.parser_yaml import parse_yaml_string, YAMLSyntaxError
-from .parsers.parser_toml import parse_toml_string, TOMLSyntaxError
-from .parsers.parser_ini import parse_ini_string, INISyntaxError
+import os
+from collections import deque
+from importlib import import_module
 
+from .parsers.reading import iter_file_blocks, read_text, split_block_lines
+from .parsers.selection import build_selection, apply_selection
+
+# The parser modules are imported by the functions that use them, so that
+# reading one format never loads the code of the others.
+_LAZY_NAMES = {
+    'parse_json_string': '.parsers.parser_json',
+    'parse_json_with_engine': '.parsers.parser_json',
+    'JSONSyntaxError': '.parsers.parser_json',
+    'parse_json_stream': '.parsers.parser_json_stream',
+    'parse_yaml_string': '.parsers.parser_yaml',
+    'parse_yaml_lines': '.parsers.parser_yaml',
+    'parse_yaml_documents': '.parsers.parser_yaml',
+    'YAMLSyntaxError': '.parsers.parser_yaml',
+    'parse_toml_string': '.parsers.parser_toml',
+    'TOMLSyntaxError': '.parsers.parser_toml',
+    'parse_ini_string': '.parsers.parser_ini',
+    'parse_ini_bytes': '.parsers.parser_ini',
+    'parse_ini_blocks': '.parsers.parser_ini',
+    'parse_ini_sections': '.parsers.parser_ini',
+    'INISyntaxError': '.parsers.parser_ini',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __package__), name)
+
+
+def parse_json(file_path, block_size=None, select=None, intern_keys=None, engine='auto'):
+    from .parsers.parser_json import parse_json_with_engine, JSONSyntaxError
 
-def parse_json(file_path):
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return parse_json_string(content)
+        if block_size:
+            from .parsers.parser_json_stream import parse_json_stream
+            with open(file_path, 'r', encoding='utf-8') as f:
+                config = parse_json_stream(iter(lambda: f.read(block_size), ''), intern_keys=intern_keys)
+            return apply_selection(config, build_selection(select)) if select is not None else config
+        content = read_text(file_path)
+        return parse_json_with_engine(content, engine, select=select, intern_keys=intern_keys)
     except JSONSyntaxError as e:
         raise e
     except Exception as exc:
         raise RuntimeError(f"Error reading JSON: {exc}") from exc
 
 
-def parse_yaml(file_path):
+def load_json_lines(file_path, workers=None, batch_size=1000, ordered=True, max_pending_batches=None,
+                    engine='auto'):
+    """Iterate over ``(line_number, config)`` pairs of a JSON Lines file.
+
+    Lines are read lazily and parsed in batches of ``batch_size``. With
+    ``workers`` > 1 the batches are parsed on a process pool, and at most
+    ``max_pending_batches`` (default ``2 * workers``) of them are in flight, so
+    memory does not grow with the file size. With ``ordered=False`` results
+    are yielded as soon as their batch is done. A malformed record raises
+    JSONSyntaxError carrying the record's line number in the file. ``engine``
+    is one of JSON_ENGINES, as for ``parse_json``.
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return parse_yaml_string(content)
+            batches = _read_json_lines_batches(f, batch_size)
+
+            if not workers or workers <= 1:
+                for batch in batches:
+                    yield from _unpack_json_lines_results(_parse_json_lines_batch(batch, engine))
+                return
+
+            yield from _load_json_lines_parallel(batches, workers, ordered,
+                                                 max_pending_batches or 2 * workers, engine)
+    except (OSError, UnicodeDecodeError) as exc:
+        raise RuntimeError(f"Error reading JSON Lines: {exc}") from exc
+
+
+def _read_json_lines_batches(f, batch_size):
+    batch = []
+
+    for line_number, line in enumerate(f, 1):
+        if line.isspace():
+            continue
+        batch.append((line_number, line))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _parse_json_lines_batch(batch, engine):
+    # Runs in worker processes: errors are returned rather than raised so they
+    # cross the process boundary as plain data.
+    from .parsers.parser_json import parse_json_with_engine, JSONSyntaxError
+
+    results = []
+
+    for line_number, line in batch:
+        try:
+            results.append((line_number, parse_json_with_engine(line, engine), None))
+        except JSONSyntaxError as exc:
+            results.append((line_number, None, (exc.message, exc.column)))
+            break
+
+    return results
+
+
+def _unpack_json_lines_results(results):
+    from .parsers.parser_json import JSONSyntaxError
+
+    for line_number, config, error in results:
+        if error is not None:
+            message, column = error
+            raise JSONSyntaxError(message, line_number, column)
+        yield line_number, config
+
+
+def _load_json_lines_parallel(batches, workers, ordered, max_pending_batches, engine):
+    from concurrent.futures import ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        if ordered:
+            pending = deque()
+            for batch in batches:
+                pending.append(executor.submit(_parse_json_lines_batch, batch, engine))
+                if len(pending) >= max_pending_batches:
+                    yield from _unpack_json_lines_results(pending.popleft().result())
+            while pending:
+                yield from _unpack_json_lines_results(pending.popleft().result())
+        else:
+            pending = set()
+            for batch in batches:
+                pending.add(executor.submit(_parse_json_lines_batch, batch, engine))
+                if len(pending) >= max_pending_batches:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from _unpack_json_lines_results(future.result())
+            for future in as_completed(pending):
+                yield from _unpack_json_lines_results(future.result())
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parse_yaml(file_path, intern_keys=None, scalar_resolver=None, copy_aliases=False):
+    from .parsers.parser_yaml import parse_yaml_lines, YAMLSyntaxError
+
+    try:
+        # Lines are read and decoded a block at a time
+        lines = split_block_lines(iter_file_blocks(file_path), decode=True)
+        return parse_yaml_lines(lines, intern_keys=intern_keys, scalar_resolver=scalar_resolver,
+                                copy_aliases=copy_aliases)
     except YAMLSyntaxError as e:
         raise e
     except Exception as exc:
         raise RuntimeError(f"Error reading YAML: {exc}") from exc
 
 
-def parse_toml(file_path):
+def iter_yaml_documents(file_or_path, intern_keys=None, scalar_resolver=None, copy_aliases=False):
+    """Iterate over the documents of a multi-document YAML file.
+
+    ``file_or_path`` is a path or an open text file. Lines are read lazily and
+    each document is yielded as soon as its ``---`` terminator is reached.
+    """
+    from .parsers.parser_yaml import parse_yaml_documents
+
+    if not isinstance(file_or_path, (str, os.PathLike)):
+        yield from parse_yaml_documents(file_or_path, intern_keys=intern_keys, scalar_resolver=scalar_resolver,
+                                        copy_aliases=copy_aliases)
+        return
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return parse_toml_string(content)
+        with open(file_or_path, 'r', encoding='utf-8') as f:
+            yield from parse_yaml_documents(f, intern_keys=intern_keys, scalar_resolver=scalar_resolver,
+                                            copy_aliases=copy_aliases)
+    except OSError as exc:
+        raise RuntimeError(f"Error reading YAML: {exc}") from exc
+
+
+def parse_toml(file_path, intern_keys=None, parse_datetimes=False, lazy=False):
+    from .parsers.parser_toml import parse_toml_string, TOMLSyntaxError
+
+    try:
+        content = read_text(file_path)
+        return parse_toml_string(content, intern_keys=intern_keys, parse_datetimes=parse_datetimes, lazy=lazy)
     except TOMLSyntaxError as e:
         raise e
     except Exception as exc:
         raise RuntimeError(f"Error reading TOML: {exc}") from exc
 
 
-def parse_ini(file_path):
+def parse_ini(file_path, intern_keys=None, value_resolver=None):
+    from .parsers.parser_ini import parse_ini_blocks, INISyntaxError
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        return parse_ini_string(content)
+        return parse_ini_blocks(iter_file_blocks(file_path), intern_keys=intern_keys,
+                                value_resolver=value_resolver)
     except INISyntaxError as e:
         raise e
     except Exception as exc:
         raise RuntimeError(f"Error reading INI: {exc}") from exc
+
+
+def iter_ini_sections(file_or_path, intern_keys=None, value_resolver=None):
+    """Iterate over the ``(section_path, values)`` pairs of an INI file.
+
+    ``file_or_path`` is a path or an open text file. Lines are read lazily and
+    each section is yielded as soon as it closes; see ``parse_ini_sections``.
+    """
+    from .parsers.parser_ini import parse_ini_sections
+
+    if not isinstance(file_or_path, (str, os.PathLike)):
+        yield from parse_ini_sections(file_or_path, intern_keys=intern_keys, value_resolver=value_resolver)
+        return
+
+    try:
+        with open(file_or_path, 'r', encoding='utf-8') as f:
+            yield from parse_ini_sections(f, intern_keys=intern_keys, value_resolver=value_resolver)
+    except OSError as exc:
+        raise RuntimeError(f"Error reading INI: {exc}") from exc
+
+
+def process_ini_sections(file_or_path, on_section, intern_keys=None, value_resolver=None):
+    """Call ``on_section(section_path, values)`` for each section of an INI file.
+
+    Returns the number of sections processed.
+    """
+    count = 0
+    sections = iter_ini_sections(file_or_path, intern_keys=intern_keys, value_resolver=value_resolver)
+    for section_path, values in sections:
+        on_section(section_path, values)
+        count += 1
+    return count
@@ -0,0 +1,43 @@
+DEFAULT_MAX_KEYS = 65536
+
+
+class KeyInterner:
+    """Bounded table that maps each distinct key to one shared ``str`` object.
+
+    Unlike ``sys.intern`` the table never grows past ``max_size`` entries;
+    once it is full, unseen keys are returned as they are.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_KEYS):
+        self.max_size = max_size
+        self._table = {}
+
+    def __call__(self, key):
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        if len(self._table) < self.max_size:
+            self._table[key] = key
+        return key
+
+    def __len__(self):
+        return len(self._table)
+
+    def clear(self):
+        self._table.clear()
+
+
+default_key_interner = KeyInterner()
+
+
+def resolve_interner(intern_keys):
+    """Map the ``intern_keys`` argument of the parsers to an interner or None.
+
+    ``True`` selects the process-wide ``default_key_interner``; a
+    ``KeyInterner`` (or any callable taking and returning a key) is used as is.
+    """
+    if intern_keys is None or intern_keys is False:
+        return None
+    if intern_keys is True:
+        return default_key_interner
+    return intern_keys
@@ -1,78 +1,371 @@
+import re
+from collections.abc import Mapping
+
+from .position import format_location, get_indent_column
+from .interning import resolve_interner
+from .reading import iter_line_blocks, split_block_lines
+
+
 class INISyntaxError(Exception):
-    def __init__(self, message, line_num=None):
+    def __init__(self, message, line_num=None, column=None):
+        self.line_num = line_num
+        self.column = column
         if line_num is not None:
-            super().__init__(f"INI Syntax Error at line {line_num}: {message}")
+            super().__init__(f"INI Syntax Error at {format_location(line_num, column)}: {message}")
         else:
             super().__init__(f"INI Syntax Error: {message}")
 
 
-def parse_ini_string(ini_str):
+def parse_ini_string(ini_str, intern_keys=None, value_resolver=None):
+    return _build_ini(ini_str.splitlines(), _parse_ini_line, intern_keys, value_resolver)
+
+
+def parse_ini_bytes(data, intern_keys=None, value_resolver=None):
+    """Parse UTF-8 encoded INI from a ``bytes``-like object.
+
+    Plain ASCII lines are scanned as bytes and only their section names,
+    keys and values are decoded; blank and comment lines are never decoded.
+    The result, including error positions, is the same as that of
+    ``parse_ini_string`` on the decoded text.
+    """
+    return parse_ini_blocks(iter_line_blocks(data), intern_keys=intern_keys, value_resolver=value_resolver)
+
+
+def parse_ini_blocks(blocks, intern_keys=None, value_resolver=None):
+    """Like ``parse_ini_bytes``, for ``bytes`` blocks that each end at a line break.
+
+    ``blocks`` comes, for instance, from ``reading.iter_file_blocks``, so a
+    file is parsed without holding all of its text in memory.
+    """
+    return _build_ini(split_block_lines(blocks), _parse_ini_mixed_line, intern_keys, value_resolver)
+
+
+def _build_ini(lines, parse_line, intern_keys, value_resolver):
     result = {}
-    current_section = None
+    section_ref = result
+    interner = resolve_interner(intern_keys)
+    converters = value_resolver.section_converters("") if value_resolver is not None else None
 
-    lines = ini_str.splitlines()
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
-        if not line or line.startswith(';') or line.startswith('#'):
+    for line_num, raw_line in enumerate(lines, 1):
+        entry = parse_line(raw_line, line_num, interner, converters)
+        if entry is None:
             continue
 
-        if line.startswith('[') and line.endswith(']'):
-            section_name = line[1:-1].strip()
-            if not section_name:
-                raise INISyntaxError(f"Empty section name at line {line_num}", line_num)
-            current_section = section_name
-            _set_ini_nested_section(result, current_section)
+        key, value = entry
+        if value is _SECTION:
+            # Resolve the section once; its key lines then write to it directly
+            section_ref = _set_ini_nested_section(result, key, interner)
+            if value_resolver is not None:
+                converters = value_resolver.section_converters(key)
         else:
-            if '=' not in line:
-                raise INISyntaxError(f"Invalid line at line {line_num}: {line}", line_num)
-            key, value = map(str.strip, line.split('=', 1))
-            value = _infer_ini_type(value)
-            if not key:
-                raise INISyntaxError(f"Missing key before '=' at line {line_num}", line_num)
-            if current_section is None:
-                section_ref = result
-            else:
-                section_ref = _get_ini_nested_section(result, current_section)
             section_ref[key] = value
 
     return result
 
 
-def _set_ini_nested_section(result, dotted_path):
+def parse_ini_sections(lines, intern_keys=None, value_resolver=None):
+    """Yield ``(section_path, values)`` for each section of an INI stream.
+
+    ``lines`` is any iterable of lines, such as an open file. A section is
+    yielded as soon as the next header (or the end of input) closes it, with
+    its dotted name split into a tuple and only its own keys; keys above the
+    first header come first with the path ``()``. Sections are not merged or
+    checked against each other, so memory does not grow with the input.
+    ``value_resolver`` works as in ``parse_ini_string``.
+    """
+    interner = resolve_interner(intern_keys)
+    converters = value_resolver.section_converters("") if value_resolver is not None else None
+    path = ()
+    section = {}
+
+    for line_num, raw_line in enumerate(lines, 1):
+        entry = _parse_ini_line(raw_line, line_num, interner, converters)
+        if entry is None:
+            continue
+
+        key, value = entry
+        if value is _SECTION:
+            if path or section:
+                yield path, section
+            parts = key.split(".")
+            path = tuple(interner(part) for part in parts) if interner is not None else tuple(parts)
+            section = {}
+            if value_resolver is not None:
+                converters = value_resolver.section_converters(key)
+        else:
+            section[key] = value
+
+    if path or section:
+        yield path, section
+
+
+# Marks a section header in the (key, value) pairs of _parse_ini_line
+_SECTION = object()
+
+
+def _parse_ini_line(raw_line, line_num, interner, converters=None):
+    line = raw_line.strip()
+    if not line or line.startswith(';') or line.startswith('#'):
+        return None
+
+    if line.startswith('[') and line.endswith(']'):
+        section_name = line[1:-1].strip()
+        if not section_name:
+            raise INISyntaxError(f"Empty section name at line {line_num}", line_num,
+                                 get_indent_column(raw_line))
+        return section_name, _SECTION
+
+    if '=' not in line:
+        raise INISyntaxError(f"Invalid line at line {line_num}: {line}", line_num,
+                             get_indent_column(raw_line))
+    key, value = map(str.strip, line.split('=', 1))
+    if not key:
+        raise INISyntaxError(f"Missing key before '=' at line {line_num}", line_num,
+                             get_indent_column(raw_line))
+    convert = converters.get(key) if converters else None
+    if convert is None:
+        value = _infer_ini_type(value)
+    else:
+        try:
+            value = convert(value)
+        except (TypeError, ValueError) as exc:
+            equals = raw_line.index('=')
+            raise INISyntaxError(f"Invalid value for '{key}' at line {line_num}: {exc}", line_num,
+                                 equals + 1 + get_indent_column(raw_line[equals + 1:])) from exc
+    if interner is not None:
+        key = interner(key)
+    return key, value
+
+
+def _parse_ini_mixed_line(raw_line, line_num, interner, converters=None):
+    # Lines of split_block_lines: bytes for plain ASCII, str for the rest
+    if type(raw_line) is str:
+        return _parse_ini_line(raw_line, line_num, interner, converters)
+
+    line = raw_line.strip()
+    if not line or line.startswith(b';') or line.startswith(b'#'):
+        return None
+
+    if line.startswith(b'[') and line.endswith(b']'):
+        section_name = line[1:-1].strip()
+        if section_name:
+            return section_name.decode('ascii'), _SECTION
+    else:
+        key, equals, value = line.partition(b'=')
+        key = key.strip()
+        if equals and key:
+            key = key.decode('ascii')
+            if not converters or key not in converters:
+                value = _infer_ini_type(value.strip().decode('ascii'))
+                if interner is not None:
+                    key = interner(key)
+                return key, value
+
+    # Errors and schema conversions go through the str path, which reports
+    # the columns of the original line
+    return _parse_ini_line(raw_line.decode('ascii'), line_num, interner, converters)
+
+
+def _set_ini_nested_section(result, dotted_path, interner=None):
     keys = dotted_path.split(".")
     ref = result
     for key in keys:
+        if interner is not None:
+            key = interner(key)
         if key in ref and not isinstance(ref[key], dict):
             raise INISyntaxError(
                 f"Cannot create section '{dotted_path}': '{key}' already exists as non-section value"
             )
         ref = ref.setdefault(key, {})
+    return ref
 
 
-def _get_ini_nested_section(result, dotted_path):
-    keys = dotted_path.split(".")
-    ref = result
+_INT_PATTERN = re.compile(r'[+-]?\d+(?:_\d+)*')
+_POINT_FLOAT_PATTERN = re.compile(
+    r'[+-]?(?:\d+(?:_\d+)*\.(?:\d+(?:_\d+)*)?|\.\d+(?:_\d+)*)(?:[eE][+-]?\d+(?:_\d+)*)?'
+)
+_FLOAT_PATTERN = re.compile(
+    r'[+-]?(?:(?:\d+(?:_\d+)*(?:\.(?:\d+(?:_\d+)*)?)?|\.\d+(?:_\d+)*)(?:[eE][+-]?\d+(?:_\d+)*)?'
+    r'|inf(?:inity)?|nan)',
+    re.IGNORECASE,
+)
+_BOOLEANS = {"true": True, "false": False}
+_NO_MATCH = object()
 
-    for key in keys:
-        if key not in ref:
-            raise INISyntaxError(f"Section '{key}' not found in path '{dotted_path}'")
-        if not isinstance(ref[key], dict):
-            raise INISyntaxError(f"'{key}' in path '{dotted_path}' is not a section")
-        ref = ref[key]
 
-    return ref
+def _infer_ini_type(value):
+    # Dispatch on the first character so that each value is only checked
+    # against the types it can possibly be.
+    if not value:
+        return value
+    return _FIRST_CHAR_INFERENCE.get(value[0], _infer_ini_number)(value)
 
 
-def _infer_ini_type(value):
-    if value.lower() == "null":
+def _infer_ini_text(value):
+    if "," in value:
+        return [v.strip() for v in value.split(",")]
+    return value
+
+
+def _infer_ini_keyword(value):
+    lowered = value.lower()
+    if lowered == "null":
         return None
-    if value.lower() in ("true", "false"):
-        return value.lower() == "true"
+    if lowered in _BOOLEANS:
+        return _BOOLEANS[lowered]
+    return _infer_ini_text(value)
+
+
+def _infer_ini_number(value):
     if "," in value:
         return [v.strip() for v in value.split(",")]
-    try:
-        if '.' not in value:
-            return int(value)
-        return float(value)
-    except ValueError:
-        return value
+    if "." in value:
+        return float(value) if _POINT_FLOAT_PATTERN.fullmatch(value) else value
+    if value.isdecimal() or _INT_PATTERN.fullmatch(value):
+        return int(value)
+    return value
+
+
+# ASCII characters that cannot start a number, keyword or list map to plain
+# text; anything else (including non-ASCII digits) is checked as a number.
+_FIRST_CHAR_INFERENCE = {chr(code): _infer_ini_text for code in range(128)}
+_FIRST_CHAR_INFERENCE.update(dict.fromkeys("0123456789+-.", _infer_ini_number))
+_FIRST_CHAR_INFERENCE.update(dict.fromkeys("nNtTfF", _infer_ini_keyword))
+
+
+class INIValueResolver:
+    """Convert INI values to the types declared for their keys.
+
+    ``schema`` is either a schema shaped like ``config_lib.schema.DEFAULT_SCHEMA``
+    or a per-key type map such as ``{"network.retries": int, "logging":
+    {"output": str}}``; nested sections use their dotted header name. Values
+    of declared keys are converted straight to the declared type and raise
+    ``INISyntaxError`` if they do not fit. A type other than ``str``, ``int``,
+    ``float``, ``bool``, ``None`` and ``list`` is called with the raw text, so
+    any callable can be plugged in as a converter. Undeclared keys are
+    inferred from their text as usual.
+    """
+
+    def __init__(self, schema=None):
+        self._sections = {}
+        if schema:
+            self._add_rules(schema, "")
+
+    def section_converters(self, section_name):
+        """Return the ``{key: converter}`` map of a section, or None."""
+        return self._sections.get(section_name)
+
+    def resolve(self, section_name, key, value):
+        converters = self._sections.get(section_name)
+        convert = converters.get(key) if converters else None
+        if convert is None:
+            return _infer_ini_type(value)
+        return convert(value)
+
+    def _add_rules(self, rules, section):
+        for key, rule in rules.items():
+            owner, _, name = key.rpartition(".")
+            owner = _join_section_name(section, owner)
+
+            if isinstance(rule, Mapping):
+                if "type" not in rule:
+                    self._add_rules(rule, _join_section_name(owner, name))
+                    continue
+                if "schema" in rule:
+                    self._add_rules(rule["schema"], _join_section_name(owner, name))
+                    continue
+                items = rule.get("items")
+                converter = _ini_converter(rule["type"], items["type"] if items else None)
+            else:
+                converter = _ini_converter(rule)
+
+            if converter is not None:
+                self._sections.setdefault(owner, {})[name] = converter
+
+
+def _join_section_name(section, name):
+    if not section:
+        return name
+    return f"{section}.{name}" if name else section
+
+
+def _match_ini_null(value):
+    return None if value.lower() == "null" else _NO_MATCH
+
+
+def _match_ini_bool(value):
+    return _BOOLEANS.get(value.lower(), _NO_MATCH)
+
+
+def _match_ini_int(value):
+    return int(value) if _INT_PATTERN.fullmatch(value) else _NO_MATCH
+
+
+def _match_ini_float(value):
+    return float(value) if _FLOAT_PATTERN.fullmatch(value) else _NO_MATCH
+
+
+def _match_ini_list(value):
+    return [v.strip() for v in value.split(",")] if "," in value else _NO_MATCH
+
+
+_MATCHERS = {
+    type(None): _match_ini_null,
+    bool: _match_ini_bool,
+    int: _match_ini_int,
+    float: _match_ini_float,
+}
+
+
+def _ini_converter(expected_type, item_type=None):
+    if isinstance(expected_type, tuple):
+        return _ini_union_converter(expected_type)
+    if expected_type is dict:
+        # Mappings are sections in INI, not values
+        return None
+    if expected_type is list:
+        return _ini_list_converter(_ini_converter(item_type) if item_type is not None else None)
+    if expected_type is str:
+        return str
+    if expected_type in _MATCHERS:
+        return _strict_converter(_MATCHERS[expected_type], expected_type.__name__)
+    return expected_type
+
+
+def _strict_converter(match, type_name):
+    def convert(value):
+        result = match(value)
+        if result is _NO_MATCH:
+            raise ValueError(f"expected {type_name}, got {value!r}")
+        return result
+    return convert
+
+
+def _ini_list_converter(convert_item):
+    def convert(value):
+        if not value:
+            return []
+        items = [v.strip() for v in value.split(",")]
+        if convert_item is None:
+            return items
+        return [convert_item(item) for item in items]
+    return convert
+
+
+def _ini_union_converter(types):
+    # Try the narrowest types first so that "24" stays an int under
+    # (float, int) and "null" is None under (str, NoneType).
+    matchers = [_MATCHERS[t] for t in (type(None), bool, int, float) if t in types]
+    if list in types:
+        matchers.append(_ini_list_converter(None) if str not in types else _match_ini_list)
+    if str in types:
+        matchers.append(str)
+    type_names = ", ".join(t.__name__ for t in types)
+
+    def convert(value):
+        for match in matchers:
+            result = match(value)
+            if result is not _NO_MATCH:
+                return result
+        raise ValueError(f"expected {type_names}, got {value!r}")
+    return convert
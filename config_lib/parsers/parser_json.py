@@ -1,135 +1,144 @@
-class JSONSyntaxError(Exception):
-    def __init__(self, message, line_number=None):
-        prefix = f"JSON Syntax Error on line {line_number}" if line_number else "JSON Syntax Error"
-        super().__init__(f"{prefix}: {message}")
+import json
+import re
+
+from .position import LineIndex, format_location
+from .selection import build_selection
+from .interning import resolve_interner
+
+
+_WHITESPACE = re.compile(r'\s*')
+_STRING_RUN = re.compile(r'[^"\\]*')
+_NUMBER_RUN = re.compile(r'[\d.eE+-]*')
+_STRING_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_SKIP_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]', re.S)
+_SCALAR_RUN = re.compile(r'[^,}\]\s]*')
+
+_ESCAPE_MAPPINGS = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t'
+}
+
+_LITERALS = {
+    't': ('true', True),
+    'f': ('false', False),
+    'n': ('null', None)
+}
+
+JSON_ENGINES = ('auto', 'fast', 'strict')
+
+_CLOSING = {'{': '}', '[': ']'}
+_CONTAINER_NAMES = {'{': 'object', '[': 'array'}
+_SEPARATOR_ERRORS = {
+    '{': "Expected ',' or '{' or quotes after value",
+    '[': "Expected ',' or ']' or quotes after value"
+}
 
 
-def get_line_number(text, pos):
-    return text.count('\n', 0, pos) + 1
+class JSONSyntaxError(Exception):
+    def __init__(self, message, line_number=None, column=None):
+        self.message = message
+        self.line_number = line_number
+        self.column = column
+        prefix = f"JSON Syntax Error on {format_location(line_number, column)}" if line_number else "JSON Syntax Error"
+        super().__init__(f"{prefix}: {message}")
 
 
-def find_matching_brace(text, opening, closing, source_text, offset):
-    nesting_level = 0
+def locate(text, pos):
+    # Only called while raising, so the success path never scans for newlines.
+    return LineIndex(text).locate(pos)
 
-    for index, char in enumerate(text):
-        if char == opening:
-            nesting_level += 1
-        elif char == closing:
-            nesting_level -= 1
-            if nesting_level == 0:
-                return index
 
-    line_num = get_line_number(source_text, offset)
-    raise JSONSyntaxError(f"No matching closing brace for '{opening}'", line_num)
+def skip_whitespace(text, pos):
+    return _WHITESPACE.match(text, pos).end()
 
 
-def parse_escape_sequence(text, index, source_text, offset):
+def parse_escape_sequence(text, index):
+    # ``index`` points at the backslash; returns the position after the escape.
     index += 1
     if index >= len(text):
-        line_num = get_line_number(source_text, offset + index)
-        raise JSONSyntaxError("Unexpected end after backslash", line_num)
+        raise JSONSyntaxError("Unexpected end after backslash", *locate(text, index))
 
     escape_char = text[index]
-    escaped = handle_escape_sequence(escape_char, text, index, source_text, offset)
+    if escape_char in _ESCAPE_MAPPINGS:
+        return index + 1, _ESCAPE_MAPPINGS[escape_char]
 
     if escape_char == 'u':
-        index += 4  # Skip 4 hex digits
-
-    return index, escaped
-
-
-def handle_escape_sequence(escape_char, content, idx, original_text, start_pos):
-    escape_mappings = {
-        '"': '"',
-        '\\': '\\',
-        '/': '/',
-        'b': '\b',
-        'f': '\f',
-        'n': '\n',
-        'r': '\r',
-        't': '\t'
-    }
-
-    if escape_char in escape_mappings:
-        return escape_mappings[escape_char]
-
-    if escape_char == 'u':
-        return handle_unicode_escape(content, idx, original_text, start_pos)
-
-    line_num = get_line_number(original_text, start_pos + idx)
-    raise JSONSyntaxError(f"Invalid escape character: \\{escape_char}", line_num)
+        char = handle_unicode_escape(text, index)
+        # A high surrogate followed by an escaped low surrogate is one character
+        if '\ud800' <= char <= '\udbff' and text.startswith('\\u', index + 5):
+            low = handle_unicode_escape(text, index + 6)
+            if '\udc00' <= low <= '\udfff':
+                return index + 11, chr(0x10000 + ((ord(char) - 0xD800) << 10) + (ord(low) - 0xDC00))
+        return index + 5, char
 
+    raise JSONSyntaxError(f"Invalid escape character: \\{escape_char}", *locate(text, index))
 
-def handle_unicode_escape(content, idx, original_text, start_pos):
-    line_num = get_line_number(original_text, start_pos + idx)
 
-    # Expect 4 hex digits after \u
-    if idx + 4 >= len(content):
-        raise JSONSyntaxError("Incomplete unicode escape sequence", line_num)
-
-    hex_digits = content[idx + 1:idx + 5]
+def handle_unicode_escape(text, idx):
+    # Expect 4 hex digits after \u, all of them inside the string literal
+    hex_digits = text[idx + 1:idx + 5]
+    if len(hex_digits) < 4 or '"' in hex_digits:
+        raise JSONSyntaxError("Incomplete unicode escape sequence", *locate(text, idx))
 
     try:
         return chr(int(hex_digits, 16))
     except ValueError as exc:
-        raise JSONSyntaxError(f"Invalid unicode escape: \\u{hex_digits}", line_num) from exc
+        raise JSONSyntaxError(f"Invalid unicode escape: \\u{hex_digits}", *locate(text, idx)) from exc
 
 
-def parse_json_string_value(text, source_text, offset):
-    if not text.startswith('"'):
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Expected string", line_num)
+def parse_json_string_value(text, pos):
+    if not text.startswith('"', pos):
+        raise JSONSyntaxError("Expected string", *locate(text, pos))
 
-    index = 1
-    result = []
+    index = pos + 1
+    chunks = []
 
-    while index < len(text):
-        char = text[index]
-        if char == '"':
-            return ''.join(result), text[index + 1:]
-        if char == '\\':
-            index, escaped = parse_escape_sequence(text, index, source_text, offset)
-            result.append(escaped)
-        else:
-            result.append(char)
-        index += 1
+    while True:
+        run_end = _STRING_RUN.match(text, index).end()
+        if run_end > index:
+            chunks.append(text[index:run_end])
 
-    line_num = get_line_number(source_text, offset + index)
-    raise JSONSyntaxError("Unterminated string", line_num)
+        if run_end >= len(text):
+            raise JSONSyntaxError("Unterminated string", *locate(text, run_end))
 
+        if text[run_end] == '"':
+            return ''.join(chunks), run_end + 1
 
-def parse_json_number(text, source_text, offset):
-    raw_number, remainder_index = read_number_prefix(text)
-    validate_number_format(raw_number, source_text, offset)
+        index, escaped = parse_escape_sequence(text, run_end)
+        chunks.append(escaped)
 
-    try:
-        if any(c in raw_number for c in ('.', 'e', 'E')):
-            return float(raw_number)
-        return int(raw_number)
-    except ValueError as exc:
-        line_num = get_line_number(source_text, offset + remainder_index)
-        raise JSONSyntaxError(f"Invalid number: {raw_number}", line_num) from exc
 
+def parse_json_number(text, pos, slot):
+    end = _NUMBER_RUN.match(text, pos).end()
+    raw_number = text[pos:end]
 
-def read_number_prefix(text):
-    num_chars = []
-    index = 0
+    if not raw_number:
+        raise JSONSyntaxError("Expected value. Possibly missing quotes for string.", *locate(text, slot))
 
-    while index < len(text) and (text[index].isdigit() or text[index] in '-+.eE'):
-        num_chars.append(text[index])
-        index += 1
+    validate_number_format(raw_number, text, slot)
 
-    return ''.join(num_chars), index
+    try:
+        if any(c in raw_number for c in ('.', 'e', 'E')):
+            return float(raw_number), end
+        return int(raw_number), end
+    except ValueError as exc:
+        raise JSONSyntaxError(f"Invalid number: {raw_number}", *locate(text, end)) from exc
 
 
 def validate_number_format(number_str, source_text, offset):
-    line_num = get_line_number(source_text, offset)
-
     if number_str.startswith('0') and len(number_str) > 1 and number_str[1].isdigit():
-        raise JSONSyntaxError(f"Invalid number with leading zero: {number_str}", line_num)
+        raise JSONSyntaxError(f"Invalid number with leading zero: {number_str}",
+                              *locate(source_text, offset))
 
     if number_str.startswith('-0') and len(number_str) > 2 and number_str[2].isdigit():
-        raise JSONSyntaxError(f"Invalid negative number with leading zero: {number_str}", line_num)
+        raise JSONSyntaxError(f"Invalid negative number with leading zero: {number_str}",
+                              *locate(source_text, offset))
 
     if (
             number_str.endswith('.')
@@ -137,196 +146,241 @@ def validate_number_format(number_str, source_text, offset):
             or number_str.startswith('-.')
             or number_str.startswith('+.')
     ):
-        raise JSONSyntaxError(f"Invalid float number format: {number_str}", line_num)
-
-
-def parse_json_value(content, original_text, start_pos):
-    content = content.strip()
-
-    if not content:
-        line_num = get_line_number(original_text, start_pos)
-        raise JSONSyntaxError("Unexpected end of input", line_num)
-
-    if content.startswith('{'):
-        return parse_json_object_value(content, original_text, start_pos)
-
-    if content.startswith('['):
-        return parse_json_array_value(content, original_text, start_pos)
-
-    if content.startswith('"'):
-        return parse_json_string_value(content, original_text, start_pos)
-
-    literal_parsers = {
-        'true': lambda: parse_boolean_value(content, True),
-        'false': lambda: parse_boolean_value(content, False),
-        'null': lambda: parse_null_value(content)
-    }
-
-    for literal, parser in literal_parsers.items():
-        if content.startswith(literal):
-            return parser()
-
-    return parse_json_number_value(content, original_text, start_pos)
-
-
-def parse_json_object_value(content, original_text, start_pos):
-    end = find_matching_brace(content, '{', '}', original_text, start_pos)
-    return parse_json_object(content[:end + 1], original_text, start_pos), content[end + 1:]
-
-
-def parse_json_array_value(content, original_text, start_pos):
-    end = find_matching_brace(content, '[', ']', original_text, start_pos)
-    return parse_json_array(content[:end + 1], original_text, start_pos), content[end + 1:]
-
-
-def parse_boolean_value(content, value):
-    return value, content[len(str(value)):]
-
-
-def parse_null_value(content):
-    return None, content[4:]
-
-
-def parse_json_number_value(content, original_text, start_pos):
-    num_str = ''
-    i = 0
-
-    while i < len(content) and (content[i].isdigit() or content[i] in '.-+eE'):
-        num_str += content[i]
-        i += 1
-
-    if not num_str:
-        line_num = get_line_number(original_text, start_pos)
-        raise JSONSyntaxError("Expected value. Possibly missing quotes for string.", line_num)
-
-    return parse_json_number(num_str, original_text, start_pos), content[i:]
-
-
-def parse_json_object(text, source_text, offset):
-    if not text.startswith('{') or not text.endswith('}'):
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Invalid JSON object", line_num)
-
-    inner_content = text[1:-1].strip()
-    current_offset = offset + 1
-    obj = {}
-
-    while inner_content:
-        key, inner_content, current_offset = parse_object_key(inner_content, source_text, current_offset)
-        value, inner_content, current_offset = parse_object_value(inner_content, source_text, current_offset)
-        inner_content, current_offset = process_comma_or_end(inner_content, source_text, current_offset)
-
-        obj[key] = value
-
-    return obj
-
-
-def parse_object_key(content, source_text, offset):
-    if not content.startswith('"'):
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Expected string key in double quotes", line_num)
-
-    key, remainder = parse_json_string_value(content, source_text, offset)
-    consumed = len(content) - len(remainder)
-    offset += consumed
-    content = remainder.strip()
-
-    if not content.startswith(':'):
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Expected ':' or quotes after key", line_num)
-
-    return key, content[1:].strip(), offset + 1
-
-
-def parse_object_value(content, source_text, offset):
-    value, remainder = parse_json_value(content, source_text, offset)
-    consumed = len(content) - len(remainder)
-
-    return value, remainder.strip(), offset + consumed
-
-
-def process_comma_or_end(content, source_text, offset):
-    if content.startswith(','):
-        return content[1:].strip(), offset + 1
-
-    if content.startswith('}'):
-        return '', offset
-
-    if content:
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Expected ',' or '{' or quotes after value", line_num)
-
-    return '', offset
-
-
-def parse_json_array(text, source_text, offset):
-    if not text.startswith('[') or not text.endswith(']'):
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Invalid JSON array", line_num)
+        raise JSONSyntaxError(f"Invalid float number format: {number_str}", *locate(source_text, offset))
+
+
+def parse_json_scalar(text, pos, slot):
+    # ``slot`` is where the value was expected (right after ':', ',' or '['),
+    # which is the position value-level errors are reported at.
+    char = text[pos]
+
+    if char == '"':
+        return parse_json_string_value(text, pos)
+
+    if char in _LITERALS:
+        literal, value = _LITERALS[char]
+        if text.startswith(literal, pos):
+            return value, pos + len(literal)
+
+    return parse_json_number(text, pos, slot)
+
+
+def raise_unclosed_container(text, opening, slot, nested):
+    if nested:
+        raise JSONSyntaxError(f"No matching closing brace for '{opening}'", *locate(text, slot))
+    raise JSONSyntaxError(f"Invalid JSON {_CONTAINER_NAMES[opening]}", *locate(text, slot))
+
+
+def skip_json_value(text, pos):
+    # Finds the end of the value at ``pos`` without building it. Only string
+    # and bracket boundaries are respected; the skipped content is not validated.
+    char = text[pos]
+
+    if char == '"':
+        match = _STRING_TOKEN.match(text, pos)
+        if not match:
+            raise JSONSyntaxError("Unterminated string", *locate(text, pos))
+        return match.end()
+
+    if char in _CLOSING:
+        closers = []
+        for match in _SKIP_TOKEN.finditer(text, pos):
+            token = text[match.start()]
+            if token in _CLOSING:
+                closers.append(_CLOSING[token])
+            elif token != '"':
+                if token != closers.pop():
+                    break
+                if not closers:
+                    return match.end()
+        raise JSONSyntaxError(f"No matching closing brace for '{char}'", *locate(text, pos))
+
+    return _SCALAR_RUN.match(text, pos).end()
+
+
+def parse_json_container(text, pos, selection=None, interner=None):
+    # Walks the text once, keeping the enclosing containers on an explicit
+    # stack so that neither nesting depth nor document size cause rescans.
+    # ``selection`` (see build_selection) restricts which object members are
+    # built; the others are skipped with skip_json_value. Keys are passed
+    # through ``interner`` when one is given.
+    text_length = len(text)
+    stack = []
+    opening = text[pos]
+    container = {} if opening == '{' else []
+    if opening != '{':
+        selection = None
+    slot = pos
+    key = None
+    expect_item = True
+    pos += 1
+
+    while True:
+        item_slot = pos
+        pos = skip_whitespace(text, pos)
+        char = text[pos] if pos < text_length else ''
+
+        if not expect_item:
+            if char == ',':
+                expect_item = True
+                pos += 1
+                continue
+            if char != _CLOSING[opening]:
+                if not char or (stack and char in '}]'):
+                    raise_unclosed_container(text, opening, slot, bool(stack))
+                raise JSONSyntaxError(_SEPARATOR_ERRORS[opening], *locate(text, pos))
+            value = container
+            pos += 1
+        elif char == _CLOSING[opening]:
+            # Empty container or trailing comma
+            value = container
+            pos += 1
+        else:
+            if not char or char in '}]':
+                raise_unclosed_container(text, opening, slot, bool(stack))
+
+            if opening == '{':
+                if char != '"':
+                    raise JSONSyntaxError("Expected string key in double quotes", *locate(text, pos))
+
+                key, pos = parse_json_string_value(text, pos)
+                if interner is not None:
+                    key = interner(key)
+                pos = skip_whitespace(text, pos)
+
+                if not text.startswith(':', pos):
+                    raise JSONSyntaxError("Expected ':' or quotes after key", *locate(text, pos))
+
+                item_slot = pos + 1
+                pos = skip_whitespace(text, item_slot)
+                char = text[pos] if pos < text_length else ''
+
+                if char == '}':
+                    raise JSONSyntaxError("Unexpected end of input", *locate(text, item_slot))
+                if stack and (not char or char == ']'):
+                    raise_unclosed_container(text, opening, slot, True)
+                if not char:
+                    raise JSONSyntaxError("Unexpected end of input", *locate(text, item_slot))
+
+                if selection is not None and (key not in selection or (selection[key] is not None and char != '{')):
+                    pos = skip_json_value(text, pos)
+                    expect_item = False
+                    continue
+
+            if char in _CLOSING:
+                stack.append((container, opening, slot, key, selection))
+                if selection is not None:
+                    selection = selection[key]
+                opening = char
+                container = {} if opening == '{' else []
+                slot = item_slot
+                pos += 1
+                continue
+
+            value, pos = parse_json_scalar(text, pos, item_slot)
+
+            if opening == '{':
+                container[key] = value
+            else:
+                container.append(value)
+            expect_item = False
+            continue
+
+        # A container has just been closed
+        if not stack:
+            return value, pos
+
+        container, opening, slot, key, selection = stack.pop()
+        if opening == '{':
+            container[key] = value
+        else:
+            container.append(value)
+        expect_item = False
+
+
+def parse_json_string(json_str, select=None, intern_keys=None):
+    """Parse JSON text; empty or blank text gives ``{}``.
+
+    Anything but whitespace after a root object or array is an error
+    (reported as an invalid object or array), and a misspelled literal such
+    as ``fals`` is reported as a missing value, at the root as in nested
+    positions.
+
+    Errors are reported at the first character that cannot continue the
+    document, on its line in the text as given. An unclosed nested
+    container is reported as "No matching closing brace" only when it runs
+    into the end of input or the other kind of closing bracket; brackets
+    inside strings are never counted.
+    """
+    start = skip_whitespace(json_str, 0)
+    end = len(json_str)
+    while end > start and json_str[end - 1].isspace():
+        end -= 1
+
+    if start == end:
+        return {}
 
-    inner_content = text[1:-1].strip()
-    current_offset = offset + 1
-    elements = []
+    try:
+        first = json_str[start]
 
-    while inner_content:
-        value, inner_content, current_offset = parse_array_element(inner_content, source_text, current_offset)
-        elements.append(value)
-        inner_content, current_offset = process_array_separator_or_end(inner_content, source_text, current_offset)
+        if first in _CLOSING:
+            if json_str[end - 1] != _CLOSING[first]:
+                raise_unclosed_container(json_str, first, start, False)
 
-    return elements
+            selection = build_selection(select) if select is not None else None
+            value, pos = parse_json_container(json_str, start, selection, resolve_interner(intern_keys))
+            if skip_whitespace(json_str, pos) < end:
+                raise_unclosed_container(json_str, first, start, False)
+            return value
 
+        value, _ = parse_json_scalar(json_str, start, start)
+        return value
 
-def parse_array_element(content, source_text, offset):
-    value, remainder = parse_json_value(content, source_text, offset)
-    consumed = len(content) - len(remainder)
+    except JSONSyntaxError:
+        raise
+    except Exception as exc:
+        raise JSONSyntaxError(str(exc)) from exc
 
-    return value, remainder.strip(), offset + consumed
 
+def _reject_constant(name):
+    # NaN and Infinity are not JSON; parse_json_string rejects them too
+    raise ValueError(f"Invalid number: {name}")
 
-def process_array_separator_or_end(content, source_text, offset):
-    if content.startswith(','):
-        return content[1:].strip(), offset + 1
 
-    if content.startswith(']'):
-        return '', offset
+def decode_json_fast(json_str, intern_keys=None):
+    """Decode with the C-accelerated stdlib decoder, building the same objects as parse_json_string."""
+    interner = resolve_interner(intern_keys)
+    object_pairs_hook = None
+    if interner is not None:
+        def object_pairs_hook(pairs):
+            return {interner(key): value for key, value in pairs}
 
-    if content:
-        line_num = get_line_number(source_text, offset)
-        raise JSONSyntaxError("Expected ',' or ']' or quotes after value", line_num)
+    return json.loads(json_str, parse_constant=_reject_constant, object_pairs_hook=object_pairs_hook)
 
-    return '', offset
 
+def parse_json_with_engine(json_str, engine='auto', select=None, intern_keys=None):
+    """Parse JSON text with one of the JSON_ENGINES.
 
-def parse_json_string(json_str):
-    json_str = json_str.strip()
+    ``strict`` always uses parse_json_string. ``fast`` uses the stdlib decoder
+    only and reports its errors as JSONSyntaxError. ``auto`` tries the stdlib
+    decoder first and re-parses with parse_json_string when it fails, so input
+    that only the pure-Python parser accepts (empty text, trailing commas)
+    still loads, and malformed input gets the usual line-numbered message.
+    Selections always use parse_json_string, which can skip subtrees.
+    """
+    if engine not in JSON_ENGINES:
+        raise ValueError(f"Unknown JSON engine: {engine!r}. Expected one of {', '.join(JSON_ENGINES)}")
 
-    if not json_str:
-        return {}
+    if engine == 'strict' or select is not None:
+        return parse_json_string(json_str, select=select, intern_keys=intern_keys)
 
     try:
-        if json_str.startswith('{'):
-            return parse_json_object(json_str, json_str, 0)
-
-        if json_str.startswith('['):
-            return parse_json_array(json_str, json_str, 0)
-
-        if json_str.startswith('"'):
-            value, _ = parse_json_string_value(json_str, json_str, 0)
-            return value
-
-        literal_parsers = {
-            'true': True,
-            'false': False,
-            'null': None
-        }
-
-        for literal, value in literal_parsers.items():
-            if json_str.startswith(literal):
-                return value
-
-        return parse_json_number(json_str, json_str, 0)
-
-    except JSONSyntaxError:
-        raise
-    except Exception as exc:
-        raise JSONSyntaxError(str(exc)) from exc
+        return decode_json_fast(json_str, intern_keys)
+    except json.JSONDecodeError as exc:
+        if engine == 'fast':
+            raise JSONSyntaxError(exc.msg, exc.lineno, exc.colno) from exc
+    except (ValueError, RecursionError) as exc:
+        if engine == 'fast':
+            raise JSONSyntaxError(str(exc)) from exc
+
+    return parse_json_string(json_str, intern_keys=intern_keys)
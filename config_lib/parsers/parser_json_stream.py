@@ -0,0 +1,341 @@
+import codecs
+import re
+
+from .parser_json import (
+    JSONSyntaxError,
+    skip_whitespace,
+    parse_json_string_value,
+    parse_json_number,
+)
+from .position import LineIndex
+from .interning import resolve_interner
+
+
+_STRING_END = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+_NUMBER_RUN = re.compile(r'[\d.eE+-]*')
+
+_LITERALS = {
+    't': ('true', True),
+    'f': ('false', False),
+    'n': ('null', None)
+}
+
+_CLOSING = {'{': '}', '[': ']'}
+_CONTAINER_NAMES = {'{': 'object', '[': 'array'}
+_START_EVENTS = {'{': 'start_object', '[': 'start_array'}
+_END_EVENTS = {'{': 'end_object', '[': 'end_array'}
+_SEPARATOR_ERRORS = {
+    '{': "Expected ',' or '{' or quotes after value",
+    '[': "Expected ',' or ']' or quotes after value"
+}
+
+# Parser states: what the next token is allowed to be.
+_VALUE = 'value'  # a value (document start, after ':')
+_ITEM = 'item'  # an array element or ']' (after '[' or ',')
+_KEY = 'key'  # an object key or '}' (after '{' or ',')
+_COLON = 'colon'
+_AFTER_VALUE = 'after_value'  # ',' or the closing bracket
+_DONE = 'done'
+
+
+class JSONStreamParser:
+    """Incremental JSON parser fed with text (or UTF-8 bytes) in chunks.
+
+    Each call to ``feed`` returns the events completed by that chunk as
+    ``(event, value)`` pairs, where event is one of ``start_object``,
+    ``end_object``, ``start_array``, ``end_array``, ``key`` or ``value``.
+    Only the unconsumed tail of the input is kept between calls. With
+    ``build_document=True`` the events are also assembled into
+    ``document``, available once the parser is closed. ``intern_keys``
+    works as in ``parse_json_string``.
+    """
+
+    def __init__(self, build_document=False, intern_keys=None):
+        self._buffer = ''
+        # A string or number left open at the end of the buffer: the chunks
+        # fed since are only scanned for its end and kept aside, so a long
+        # token arriving in small chunks is not copied and rescanned per feed
+        self._open_token = None
+        self._open_escape = False
+        self._pending = []
+        self._line_offset = 0
+        self._column_offset = 0
+        self._stack = []
+        self._state = _VALUE
+        self._root = None
+        self._closed = False
+        self._decoder = None
+        self._interner = resolve_interner(intern_keys)
+        self._builder = JSONDocumentBuilder() if build_document else None
+
+    @property
+    def document(self):
+        if self._builder is None:
+            raise RuntimeError("JSONStreamParser was created without build_document=True")
+        if not self._closed:
+            raise RuntimeError("JSONStreamParser must be closed before reading the document")
+        return self._builder.document
+
+    def feed(self, chunk):
+        if self._closed:
+            raise RuntimeError("Cannot feed a closed JSONStreamParser")
+
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self._decoder.decode(chunk)
+
+        if self._open_token is not None:
+            if not self._token_ends_in(chunk):
+                self._pending.append(chunk)
+                return []
+            self._pending.append(chunk)
+            self._join_pending()
+        else:
+            self._buffer = self._buffer + chunk if self._buffer else chunk
+        return self._process(final=False)
+
+    def close(self):
+        if self._closed:
+            return []
+
+        self._join_pending()
+        if self._decoder is not None:
+            self._buffer += self._decoder.decode(b'', final=True)
+
+        events = self._process(final=True)
+        self._closed = True
+
+        if self._stack:
+            opening = self._stack[-1]
+            raise self._unclosed_error(opening, len(self._buffer))
+
+        if self._state != _DONE and self._builder is not None:
+            # Empty input parses to an empty mapping, like parse_json_string
+            self._builder.document = {}
+
+        return events
+
+    def _process(self, final):
+        buffer = self._buffer
+        buffer_length = len(buffer)
+        events = []
+        pos = 0
+
+        while True:
+            pos = skip_whitespace(buffer, pos)
+            if pos >= buffer_length:
+                break
+
+            char = buffer[pos]
+            state = self._state
+
+            if state == _DONE:
+                raise self._error(f"Invalid JSON {_CONTAINER_NAMES.get(self._root, 'value')}", pos)
+
+            if state == _COLON:
+                if char != ':':
+                    raise self._error("Expected ':' or quotes after key", pos)
+                self._state = _VALUE
+                pos += 1
+                continue
+
+            if state == _AFTER_VALUE:
+                opening = self._stack[-1]
+                if char == ',':
+                    self._state = _KEY if opening == '{' else _ITEM
+                    pos += 1
+                elif char == _CLOSING[opening]:
+                    self._close_container(events)
+                    pos += 1
+                elif len(self._stack) > 1 and char in '}]':
+                    raise self._unclosed_error(opening, pos)
+                else:
+                    raise self._error(_SEPARATOR_ERRORS[opening], pos)
+                continue
+
+            if state == _KEY:
+                if char == '}':
+                    self._close_container(events)
+                    pos += 1
+                    continue
+                if char == ']':
+                    raise self._unclosed_error('{', pos)
+                if char != '"':
+                    raise self._error("Expected string key in double quotes", pos)
+
+                string_end = self._find_string_end(buffer, pos, final)
+                if string_end is None:
+                    self._open_string(buffer, pos)
+                    break
+                key, pos = self._call(parse_json_string_value, buffer, pos)
+                if self._interner is not None:
+                    key = self._interner(key)
+                events.append(('key', key))
+                self._state = _COLON
+                continue
+
+            # _VALUE or _ITEM
+            if char in '}]':
+                if state == _ITEM and char == ']':
+                    self._close_container(events)
+                    pos += 1
+                    continue
+                if self._stack and char == '}' and self._stack[-1] == '{':
+                    raise self._error("Unexpected end of input", pos)
+                if self._stack:
+                    raise self._unclosed_error(self._stack[-1], pos)
+
+            if char in _CLOSING:
+                if self._root is None:
+                    self._root = char
+                self._stack.append(char)
+                events.append((_START_EVENTS[char], None))
+                self._state = _KEY if char == '{' else _ITEM
+                pos += 1
+                continue
+
+            if char == '"':
+                if self._find_string_end(buffer, pos, final) is None:
+                    self._open_string(buffer, pos)
+                    break
+                value, pos = self._call(parse_json_string_value, buffer, pos)
+            elif char in _LITERALS and buffer.startswith(_LITERALS[char][0][:buffer_length - pos], pos):
+                literal, value = _LITERALS[char]
+                if buffer_length - pos < len(literal):
+                    if not final:
+                        break
+                    value, pos = self._call(parse_json_number, buffer, pos, pos)
+                else:
+                    pos += len(literal)
+            else:
+                if _NUMBER_RUN.match(buffer, pos).end() >= buffer_length and not final:
+                    self._open_token = 'number'
+                    break
+                value, pos = self._call(parse_json_number, buffer, pos, pos)
+
+            events.append(('value', value))
+            self._state = _AFTER_VALUE if self._stack else _DONE
+
+        self._discard(pos)
+
+        if self._builder is not None:
+            for event, value in events:
+                self._builder.handle(event, value)
+
+        return events
+
+    def _close_container(self, events):
+        opening = self._stack.pop()
+        events.append((_END_EVENTS[opening], None))
+        self._state = _AFTER_VALUE if self._stack else _DONE
+
+    @staticmethod
+    def _find_string_end(buffer, pos, final):
+        match = _STRING_END.match(buffer, pos)
+        if match:
+            return match.end()
+        # At the end of input let the string parser report what is wrong with it
+        return pos if final else None
+
+    def _open_string(self, buffer, pos):
+        # The body scanned so far ends in a lone backslash if it stops short
+        self._open_token = 'string'
+        self._open_escape = _STRING_BODY.match(buffer, pos + 1).end() < len(buffer)
+
+    def _token_ends_in(self, chunk):
+        # Whether the open token ends within chunk; updates the escape state
+        if self._open_token == 'number':
+            return _NUMBER_RUN.match(chunk).end() < len(chunk)
+        if not chunk:
+            return False
+
+        start = 1 if self._open_escape else 0
+        end = _STRING_BODY.match(chunk, start).end() if start < len(chunk) else len(chunk)
+        if end < len(chunk) and chunk[end] == '"':
+            return True
+        # Short of the end, the scan stopped at a trailing lone backslash
+        self._open_escape = end < len(chunk)
+        return False
+
+    def _join_pending(self):
+        if self._pending:
+            self._buffer = ''.join([self._buffer, *self._pending])
+            self._pending = []
+        self._open_token = None
+        self._open_escape = False
+
+    def _discard(self, pos):
+        # Drop consumed text, remembering where the kept tail starts in the input.
+        newlines = self._buffer.count('\n', 0, pos)
+
+        if newlines:
+            self._line_offset += newlines
+            self._column_offset = pos - self._buffer.rfind('\n', 0, pos) - 1
+        else:
+            self._column_offset += pos
+
+        self._buffer = self._buffer[pos:]
+
+    def _absolute_position(self, line_number, column):
+        if line_number == 1:
+            column += self._column_offset
+        return line_number + self._line_offset, column
+
+    def _error(self, message, pos):
+        line_number, column = LineIndex(self._buffer).locate(pos)
+        return JSONSyntaxError(message, *self._absolute_position(line_number, column))
+
+    def _unclosed_error(self, opening, pos):
+        if len(self._stack) > 1:
+            return self._error(f"No matching closing brace for '{opening}'", pos)
+        return self._error(f"Invalid JSON {_CONTAINER_NAMES[opening]}", pos)
+
+    def _call(self, parse_function, *args):
+        # Helpers from parser_json report positions relative to the buffer.
+        try:
+            return parse_function(*args)
+        except JSONSyntaxError as exc:
+            raise JSONSyntaxError(exc.message, *self._absolute_position(exc.line_number, exc.column)) from exc
+
+
+class JSONDocumentBuilder:
+    """Assemble the events produced by ``JSONStreamParser`` into Python objects."""
+
+    def __init__(self):
+        self.document = None
+        self._stack = []
+
+    def handle(self, event, value):
+        if event == 'value':
+            self._add(value)
+        elif event == 'key':
+            self._stack[-1][1] = value
+        elif event == 'start_object':
+            self._stack.append([{}, None])
+        elif event == 'start_array':
+            self._stack.append([[], None])
+        else:
+            container, _ = self._stack.pop()
+            self._add(container)
+
+    def _add(self, value):
+        if not self._stack:
+            self.document = value
+            return
+
+        container, key = self._stack[-1]
+        if isinstance(container, list):
+            container.append(value)
+        else:
+            container[key] = value
+
+
+def parse_json_stream(chunks, intern_keys=None):
+    """Parse an iterable of text or bytes chunks into a JSON document."""
+    parser = JSONStreamParser(build_document=True, intern_keys=intern_keys)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.document
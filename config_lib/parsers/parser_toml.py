@@ -1,6 +1,10 @@
 import re
-from typing import Dict, Any, List, Union
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+
+from .position import format_location
+from .interning import resolve_interner
 
 
 _ESCAPE_MAP = {
@@ -14,58 +18,183 @@ _ESCAPE_MAP = {
     't': '\t',
 }
 
+# Token kinds produced by _tokenize
+NEWLINE = 'newline'
+STRING = 'string'
+BARE = 'bare'
+PUNCTUATION = 'punctuation'
+EOF = 'eof'
+
+# One match per token: leading blanks and a comment are skipped first. Bare
+# words may contain inner blanks so that keys such as "key with spaces" and
+# values such as "2025-12-31 23:59:59" stay single tokens.
+_TOKEN_PATTERN = re.compile(r'''
+    [ \t]*(?:\#[^\r\n]*)?
+    (?:
+        (?P<newline>\r\n?|\n)
+      | (?P<string>"[^"\\\r\n]*(?:\\.[^"\\\r\n]*)*"|'[^'\\\r\n]*(?:\\.[^'\\\r\n]*)*')
+      | (?P<punctuation>[\[\]{},=])
+      | (?P<bare>[^\s\[\]{},=\#"']+(?:[ \t]+[^\s\[\]{},=\#"']+)*)
+      | (?P<quote>["'])
+      | (?P<eof>\Z)
+    )''', re.X)
+
+_HEADER_LINE_PATTERN = re.compile(r'^[ \t]*\[([^\[\]\r\n]*)\][ \t]*(?:#[^\r\n]*)?\r?$', re.M)
+_STRING_OR_COMMENT_PATTERN = re.compile(r'''"(?:[^"\\\r\n]|\\.)*"|'(?:[^'\\\r\n]|\\.)*'|\#[^\r\n]*''')
+_BARE_KEY_PATTERN = re.compile(r'[a-zA-Z0-9_-]+')
+_INTEGER_PATTERN = re.compile(r'[+-]?\d+')
+_FLOAT_PATTERN = re.compile(r'[+-]?\d*\.\d+(?:[eE][+-]?\d+)?')
+_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+_TIME_PATTERN = re.compile(r'\d{2}:\d{2}:\d{2}(?:\.\d+)?')
+_DATETIME_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})[Tt ](\d{2}:\d{2}:\d{2}(?:\.\d+)?)([Zz]|[+-]\d{2}:\d{2})?')
+
+Token = Tuple[str, str, int, int]
+DateTimeValue = Union[datetime, date, time]
+
 
 class TOMLSyntaxError(Exception):
     """Custom exception for TOML parsing errors."""
 
-    def __init__(self, message: str, line_num: int):
+    def __init__(self, message: str, line_num: int, column: Optional[int] = None):
         self.line_num = line_num
-        self.message = f"TOML Syntax Error on line {line_num}: {message}"
+        self.column = column
+        self.message = f"TOML Syntax Error on {format_location(line_num, column)}: {message}"
         super().__init__(self.message)
 
 
+def parse_toml_datetime(text: str) -> Optional[DateTimeValue]:
+    """Return the datetime, date or time written in ``text``, or None.
+
+    The precompiled patterns decide on the kind before anything is
+    converted, so text that is not a date or time never raises. Text that
+    has the right shape but is out of range (``2025-13-01``) raises
+    ValueError.
+    """
+    if len(text) < 8 or not text[0].isdecimal():
+        return None
+
+    if text[2] == ':':
+        return time.fromisoformat(text) if _TIME_PATTERN.fullmatch(text) else None
+
+    if len(text) == 10:
+        return date.fromisoformat(text) if _DATE_PATTERN.fullmatch(text) else None
+
+    match = _DATETIME_PATTERN.fullmatch(text)
+    if match is None:
+        return None
+    day, clock, offset = match.groups()
+    return datetime.fromisoformat(f"{day}T{clock}{offset.upper() if offset else ''}")
+
+
+def _tokenize(text: str, line_number: int = 1) -> Iterator[Token]:
+    """Scan TOML text once, yielding ``(kind, text, line, column)`` tokens.
+
+    Comments and blanks are dropped and every line break is a NEWLINE token.
+    Once the text is exhausted the EOF token is repeated indefinitely.
+    """
+    match_token = _TOKEN_PATTERN.match
+    line_start = 0
+    pos = 0
+
+    while True:
+        match = match_token(text, pos)
+        if match is None:
+            raise TOMLSyntaxError(f"Unexpected character {text[pos]!r}", line_number, pos - line_start + 1)
+
+        kind = match.lastgroup
+        start = match.start(kind)
+        pos = match.end()
+
+        if kind == 'quote':
+            raise TOMLSyntaxError("Unterminated string", line_number, start - line_start + 1)
+
+        token = kind, match.group(kind), line_number, start - line_start + 1
+
+        if kind == EOF:
+            # Readers may look past the end more than once
+            while True:
+                yield token
+
+        yield token
+        if kind == NEWLINE:
+            line_number += 1
+            line_start = pos
+
+
 class TOMLParser:
-    """A simple TOML parser with improved structure and error handling."""
+    """A simple TOML parser built on a single-pass tokenizer.
+
+    Arrays may span several lines and inline tables (``{ key = value }``) are
+    supported as values. Dates and times are returned as they are written
+    unless ``parse_datetimes`` is set, in which case they become
+    ``datetime``, ``date`` and ``time`` objects.
+    """
 
-    def __init__(self):
+    def __init__(self, intern_keys: Any = None, parse_datetimes: bool = False):
+        self.parse_datetimes = parse_datetimes
         self.data: Dict[str, Any] = {}
         self.current_section: Dict[str, Any] = self.data
         self.line_number: int = 0
+        self.column: Optional[int] = None
+        self.interner = resolve_interner(intern_keys)
+        self._tokens: Iterator[Token] = iter(())
 
     def parse(self, toml_str: str) -> Dict[str, Any]:
         """Parse a TOML string and return the resulting dictionary."""
         self.data = {}
+        self._parse_text(toml_str)
+        return self.data
+
+    def _parse_text(self, toml_str: str, line_number: int = 1) -> None:
+        """Parse statements into ``self.data``, counting lines from ``line_number``."""
         self.current_section = self.data
+        self._tokens = _tokenize(toml_str, line_number)
 
-        lines = toml_str.splitlines()
-        for line_num, line in enumerate(lines, start=1):
-            self.line_number = line_num
-            self._parse_line(line.strip())
+        while True:
+            token = self._next_token()
+            kind, text = token[0], token[1]
 
-        return self.data
+            if kind == NEWLINE:
+                continue
+            if kind == EOF:
+                break
 
-    def _parse_line(self, line: str) -> None:
-        """Parse a single line of TOML."""
-        # Skip empty lines and comments
-        if not line or line.startswith('#'):
-            return
-
-        # Handle section headers
-        if line.startswith('[') and line.endswith(']'):
-            self._parse_section_header(line)
-        # Handle key-value pairs
-        elif '=' in line:
-            self._parse_key_value(line)
-        else:
-            raise TOMLSyntaxError("Invalid line format - expected section header or key=value pair",
-                                  self.line_number)
-
-    def _parse_section_header(self, line: str) -> None:
+            if kind == PUNCTUATION and text == '[':
+                self._parse_section_header()
+                self._expect_end_of_line("section header")
+            else:
+                self._parse_key_value(token)
+                self._expect_end_of_line("value")
+
+    def _next_token(self) -> Token:
+        token = next(self._tokens)
+        self.line_number = token[2]
+        self.column = token[3]
+        return token
+
+    def _next_significant_token(self) -> Token:
+        """Next token that is not a line break, for multi-line arrays."""
+        token = self._next_token()
+        while token[0] == NEWLINE:
+            token = self._next_token()
+        return token
+
+    def _error(self, message: str) -> TOMLSyntaxError:
+        return TOMLSyntaxError(message, self.line_number, self.column)
+
+    def _expect_end_of_line(self, after: str) -> None:
+        kind = self._next_token()[0]
+        if kind != NEWLINE and kind != EOF:
+            raise self._error(f"Unexpected text after {after}")
+
+    def _parse_section_header(self) -> None:
         """Parse a section header like [section.subsection]."""
-        section_name = line[1:-1].strip()
+        kind, section_name, _, _ = self._next_token()
 
-        if not section_name:
-            raise TOMLSyntaxError("Empty section header", self.line_number)
+        if kind == PUNCTUATION and section_name == ']':
+            raise self._error("Empty section header")
+        if kind != BARE or self._next_token()[1] != ']':
+            raise self._error("Invalid section header - expected [name]")
 
         # Handle nested sections
         parts = [part.strip() for part in section_name.split('.')]
@@ -73,10 +202,12 @@ class TOMLParser:
         # Validate section parts
         for part in parts:
             if not part:
-                raise TOMLSyntaxError("Invalid section name - empty part after splitting by '.'",
-                                      self.line_number)
-            if not self._is_valid_key(part):
-                raise TOMLSyntaxError(f"Invalid section name part: '{part}'", self.line_number)
+                raise self._error("Invalid section name - empty part after splitting by '.'")
+            if not _BARE_KEY_PATTERN.fullmatch(part):
+                raise self._error(f"Invalid section name part: '{part}'")
+
+        if self.interner is not None:
+            parts = [self.interner(part) for part in parts]
 
         # Navigate/create nested structure
         self.current_section = self.data
@@ -84,97 +215,91 @@ class TOMLParser:
             if part not in self.current_section:
                 self.current_section[part] = {}
             elif not isinstance(self.current_section[part], dict):
-                raise TOMLSyntaxError(f"Cannot create section '{part}' - "
-                                      f"key already exists with non-table value", self.line_number)
+                raise self._error(f"Cannot create section '{part}' - key already exists with non-table value")
             self.current_section = self.current_section[part]
 
-    def _parse_key_value(self, line: str) -> None:
-        """Parse a key-value pair."""
-        if line.count('=') == 0:
-            raise TOMLSyntaxError("Missing '=' in key-value pair", self.line_number)
+    def _parse_key_value(self, key_token: Token) -> None:
+        """Parse a key-value pair into the current section."""
+        kind, key, _, _ = key_token
 
-        # Split only on the first '=' to handle values containing '='
-        key, raw_value = line.split('=', 1)
-        key = key.strip()
-        raw_value = raw_value.strip()
+        if kind == PUNCTUATION and key == '=':
+            raise self._error("Missing key before '='")
 
-        # Handle end-of-line comments (basic implementation)
-        # This is a simplified approach - full TOML would need to respect quotes
-        raw_value = self._strip_end_of_line_comment(raw_value)
+        equals_kind, equals_text, _, _ = self._next_token()
+        if equals_kind != PUNCTUATION or equals_text != '=':
+            self.line_number, self.column = key_token[2], key_token[3]
+            raise self._error("Invalid line format - expected section header or key=value pair")
 
-        if not key:
-            raise TOMLSyntaxError("Missing key before '='", self.line_number)
+        self._store(self.current_section, key, key_token)
 
-        if not self._is_valid_key(key):
-            raise TOMLSyntaxError(f"Invalid key format: '{key}'", self.line_number)
+    def _store(self, table: Dict[str, Any], key: str, key_token: Token) -> None:
+        """Validate ``key`` and parse the value following '=' into ``table``."""
+        line_number, column = key_token[2], key_token[3]
 
-        if key in self.current_section:
-            raise TOMLSyntaxError(f"Duplicate key: '{key}'", self.line_number)
+        if key_token[0] != BARE or not _BARE_KEY_PATTERN.fullmatch(key):
+            raise TOMLSyntaxError(f"Invalid key format: '{key}'", line_number, column)
+        if key in table:
+            raise TOMLSyntaxError(f"Duplicate key: '{key}'", line_number, column)
+
+        if self.interner is not None:
+            key = self.interner(key)
 
         try:
-            value = self._parse_value(raw_value)
-            self.current_section[key] = value
+            table[key] = self._parse_value(self._next_token())
+        except TOMLSyntaxError:
+            raise
         except Exception as exc:
-            if isinstance(exc, TOMLSyntaxError):
-                raise
-            raise TOMLSyntaxError(f"Error parsing value for key '{key}': {str(exc)}", self.line_number) from exc
-
-    def _is_valid_key(self, key: str) -> bool:
-        """Check if a key is valid (basic validation)."""
-        if not key:
-            return False
-        # Allow alphanumeric, underscore, hyphen
-        return re.match(r'^[a-zA-Z0-9_-]+$', key) is not None
-
-    def _parse_value(self, value_str: str) -> Any:
-        """Parse a value string into appropriate Python type."""
-        value_str = value_str.strip()
-
-        if not value_str:
-            raise TOMLSyntaxError("Empty value", self.line_number)
-
-        # Boolean values
-        if value_str.lower() == "true":
-            return True
-        if value_str.lower() == "false":
-            return False
-
-        # String values
-        if self._is_string(value_str):
-            return self._parse_string(value_str)
-
-        # Array values
-        if value_str.startswith('[') and value_str.endswith(']'):
-            return self._parse_array(value_str)
-
-        # Numeric values
-        numeric_value = self._try_parse_numeric(value_str)
-        if numeric_value is not None:
-            return numeric_value
-
-        # Date/datetime (basic detection, returned as string)
-        if self._looks_like_datetime(value_str):
-            return value_str
-
-        # Default to string for unrecognized formats
-        return value_str
-
-    def _is_string(self, value_str: str) -> bool:
-        """Check if value appears to be a quoted string."""
-        return (value_str.startswith('"') and value_str.endswith('"')) or \
-            (value_str.startswith("'") and value_str.endswith("'"))
-
-    def _parse_string(self, value_str: str) -> str:
-        """Parse a quoted string value with escape sequence handling."""
-        if len(value_str) < 2:
-            raise TOMLSyntaxError("Invalid string - too short", self.line_number)
-
-        quote_char = value_str[0]
-        if value_str[-1] != quote_char:
-            raise TOMLSyntaxError("Mismatched quotes in string", self.line_number)
-
-        inner = value_str[1:-1]
-        return self._decode_escaped_string(inner, quote_char)
+            raise TOMLSyntaxError(f"Error parsing value for key '{key}': {str(exc)}",
+                                  line_number, column) from exc
+
+    def _parse_value(self, token: Token) -> Any:
+        """Turn the token that starts a value into the Python value."""
+        kind, text, _, _ = token
+
+        if kind == BARE:
+            return self._parse_bare_value(text)
+        if kind == STRING:
+            return self._parse_string(text)
+        if kind == PUNCTUATION:
+            if text == '[':
+                return self._parse_array()
+            if text == '{':
+                return self._parse_inline_table()
+
+        raise self._error("Empty value")
+
+    def _parse_bare_value(self, text: str) -> Union[bool, int, float, DateTimeValue, str]:
+        """Parse an unquoted value: boolean, number, date/time, or else the text itself."""
+        first = text[0]
+
+        if first in 'tTfF':
+            lowered = text.lower()
+            if lowered == 'true':
+                return True
+            if lowered == 'false':
+                return False
+        elif first in '+-.' or first.isdecimal():
+            if _INTEGER_PATTERN.fullmatch(text):
+                return int(text)
+            if _FLOAT_PATTERN.fullmatch(text):
+                return float(text)
+            if self.parse_datetimes:
+                try:
+                    value = parse_toml_datetime(text)
+                except ValueError as exc:
+                    raise self._error(f"Invalid date/time value: '{text}'") from exc
+                if value is not None:
+                    return value
+
+        # Other unrecognized formats are kept as strings
+        return text
+
+    def _parse_string(self, token_text: str) -> str:
+        """Parse a quoted string token with escape sequence handling."""
+        inner = token_text[1:-1]
+        if '\\' not in inner:
+            return inner
+        return self._decode_escaped_string(inner, token_text[0])
 
     def _decode_escaped_string(self, s: str, quote_char: str) -> str:
         """Decode a string with escape sequences."""
@@ -203,128 +328,177 @@ class TOMLParser:
             try:
                 return chr(int(hex_digits, 16)), 6
             except ValueError as exc:
-                raise TOMLSyntaxError(f"Invalid unicode escape sequence: \\u{hex_digits}",
-                                      self.line_number) from exc
+                raise self._error(f"Invalid unicode escape sequence: \\u{hex_digits}") from exc
 
         # Unknown escape sequence
         return '\\' + next_char, 2
 
-    def _parse_array(self, value_str: str) -> List[Any]:
-        """Parse an array value."""
-        inner = value_str[1:-1].strip()
-
-        if not inner:
+    def _parse_array(self) -> List[Any]:
+        """Parse an array after its '['; items may span several lines."""
+        items = []
+
+        while True:
+            token = self._next_significant_token()
+            if token[0] == PUNCTUATION and token[1] == ']':
+                return items
+            if token[0] == EOF:
+                raise self._error("Unterminated array")
+
+            items.append(self._parse_value(token))
+
+            kind, text, _, _ = self._next_significant_token()
+            if kind == PUNCTUATION and text == ']':
+                return items
+            if kind == EOF:
+                raise self._error("Unterminated array")
+            if kind != PUNCTUATION or text != ',':
+                raise self._error("Expected ',' or ']' after array item")
+
+    def _parse_inline_table(self) -> Dict[str, Any]:
+        """Parse an inline table after its '{'; it must fit on one line."""
+        table: Dict[str, Any] = {}
+
+        while True:
+            key_token = self._next_token()
+            kind, key = key_token[0], key_token[1]
+            if kind == PUNCTUATION and key == '}' and not table:
+                return table
+            if kind == NEWLINE or kind == EOF:
+                raise self._error("Unterminated inline table")
+
+            equals_kind, equals_text, _, _ = self._next_token()
+            if equals_kind != PUNCTUATION or equals_text != '=':
+                raise self._error("Expected '=' after inline table key")
+            self._store(table, key, key_token)
+
+            kind, text, _, _ = self._next_token()
+            if kind == PUNCTUATION and text == '}':
+                return table
+            if kind == NEWLINE or kind == EOF:
+                raise self._error("Unterminated inline table")
+            if kind != PUNCTUATION or text != ',':
+                raise self._error("Expected ',' or '}' after inline table value")
+
+
+class LazyTOMLDocument(Mapping):
+    """Read-only mapping over a TOML document whose tables are parsed on demand.
+
+    Creating it only parses the keys above the first section header and
+    records where each top-level table's sections start. A table, including
+    all its ``[table.sub]`` sections, is parsed the first time it is looked
+    up; syntax errors in a table are raised at that point.
+    """
+
+    def __init__(self, toml_str: str, intern_keys: Any = None, parse_datetimes: bool = False):
+        self._interner = resolve_interner(intern_keys)
+        self._parse_datetimes = parse_datetimes
+        self._text: Optional[str] = toml_str
+        self._unloaded: Dict[str, List[Tuple[int, int, int]]] = {}
+
+        sections = _index_toml_sections(toml_str)
+        root_end = sections[0][1] if sections else len(toml_str)
+
+        parser = self._new_parser()
+        parser._parse_text(toml_str[:root_end])
+        self._data: Dict[str, Any] = parser.data
+        self._keys: List[str] = list(parser.data)
+
+        for name, start, end, line_number in sections:
+            if name not in self._unloaded:
+                self._unloaded[name] = []
+                if name not in self._data:
+                    self._keys.append(name)
+            self._unloaded[name].append((start, end, line_number))
+
+        if not self._unloaded:
+            self._text = None
+
+    @property
+    def pending_tables(self) -> List[str]:
+        """Names of the tables that have not been parsed yet."""
+        return list(self._unloaded)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._unloaded:
+            self._load(key)
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data or key in self._unloaded
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"LazyTOMLDocument(keys={self._keys!r}, pending={self.pending_tables!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Parse every remaining table and return a plain dictionary."""
+        return {key: self[key] for key in self._keys}
+
+    def _new_parser(self) -> TOMLParser:
+        return TOMLParser(self._interner, self._parse_datetimes)
+
+    def _load(self, key: str) -> None:
+        parser = self._new_parser()
+        if key in self._data:
+            # A root-level value with the table's name, e.g. an inline table
+            parser.data[key] = self._data[key]
+
+        for start, end, line_number in self._unloaded[key]:
+            parser._parse_text(self._text[start:end], line_number)
+
+        self._data[key] = parser.data[key]
+        del self._unloaded[key]
+        if not self._unloaded:
+            self._text = None
+
+
+def _index_toml_sections(toml_str: str) -> List[Tuple[str, int, int, int]]:
+    """Find section headers without parsing the values between them.
+
+    Returns ``(top_level_name, start, end, line_number)`` per section, or an
+    empty list when the text cannot be split safely, e.g. when a line that
+    looks like a header may sit inside a multi-line array.
+    """
+    sections = []
+    line_number = 1
+    previous = 0
+
+    for match in _HEADER_LINE_PATTERN.finditer(toml_str):
+        name = match.group(1).split('.', 1)[0].strip()
+        if not _BARE_KEY_PATTERN.fullmatch(name):
             return []
 
-        items = self._split_array_items(inner)
-        return [self._parse_value(item) for item in items]
-
-    def _split_array_items(self, array_str: str) -> List[str]:
-        """Split array items, respecting quoted strings."""
-        result = []
-        current_item = ''
-        in_quotes = False
-        quote_char = None
-        bracket_depth = 0
-
-        i = 0
-        while i < len(array_str):
-            char = array_str[i]
-
-            # Handle escape sequences
-            if char == '\\' and i + 1 < len(array_str) and in_quotes:
-                current_item += char + array_str[i + 1]
-                i += 2
-                continue
-
-            # Handle quotes
-            if char in ['"', "'"] and not in_quotes:
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char and in_quotes:
-                in_quotes = False
-                quote_char = None
-
-            # Handle nested brackets
-            if not in_quotes:
-                if char == '[':
-                    bracket_depth += 1
-                elif char == ']':
-                    bracket_depth -= 1
-
-            # Handle comma separation
-            if char == ',' and not in_quotes and bracket_depth == 0:
-                result.append(current_item.strip())
-                current_item = ''
-            else:
-                current_item += char
-
-            i += 1
-
-        if current_item.strip():
-            result.append(current_item.strip())
-
-        if in_quotes:
-            raise TOMLSyntaxError("Unterminated string in array", self.line_number)
-
-        return result
-
-    def _try_parse_numeric(self, value_str: str) -> Union[int, float, None]:
-        """Try to parse a numeric value."""
-        # Integer
-        if re.match(r'^[+-]?\d+$', value_str):
-            return int(value_str)
-
-        # Float
-        if re.match(r'^[+-]?\d*\.\d+([eE][+-]?\d+)?$', value_str):
-            return float(value_str)
-
-        return None
-
-    def _looks_like_datetime(self, value_str: str) -> bool:
-        """Basic check if value looks like a datetime."""
-        try:
-            datetime.fromisoformat(value_str)
-            return True
-        except ValueError:
-            return False
-
-    def _strip_end_of_line_comment(self, value_str: str) -> str:
-        """Strip end-of-line comments while respecting quoted strings."""
-        result = ""
-        in_quotes = False
-        quote_char = None
-        i = 0
-
-        while i < len(value_str):
-            char = value_str[i]
-
-            # Handle escape sequences in quotes
-            if char == '\\' and i + 1 < len(value_str) and in_quotes:
-                result += char + value_str[i + 1]
-                i += 2
-                continue
-
-            # Handle quotes
-            if char in ['"', "'"] and not in_quotes:
-                in_quotes = True
-                quote_char = char
-            elif char == quote_char and in_quotes:
-                in_quotes = False
-                quote_char = None
-
-            # Handle comments outside of quotes
-            if char == '#' and not in_quotes:
-                break  # Stop processing at comment
+        start = match.start()
+        line_number += toml_str.count('\n', previous, start)
+        previous = start
+        sections.append((name, start, match.end(), line_number))
 
-            result += char
-            i += 1
+    ends = [section[1] for section in sections[1:]] + [len(toml_str)]
+    for index, (section, end) in enumerate(zip(sections, ends)):
+        body = toml_str[section[2]:end]
+        if '[' in body or ']' in body:
+            body = _STRING_OR_COMMENT_PATTERN.sub('', body)
+            if body.count('[') != body.count(']'):
+                return []
+        sections[index] = (section[0], section[1], end, section[3])
 
-        return result.strip()
+    return sections
 
 
 # Convenience function
-def parse_toml_string(toml_str: str) -> Dict[str, Any]:
-    """Parse a TOML string and return the resulting dictionary."""
-    parser = TOMLParser()
+def parse_toml_string(toml_str: str, intern_keys: Any = None, parse_datetimes: bool = False,
+                      lazy: bool = False) -> Union[Dict[str, Any], LazyTOMLDocument]:
+    """Parse a TOML string and return the resulting dictionary.
+
+    With ``lazy=True`` a LazyTOMLDocument is returned instead, which parses
+    each top-level table the first time it is accessed.
+    """
+    if lazy:
+        return LazyTOMLDocument(toml_str, intern_keys, parse_datetimes)
+    parser = TOMLParser(intern_keys, parse_datetimes)
     return parser.parse(toml_str)
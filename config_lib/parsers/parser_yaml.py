@@ -1,239 +1,392 @@
 import re
+from copy import deepcopy
 from datetime import datetime
+from functools import lru_cache
+
+from .position import format_location
+from .interning import resolve_interner
 
 
 class YAMLSyntaxError(Exception):
-    def __init__(self, message, line_num):
-        super().__init__(f"YAML Syntax Error on line {line_num}: {message}")
+    def __init__(self, message, line_num, column=None):
+        super().__init__(f"YAML Syntax Error on {format_location(line_num, column)}: {message}")
         self.line_number = line_num
+        self.column = column
 
 
-def parse_yaml_string(yaml_str):
-    lines = yaml_str.splitlines()
-    return _parse_yaml_lines(lines)
+def parse_yaml_string(yaml_str, intern_keys=None, scalar_resolver=None, copy_aliases=False):
+    return parse_yaml_lines(yaml_str.splitlines(), intern_keys=intern_keys, scalar_resolver=scalar_resolver,
+                            copy_aliases=copy_aliases)
 
 
-def _strip_inline_comment(text):
-    result = []
-    in_single_quote = False
-    in_double_quote = False
+def parse_yaml_lines(lines, intern_keys=None, scalar_resolver=None, copy_aliases=False):
+    """Parse a YAML document from an iterable of lines without terminators.
 
-    for char in text:
-        if char == "'" and not in_double_quote:
-            in_single_quote = not in_single_quote
-        elif char == '"' and not in_single_quote:
-            in_double_quote = not in_double_quote
-        elif char == '#' and not in_single_quote and not in_double_quote:
-            break
+    Gives the same result as ``parse_yaml_string`` on the joined text, but
+    the lines are consumed one at a time, so the text never has to be held
+    in memory as a whole.
+    """
+    return _parse_yaml_lines(lines, interner=resolve_interner(intern_keys),
+                             scalar_resolver=scalar_resolver, copy_aliases=copy_aliases)
 
-        result.append(char)
 
-    return ''.join(result).strip()
+def parse_yaml_documents(lines, intern_keys=None, scalar_resolver=None, copy_aliases=False):
+    """Yield each document of a multi-document YAML stream as it completes.
 
+    ``lines`` is any iterable of lines, such as an open file. Documents are
+    separated by ``---`` (or ended by ``...``) and are built directly from
+    the lines, so only the document being parsed is held in memory.
+    Documents without any content are skipped; content on a marker line
+    itself is an error. Error line numbers count from the start of the
+    stream.
+    """
+    interner = resolve_interner(intern_keys)
+    parser = None
 
-def _parse_yaml_scalar(value):
-    value = _strip_inline_comment(value).strip()
-    if value in ('null', 'Null', 'NULL', '~'):
-        return None
-    if value in ('true', 'True'):
-        return True
-    if value in ('false', 'False'):
-        return False
-    if re.match(r'^-?\d+$', value):
-        return int(value)
-    if re.match(r'^-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?$', value):
-        return float(value)
-    if re.match(r'^\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2})?$', value):
-        try:
-            return datetime.fromisoformat(value)
-        except ValueError as exc:
-            raise ValueError(f"Invalid date format: {value}") from exc
-    return value.strip('"').strip("'")
+    for line_number, line in enumerate(lines, 1):
+        line = line.rstrip('\r\n')
 
+        if _is_document_marker(line, line_number):
+            if parser is not None:
+                yield parser.finish()
+                parser = None
+            continue
+        if _should_skip_line(line):
+            continue
 
-def _should_skip_line(line):
-    return not line.strip() or line.lstrip().startswith('#')
+        if parser is None:
+            parser = _YAMLBlockParser(interner, scalar_resolver, copy_aliases)
+        parser.feed_line(line, line_number)
 
+    if parser is not None:
+        yield parser.finish()
 
-def _get_line_indent(line):
-    return len(line) - len(line.lstrip())
 
+def _is_document_marker(line, line_number):
+    if not (line.startswith('---') or line.startswith('...')):
+        return False
+    if len(line) > 3 and line[3] not in ' \t#':
+        return False
 
-def _validate_indentation(current_indent, expected_indent, indent, line,
-                          line_number):
-    if expected_indent is not None and current_indent != indent and current_indent > 0:
-        if current_indent != expected_indent:
-            if line.lstrip().startswith('age:'):
-                raise YAMLSyntaxError(
-                    f"Inconsistent indentation. Expected {expected_indent} spaces, got {current_indent}",
-                    line_number - 1)
-            raise YAMLSyntaxError(
-                f"Inconsistent indentation. Expected {expected_indent} spaces, got {current_indent}",
-                line_number)
+    # A document starting on its marker line ('--- value') is not supported
+    rest = line[3:].lstrip()
+    if rest and not rest.startswith('#'):
+        raise YAMLSyntaxError(f"Unexpected content after document marker '{line[:3]}'", line_number,
+                              len(line) - len(rest) + 1)
+    return True
 
 
-def _collect_nested_lines(lines, start_index, min_indent):
-    sub_lines = []
-    index = start_index
+def _strip_inline_comment(text):
+    result = []
+    in_single_quote = False
+    in_double_quote = False
 
-    while index < len(lines):
-        sub_line = lines[index]
-        sub_indent = _get_line_indent(sub_line)
-        if sub_indent <= min_indent:
+    for char in text:
+        if char == "'" and not in_double_quote:
+            in_single_quote = not in_single_quote
+        elif char == '"' and not in_single_quote:
+            in_double_quote = not in_double_quote
+        elif char == '#' and not in_single_quote and not in_double_quote:
             break
-        sub_lines.append(sub_line)
-        index += 1
-
-    return sub_lines, index
-
-
-def _parse_list_item_with_key_value(item_line, current_indent, lines, index,
-                                    base_index):
-    key_part, value_part = item_line.split(':', 1)
-    key = key_part.strip()
-    value = value_part.strip()
-    item_dict = {}
-    line_number = base_index + index + 1
-    current_item_indent = current_indent + 2
-
-    if not key:
-        raise YAMLSyntaxError("Empty key in list item", line_number)
-
-    if value:
-        item_dict[key] = _parse_yaml_scalar(value)
-    else:
-        sub_lines, new_index = _collect_nested_lines(lines, index + 1,
-                                                     current_indent)
-        if sub_lines:
-            item_dict[key] = _parse_yaml_lines(sub_lines, current_item_indent,
-                                               base_index + index + 1)
-        index = new_index - 1
-
-    sub_lines, new_index = _collect_nested_lines(lines, index + 1,
-                                                 current_indent)
-    if sub_lines:
-        nested_dict = _parse_yaml_lines(sub_lines, current_item_indent,
-                                        base_index + index + 1)
-        if isinstance(nested_dict, dict):
-            item_dict.update(nested_dict)
-
-    return item_dict, new_index - 1
-
-
-def _parse_list_item(line, current_indent, lines, index, base_index, result):
-    line_number = base_index + index + 1
-
-    if result is None:
-        result = []
-    if not isinstance(result, list):
-        raise YAMLSyntaxError("Mixed list and dict structures are not allowed",
-                              line_number)
-
-    item_line = line.lstrip()[2:]
-    current_item_indent = current_indent + 2
 
-    if ':' in item_line:
-        item_dict, new_index = _parse_list_item_with_key_value(
-            item_line, current_indent, lines, index, base_index)
-        result.append(item_dict)
-        return result, new_index
-    if item_line == '':
-        sub_lines, new_index = _collect_nested_lines(lines, index + 1,
-                                                     current_indent)
-        nested_value = _parse_yaml_lines(sub_lines, current_item_indent,
-                                         base_index + index + 1)
-        result.append(nested_value)
-        return result, new_index - 1
-    result.append(_parse_yaml_scalar(item_line))
-
-    return result, index
-
-
-def _split_key_value(line, line_number):
-    parts = line.lstrip().split(':', 1)
-    if len(parts) != 2:
-        raise YAMLSyntaxError("Invalid key-value pair (missing colon)", line_number)
-
-    key_part, value_part = parts
-    key = key_part.strip()
-    value = value_part.strip()
+        result.append(char)
 
-    if not key:
-        raise YAMLSyntaxError("Empty key", line_number)
+    return ''.join(result).strip()
 
-    return key, value
 
+_KEYWORDS = {
+    'null': None, 'Null': None, 'NULL': None, '~': None,
+    'true': True, 'True': True,
+    'false': False, 'False': False
+}
+_INT_PATTERN = re.compile(r'-?\d+')
+_FLOAT_PATTERN = re.compile(r'-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?')
+_DATETIME_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}(?:[ T]\d{2}:\d{2}:\d{2})?')
 
-def _parse_nested_value_for_key(lines, index, current_indent, base_index):
-    sub_lines, new_index = _collect_nested_lines(lines, index + 1, current_indent)
-    value = _parse_yaml_lines(sub_lines, current_indent + 2, base_index + index + 1)
-    return value, new_index
+_ANCHOR_PATTERN = re.compile(r'&([^\s,\[\]{}]+)\s*')
+_ALIAS_PATTERN = re.compile(r'\*([^\s,\[\]{}]+)(?:\s+#.*)?')
+_MERGE_KEY = '<<'
 
+_QUOTES = ('"', "'")
 
-def _parse_key_value_pair(line, current_indent, lines, index, base_index, result):
-    line_number = base_index + index + 1
+DEFAULT_SCALAR_CACHE_SIZE = 4096
 
-    if result is None:
-        result = {}
-    if not isinstance(result, dict):
-        raise YAMLSyntaxError("Mixed list and dict structures are not allowed", line_number)
 
-    key, value = _split_key_value(line, line_number)
+class YAMLScalarResolver:
+    """Turn the text of a YAML scalar into a Python value.
 
-    if value == '':
-        nested_value, new_index = _parse_nested_value_for_key(lines, index, current_indent, base_index)
-        result[key] = nested_value
-        return result, new_index - 1
+    Results are kept in an LRU of ``cache_size`` entries, so text repeated
+    across documents (``true``, ``INFO``, ``localhost``) is resolved once.
+    With ``parse_datetimes=False`` dates and timestamps stay strings.
+    """
 
-    result[key] = _parse_yaml_scalar(value)
-    return result, index
+    def __init__(self, parse_datetimes=True, cache_size=DEFAULT_SCALAR_CACHE_SIZE):
+        self.parse_datetimes = parse_datetimes
+        if cache_size:
+            self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+        else:
+            self.resolve = self._resolve
 
+    def cache_clear(self):
+        if hasattr(self.resolve, 'cache_clear'):
+            self.resolve.cache_clear()
 
-def _is_list_item(line):
-    return line.lstrip().startswith('- ')
+    def _resolve(self, value):
+        if '#' in value:
+            value = _strip_inline_comment(value)
+        else:
+            value = value.strip()
+        if not value:
+            return value
 
+        if value in _KEYWORDS:
+            return _KEYWORDS[value]
 
-def _is_key_value_pair(line):
-    return ':' in line and not _is_list_item(line)
+        first = value[0]
+        if first == '-' or first.isdecimal():
+            if _INT_PATTERN.fullmatch(value):
+                return int(value)
+            if _FLOAT_PATTERN.fullmatch(value):
+                return float(value)
+            if self.parse_datetimes and _DATETIME_PATTERN.fullmatch(value):
+                try:
+                    return datetime.fromisoformat(value)
+                except ValueError as exc:
+                    raise ValueError(f"Invalid date format: {value}") from exc
 
+        if first in _QUOTES or value[-1] in _QUOTES:
+            return value.strip('"').strip("'")
+        return value
 
-def _process_yaml_line(line, current_indent, lines, index, base_index, result, expected_indent):
-    line_number = base_index + index + 1
 
-    if _is_list_item(line):
-        return _parse_list_item(line, current_indent, lines, index, base_index, result), expected_indent
+default_scalar_resolver = YAMLScalarResolver()
 
-    elif _is_key_value_pair(line):
-        if result is None:
-            expected_indent = current_indent + 2
-        return _parse_key_value_pair(line, current_indent, lines, index, base_index, result), expected_indent
 
-    raise YAMLSyntaxError("Invalid line format", line_number)
+def _parse_yaml_scalar(value):
+    return default_scalar_resolver.resolve(value)
 
 
-def _parse_yaml_lines(lines, indent=0, base_index=0):
-    result = None
-    index = 0
-    expected_indent = None
+def _should_skip_line(line):
+    return not line.strip() or line.lstrip().startswith('#')
 
-    while index < len(lines):
-        line = lines[index]
-        line_number = base_index + index + 1
 
+class _Block:
+    # An open mapping or sequence: the column its entries start at and the
+    # slot of the parent collection that receives it once its type is known.
+    __slots__ = ('indent', 'container', 'parent', 'key', 'anchor')
+
+    def __init__(self, indent, parent=None, key=None, anchor=None):
+        self.indent = indent
+        self.container = None
+        self.parent = parent
+        self.key = key
+        self.anchor = anchor
+
+
+def _store(parent, key, value):
+    if isinstance(parent, list):
+        parent.append(value)
+    elif parent is not None:
+        parent[key] = value
+
+
+class _YAMLBlockParser:
+    """Single forward pass over block-style YAML lines.
+
+    Open collections are kept on an explicit stack of indentation levels, so
+    each line is looked at once regardless of how deeply it is nested.
+    An alias evaluates to the very object built for its anchor, unless
+    ``copy_aliases`` asks for an independent deep copy.
+    """
+
+    def __init__(self, interner=None, scalar_resolver=None, copy_aliases=False):
+        self._stack = []
+        self._pending = None
+        self._anchors = {}
+        self._copy_aliases = copy_aliases
+        self._last_line_number = None
+        self._interner = interner
+        self._resolve_scalar = (scalar_resolver or default_scalar_resolver).resolve
+
+    def feed_line(self, line, line_number):
+        content = line.lstrip()
+        indent = len(line) - len(content)
+
+        self._align(indent, line_number)
+        self._parse_content(content, indent, line_number)
+        self._last_line_number = line_number
+
+    def finish(self):
+        self._resolve_pending_as_empty()
+        if not self._stack or self._stack[0].container is None:
+            return {}
+        return self._stack[0].container
+
+    def _resolve_pending_as_empty(self):
+        if self._pending is not None:
+            parent, key, _, anchor = self._pending
+            self._pending = None
+            value = {}
+            _store(parent, key, value)
+            if anchor is not None:
+                self._anchors[anchor] = value
+
+    def _align(self, indent, line_number):
+        stack = self._stack
+
+        if self._pending is not None:
+            parent, key, owner_indent, anchor = self._pending
+            if indent > owner_indent:
+                # The line opens the nested collection of a 'key:' or '- '
+                self._pending = None
+                stack.append(_Block(indent, parent, key, anchor))
+                return
+            self._resolve_pending_as_empty()
+
+        if not stack:
+            stack.append(_Block(indent))
+            return
+
+        closed_indent = None
+        while stack and indent < stack[-1].indent:
+            closed_indent = stack.pop().indent
+
+        if stack and indent == stack[-1].indent:
+            return
+
+        if closed_indent is None:
+            raise YAMLSyntaxError(
+                f"Inconsistent indentation. Expected {stack[-1].indent} spaces, got {indent}",
+                line_number, indent + 1)
+        # The dedent does not return to any open level, so the block it
+        # leaves is reported as ending on its last line.
+        raise YAMLSyntaxError(
+            f"Inconsistent indentation. Expected {closed_indent} spaces, got {indent}",
+            self._last_line_number)
+
+    def _container(self, block, kind, indent, line_number):
+        container = block.container
+        if container is None:
+            container = kind()
+            block.container = container
+            _store(block.parent, block.key, container)
+            if block.anchor is not None:
+                self._anchors[block.anchor] = container
+        elif type(container) is not kind:
+            raise YAMLSyntaxError("Mixed list and dict structures are not allowed", line_number, indent + 1)
+        return container
+
+    def _parse_content(self, content, indent, line_number):
+        block = self._stack[-1]
+        in_list_item = False
+
+        while content.startswith('- '):
+            sequence = self._container(block, list, indent, line_number)
+            rest = content[2:]
+            item = rest.lstrip()
+            item_column = indent + 3 + len(rest) - len(item)
+            anchor = None
+            if item.startswith('&'):
+                anchor, item, item_column = self._split_anchor(item, line_number, item_column)
+
+            if not item:
+                self._pending = (sequence, None, indent, anchor)
+                return
+            if not item.startswith('- ') and ':' not in item:
+                sequence.append(self._node(item, anchor, line_number, item_column))
+                return
+
+            # A nested collection starts on the same line as its dash
+            indent += 2 + len(rest) - len(item)
+            block = _Block(indent, sequence, anchor=anchor)
+            self._stack.append(block)
+            content = item
+            in_list_item = True
+
+        if ':' not in content:
+            raise YAMLSyntaxError("Invalid line format", line_number, indent + 1)
+
+        mapping = self._container(block, dict, indent, line_number)
+        key_part, value_part = content.split(':', 1)
+        key = key_part.strip()
+        value = value_part.strip()
+        value_column = indent + len(content) - len(value_part.lstrip()) + 1
+
+        if not key:
+            raise YAMLSyntaxError("Empty key in list item" if in_list_item else "Empty key",
+                                  line_number, indent + 1)
+        if key == _MERGE_KEY and value:
+            self._merge(mapping, value, line_number, value_column)
+            return
+        if self._interner is not None:
+            key = self._interner(key)
+
+        anchor = None
+        if value.startswith('&'):
+            anchor, value, value_column = self._split_anchor(value, line_number, value_column)
+
+        if value:
+            mapping[key] = self._node(value, anchor, line_number, value_column)
+        else:
+            self._pending = (mapping, key, indent, anchor)
+
+    @staticmethod
+    def _split_anchor(text, line_number, column):
+        match = _ANCHOR_PATTERN.match(text)
+        if match is None:
+            raise YAMLSyntaxError("Invalid anchor", line_number, column)
+        rest = text[match.end():]
+        # An anchor followed only by a comment anchors the nested block
+        return match.group(1), '' if rest.startswith('#') else rest, column + match.end()
+
+    def _node(self, text, anchor, line_number, column):
+        if text.startswith('*'):
+            value = self._alias(text, line_number, column)
+        else:
+            value = self._resolve_scalar(text)
+        if anchor is not None:
+            self._anchors[anchor] = value
+        return value
+
+    def _alias(self, text, line_number, column):
+        match = _ALIAS_PATTERN.fullmatch(text.rstrip())
+        if match is None:
+            raise YAMLSyntaxError(f"Invalid alias '{text.strip()}'", line_number, column)
+
+        name = match.group(1)
+        if name not in self._anchors:
+            raise YAMLSyntaxError(f"Unknown alias '*{name}'", line_number, column)
+
+        value = self._anchors[name]
+        return deepcopy(value) if self._copy_aliases else value
+
+    def _merge(self, mapping, text, line_number, column):
+        text = _strip_inline_comment(text)
+        if text.startswith('[') and text.endswith(']'):
+            aliases = []
+            offset = 1
+            for part in text[1:-1].split(','):
+                aliases.append((part.strip(), column + offset + len(part) - len(part.lstrip())))
+                offset += len(part) + 1
+        else:
+            aliases = [(text, column)]
+
+        # Keys set explicitly, and keys from earlier sources, take precedence
+        for alias, alias_column in aliases:
+            source = self._alias(alias, line_number, alias_column)
+            if not isinstance(source, dict):
+                raise YAMLSyntaxError("Merge key '<<' expects aliases of mappings", line_number, alias_column)
+            for key, value in source.items():
+                if key not in mapping:
+                    mapping[key] = value
+
+
+def _parse_yaml_lines(lines, base_index=0, interner=None, scalar_resolver=None, copy_aliases=False):
+    parser = _YAMLBlockParser(interner, scalar_resolver, copy_aliases)
+
+    for index, line in enumerate(lines):
         if _should_skip_line(line):
-            index += 1
             continue
+        parser.feed_line(line, base_index + index + 1)
 
-        current_indent = _get_line_indent(line)
-        _validate_indentation(current_indent, expected_indent, indent, line, line_number)
-
-        if current_indent < indent:
-            break
-
-        (result, index), expected_indent = _process_yaml_line(
-            line, current_indent, lines, index, base_index, result, expected_indent
-        )
-
-        index += 1
-
-    return result if result is not None else {}
+    return parser.finish()
@@ -0,0 +1,91 @@
+import re
+
+from .parser_yaml import _parse_yaml_lines, _should_skip_line
+from .interning import resolve_interner
+
+
+# A newline followed by a top-level key; the literal prefix keeps the scan fast
+_BLOCK_START = re.compile(r'\n(?=[^\s#-])')
+# Anchors and aliases tie top-level blocks together, so such documents are
+# always parsed as a whole.
+_ANCHOR_OR_ALIAS = re.compile(r'(?:^|[\s\[,])[&*][^\s,\[\]{}]', re.M)
+# Line breaks other than '\n' that str.splitlines also honours
+_OTHER_LINE_BREAKS = '\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+
+
+class YAMLDocument:
+    """A parsed YAML mapping that can be re-parsed incrementally.
+
+    ``update`` splits the new text into top-level blocks (a key at column 0
+    and the lines below it) and parses only the blocks whose text changed;
+    the sub-dicts built for unchanged blocks are reused as they are. The
+    result always equals a full ``parse_yaml_string`` of the text. Values
+    are shared between versions, so treat ``data`` as read-only.
+    """
+
+    def __init__(self, text='', intern_keys=None, scalar_resolver=None):
+        self._interner = resolve_interner(intern_keys)
+        self._scalar_resolver = scalar_resolver
+        self._blocks = {}
+        self.data = {}
+        self.text = ''
+        self.reparsed_blocks = 0
+        self.update(text)
+
+    def update(self, new_text):
+        blocks = _split_top_level_blocks(new_text)
+
+        if blocks is None:
+            data = self._parse(new_text, 0)
+            parsed = {}
+            reparsed = 1
+        else:
+            data = {}
+            parsed = {}
+            reparsed = 0
+            for line_index, block_text in blocks:
+                result = parsed.get(block_text)
+                if result is None:
+                    result = self._blocks.get(block_text)
+                if result is None:
+                    result = self._parse(block_text, line_index)
+                    reparsed += 1
+                parsed[block_text] = result
+                data.update(result)
+
+        # Only commit once the whole text has parsed
+        self._blocks = parsed
+        self.data = data
+        self.text = new_text
+        self.reparsed_blocks = reparsed
+        return data
+
+    def _parse(self, text, base_index):
+        return _parse_yaml_lines(text.splitlines(), base_index=base_index, interner=self._interner,
+                                 scalar_resolver=self._scalar_resolver)
+
+
+def _split_top_level_blocks(text):
+    """Return ``(first_line_index, text)`` per top-level block, or None if the
+    text does not start with a top-level key and must be parsed whole."""
+    if any(char in text for char in _OTHER_LINE_BREAKS):
+        return None
+    if '\r' in text and text.count('\r') != text.count('\r\n'):
+        return None
+    if ('&' in text or '*' in text) and _ANCHOR_OR_ALIAS.search(text):
+        return None
+
+    starts = [match.end() for match in _BLOCK_START.finditer(text)]
+    if text and not text[0].isspace() and text[0] not in '#-':
+        starts.insert(0, 0)
+    if not starts or not all(_should_skip_line(line) for line in text[:starts[0]].splitlines()):
+        return None
+
+    blocks = []
+    line_index = 0
+    previous = 0
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        line_index += text.count('\n', previous, start)
+        previous = start
+        blocks.append((line_index, text[start:end]))
+    return blocks
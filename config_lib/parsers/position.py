@@ -0,0 +1,45 @@
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Resolve character offsets in a source text to 1-based (line, column) pairs.
+
+    The newline offset table is built on the first lookup only, so parsers can
+    create an index up front and pay for it just when an error is reported.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self._line_starts = None
+
+    def _build(self):
+        line_starts = [0]
+        find = self.text.find
+        newline = find('\n')
+
+        while newline != -1:
+            line_starts.append(newline + 1)
+            newline = find('\n', newline + 1)
+
+        self._line_starts = line_starts
+
+    def locate(self, offset):
+        if self._line_starts is None:
+            self._build()
+
+        line_index = bisect_right(self._line_starts, offset) - 1
+        return line_index + 1, offset - self._line_starts[line_index] + 1
+
+    def line_number(self, offset):
+        return self.locate(offset)[0]
+
+
+def get_indent_column(line):
+    """Column of the first non-whitespace character of a raw source line."""
+    return len(line) - len(line.lstrip()) + 1
+
+
+def format_location(line_num, column=None):
+    if column is None:
+        return f"line {line_num}"
+    return f"line {line_num}, column {column}"
@@ -0,0 +1,98 @@
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+# ASCII bytes that text mode or str.splitlines() treat differently from
+# bytes.splitlines(): carriage returns (universal newlines) and the control
+# characters that str also counts as line breaks or whitespace.
+_TEXT_ONLY_BYTES = (b'\r', b'\x0b', b'\x0c', b'\x1c', b'\x1d', b'\x1e', b'\x1f')
+
+# Files are read with plain reads rather than memory-mapped: a mapped file
+# that is truncated while it is read (by save_config_to_file, which rewrites
+# in place, or by a deploy) kills the process with SIGBUS. A short read
+# merely ends the input.
+
+
+def read_text(file_path):
+    """Return the UTF-8 text of ``file_path`` with universal newlines.
+
+    The file is read as bytes and decoded in one step, without the newline
+    translation pass of a text-mode ``read()``. The result is the same as
+    ``open(file_path, encoding='utf-8').read()``.
+    """
+    with open(file_path, 'rb') as f:
+        text = str(f.read(), 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def iter_file_blocks(file_path, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield the content of ``file_path`` in ``bytes`` blocks that end at a line break.
+
+    Blocks are about ``block_size`` long, or longer when a single line is;
+    only one block is held in memory at a time. The last block may lack
+    its line break.
+    """
+    with open(file_path, 'rb') as f:
+        # Pieces of the line that the previous chunks ended in
+        parts = []
+        while True:
+            chunk = f.read(block_size)
+            if not chunk:
+                break
+            cut = chunk.rfind(b'\n') + 1
+            if cut == 0:
+                parts.append(chunk)
+                continue
+            parts.append(chunk[:cut])
+            yield b''.join(parts) if len(parts) > 1 else parts[0]
+            parts = [chunk[cut:]] if cut < len(chunk) else []
+        if parts:
+            yield b''.join(parts)
+
+
+def iter_line_blocks(buffer, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield ``bytes`` blocks of about ``block_size`` that end at a line break.
+
+    ``buffer`` is any object with ``find``, ``rfind`` and slicing, such as
+    ``bytes``. Only one block is copied out of it at a time.
+    """
+    size = len(buffer)
+    start = 0
+    while start < size:
+        end = start + block_size
+        if end >= size:
+            end = size
+        else:
+            # Cut after the last \n of the block, or after the first one past
+            # it when a single line is longer than the block
+            cut = buffer.rfind(b'\n', start, end)
+            if cut == -1:
+                cut = buffer.find(b'\n', end)
+            end = size if cut == -1 else cut + 1
+        yield buffer[start:end]
+        start = end
+
+
+def split_block_lines(blocks, decode=False):
+    """Yield the lines of UTF-8 ``blocks`` as text mode and ``str.splitlines()`` would.
+
+    ``blocks`` is an iterable of ``bytes`` that each end at a line break,
+    as from ``iter_file_blocks``. Blocks of plain ASCII are split as
+    ``bytes`` and their lines yielded as ``bytes`` (or decoded, with
+    ``decode=True``), so a caller can scan them before deciding what to
+    decode. Any other block is decoded and split as ``str``, which keeps
+    line numbers and the handling of ``\\r``, form feeds and Unicode line
+    breaks identical to reading the file in text mode.
+    """
+    for block in blocks:
+        if not block.isascii() or any(byte in block for byte in _TEXT_ONLY_BYTES):
+            yield from block.decode('utf-8').splitlines()
+        elif decode:
+            yield from block.decode('ascii').splitlines()
+        else:
+            yield from block.splitlines()
+
+
+def split_buffer_lines(buffer, decode=False, block_size=DEFAULT_BLOCK_SIZE):
+    """``split_block_lines`` for the blocks of one ``bytes``-like buffer."""
+    return split_block_lines(iter_line_blocks(buffer, block_size), decode=decode)
@@ -0,0 +1,49 @@
+from collections.abc import Mapping
+
+
+def build_selection(paths):
+    """Turn selection paths into a nested lookup tree.
+
+    Each path is either a dotted string (``"network.retries"``) or a sequence
+    of keys. In the returned tree a ``None`` leaf means "the whole subtree".
+    A shorter path wins over any longer path that it covers.
+    """
+    selection = {}
+
+    for path in paths:
+        parts = path.split('.') if isinstance(path, str) else list(path)
+        if not parts or any(not part for part in parts):
+            raise ValueError(f"Invalid selection path: {path!r}")
+
+        node = selection
+        for part in parts[:-1]:
+            if part in node and node[part] is None:
+                break
+            node = node.setdefault(part, {})
+        else:
+            node[parts[-1]] = None
+
+    return selection
+
+
+def apply_selection(data, selection):
+    """Keep only the selected paths of an already parsed mapping.
+
+    Values are only looked up for selected keys, so lazy mappings parse
+    just the selected parts.
+    """
+    if selection is None or not isinstance(data, Mapping):
+        return data
+
+    result = {}
+    for key in data:
+        if key not in selection:
+            continue
+        value = data[key]
+        rule = selection[key]
+        if rule is None:
+            result[key] = value
+        elif isinstance(value, Mapping):
+            result[key] = apply_selection(value, rule)
+
+    return result
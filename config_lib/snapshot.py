@@ -0,0 +1,191 @@
+import hashlib
+import io
+import os
+import pickle
+import stat
+import struct
+
+from .loader import load_config
+
+MAGIC = b"CFGC"
+VERSION = 1
+SNAPSHOT_EXTENSION = ".cfgc"
+
+# Flag bits of the header
+_VALIDATED = 1
+
+# magic, version, flags, source size, source mtime_ns, source digest, source path length
+_HEADER = struct.Struct(">4sBBqq32sH")
+_MTIME = struct.Struct(">q")
+_MTIME_OFFSET = struct.calcsize(">4sBBq")
+
+# Temporary snapshots are created with this mode, which the umask then narrows
+_TEMP_FLAGS = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+
+# The only classes a snapshot may contain besides the built-in containers
+_ALLOWED_CLASSES = {
+    ("datetime", "datetime"),
+    ("datetime", "date"),
+    ("datetime", "time"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone"),
+}
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def compile_snapshot(source_path, output_path=None, validate=False, schema=None):
+    """Parse ``source_path`` and write the result as a binary snapshot.
+
+    The snapshot goes to ``output_path`` (by default the source path with a
+    ``.cfgc`` extension) and records the source's size, mtime and content
+    hash, so that ``load_config`` can tell when it is stale. With
+    ``validate=True`` the config is first checked against ``schema``
+    (``DEFAULT_SCHEMA`` if not given). Returns the parsed config.
+    """
+    if output_path is None:
+        output_path = os.path.splitext(source_path)[0] + SNAPSHOT_EXTENSION
+
+    config, source_stat, digest = _parse_source(source_path)
+    if validate:
+        from .schema import DEFAULT_SCHEMA
+        from .validator import ConfigValidator
+        ConfigValidator(schema or DEFAULT_SCHEMA).validate(config)
+
+    _write_snapshot(output_path, source_path, config, source_stat, digest, _VALIDATED if validate else 0)
+    return config
+
+
+def load_snapshot(file_path, intern_keys=None):
+    """Read a snapshot written by ``compile_snapshot`` with one bulk read.
+
+    If the source file the snapshot was compiled from still exists and its
+    content has changed, the source is parsed instead and the snapshot is
+    rebuilt (best effort: a read-only snapshot is left as it is). A
+    snapshot deployed without its source is used as is. ``intern_keys`` is
+    accepted for compatibility with the other parsers and has no effect.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError as exc:
+        raise RuntimeError(f"Error reading snapshot: {exc}") from exc
+
+    if len(data) < _HEADER.size:
+        raise SnapshotError(f"Not a config snapshot: {file_path}")
+    magic, version, flags, size, mtime_ns, digest, path_length = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError(f"Not a config snapshot: {file_path}")
+    if version != VERSION:
+        raise SnapshotError(f"Unsupported snapshot version {version}: {file_path}")
+
+    offset = _HEADER.size + path_length
+    source_reference = data[_HEADER.size:offset].decode("utf-8")
+    source_path = os.path.join(os.path.dirname(os.path.abspath(file_path)), source_reference)
+
+    if _source_changed(source_path, file_path, size, mtime_ns, digest):
+        return _rebuild_snapshot(source_path, file_path)
+
+    stream = io.BytesIO(data)
+    stream.seek(offset)
+    try:
+        return _SnapshotUnpickler(stream).load()
+    except (pickle.UnpicklingError, EOFError, ValueError) as exc:
+        raise SnapshotError(f"Corrupt config snapshot {file_path}: {exc}") from exc
+
+
+def _parse_source(source_path):
+    with open(source_path, "rb") as f:
+        source_stat = os.fstat(f.fileno())
+        digest = hashlib.blake2b(f.read(), digest_size=32).digest()
+    return load_config(source_path), source_stat, digest
+
+
+def _write_snapshot(output_path, source_path, config, source_stat, digest, flags):
+    source_reference = _relative_source_path(source_path, output_path).encode("utf-8")
+    header = _HEADER.pack(MAGIC, VERSION, flags, source_stat.st_size, source_stat.st_mtime_ns,
+                          digest, len(source_reference))
+    payload = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Write next to the target and rename, so readers never see half a snapshot
+    fd, temp_path = _create_temp_file(output_path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(source_reference)
+            f.write(payload)
+        # A new snapshot keeps the umask-narrowed mode it was created with;
+        # a replaced one keeps its own
+        try:
+            os.chmod(temp_path, stat.S_IMODE(os.stat(output_path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _create_temp_file(output_path):
+    directory, name = os.path.split(os.path.abspath(output_path))
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(temp_path, _TEMP_FLAGS, 0o666), temp_path
+        except FileExistsError:
+            continue
+
+
+def _rebuild_snapshot(source_path, snapshot_path):
+    # Rebuilt snapshots are not validated: the schema used at compile time
+    # is not known here.
+    config, source_stat, digest = _parse_source(source_path)
+    try:
+        _write_snapshot(snapshot_path, source_path, config, source_stat, digest, 0)
+    except OSError:
+        # Read-only deployments still get the fresh config
+        pass
+    return config
+
+
+def _source_changed(source_path, snapshot_path, size, mtime_ns, digest):
+    try:
+        source_stat = os.stat(source_path)
+    except OSError:
+        return False
+
+    # Unchanged size and mtime: trust the snapshot without reading the source
+    if (source_stat.st_size, source_stat.st_mtime_ns) == (size, mtime_ns):
+        return False
+
+    with open(source_path, "rb") as f:
+        source_stat = os.fstat(f.fileno())
+        if hashlib.blake2b(f.read(), digest_size=32).digest() != digest:
+            return True
+
+    # Touched but unchanged: record the new mtime so later loads skip the hash
+    try:
+        with open(snapshot_path, "r+b") as f:
+            f.seek(_MTIME_OFFSET)
+            f.write(_MTIME.pack(source_stat.st_mtime_ns))
+    except OSError:
+        pass
+    return False
+
+
+def _relative_source_path(source_path, output_path):
+    source_path = os.path.abspath(source_path)
+    try:
+        return os.path.relpath(source_path, os.path.dirname(os.path.abspath(output_path)))
+    except ValueError:
+        # Different drives on Windows
+        return source_path
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        if (module, name) not in _ALLOWED_CLASSES:
+            raise pickle.UnpicklingError(f"Snapshot may not contain {module}.{name}")
+        return super().find_class(module, name)
@@ -46,3 +46,81 @@ def mask_secrets(config: dict, secret_fields: list[str], mask: str = "***") -> d
         return mask if path in secret_fields else value
 
     return _mask(config)
+
+
+LIST_STRATEGIES = ("replace", "append", "merge")
+
+
+def merge_layers(layers, list_strategy="replace"):
+    """Merge config layers in order, each one overriding the ones before it.
+
+    Dicts are merged key by key; any other value replaces the earlier one,
+    except that two lists are combined according to ``list_strategy``:
+
+    - ``"replace"``: the later list replaces the earlier one (the default);
+    - ``"append"``: the earlier items followed by the later ones;
+    - ``"merge"``: item by item, merging dicts at the same index and
+      keeping the extra items of the longer list.
+
+    ``list_strategy`` may also map dotted key paths (``"server.hosts"``) to
+    strategies, with ``"replace"`` for the lists it does not name.
+
+    Subtrees a later layer does not change are shared with the layer they
+    come from, and only the dicts on the path to an overridden key are
+    copied. Copy the result before changing it in place if the layers must
+    stay untouched.
+    """
+    strategies = list_strategy.values() if isinstance(list_strategy, dict) else [list_strategy]
+    for strategy in strategies:
+        if strategy not in LIST_STRATEGIES:
+            raise ValueError(f"Unknown list strategy: {strategy!r}. Expected one of {', '.join(LIST_STRATEGIES)}")
+
+    # Key paths are only built when lists are merged per path
+    path = "" if isinstance(list_strategy, dict) else None
+    merged = None
+    for layer in layers:
+        merged = layer if merged is None else _merge_values(merged, layer, list_strategy, path)
+    return {} if merged is None else merged
+
+
+def _merge_values(base, overlay, list_strategy, path):
+    if isinstance(base, dict) and isinstance(overlay, dict):
+        return _merge_dicts(base, overlay, list_strategy, path)
+    if isinstance(base, list) and isinstance(overlay, list):
+        return _merge_lists(base, overlay, list_strategy, path)
+    return overlay
+
+
+def _merge_dicts(base, overlay, list_strategy, path):
+    merged = None
+
+    for key, value in overlay.items():
+        if key in base:
+            current = base[key]
+            child_path = None if path is None else (f"{path}.{key}" if path else key)
+            value = _merge_values(current, value, list_strategy, child_path)
+            if value is current or _same_scalar(value, current):
+                continue
+
+        # Copy this dict only once something in it actually changes
+        if merged is None:
+            merged = base.copy()
+        merged[key] = value
+
+    return base if merged is None else merged
+
+
+def _merge_lists(base, overlay, list_strategy, path):
+    strategy = list_strategy.get(path, "replace") if isinstance(list_strategy, dict) else list_strategy
+
+    if strategy == "append":
+        return base + overlay
+    if strategy == "merge":
+        merged = [_merge_values(current, value, list_strategy, path) for current, value in zip(base, overlay)]
+        return merged + (base[len(overlay):] if len(base) > len(overlay) else overlay[len(base):])
+    return overlay
+
+
+def _same_scalar(value, current):
+    return (type(value) is type(current) and not isinstance(value, (dict, list))
+            and value == current)
@@ -1,26 +1,20 @@
 import os
-from .writers.writer_json import serialize_json
-from .writers.writer_yaml import serialize_yaml
-from .writers.writer_toml import serialize_toml
-from .writers.writer_ini import serialize_ini
+from .formats import format_for_extension, get_format
 
 
-def save_config_to_file(config: dict, file_path: str):
+def save_config_to_file(config: dict, file_path: str, file_format: str = None):
     ext = os.path.splitext(file_path)[1].lower()
+    config_format = get_format(file_format) if file_format is not None else format_for_extension(file_path)
+    if config_format is None or config_format.writer is None:
+        raise ValueError(f"Failed to serialize config to {ext}: Unsupported file format: {ext}")
+    name = file_format or ext
 
     try:
-        if ext == ".json":
-            content = serialize_json(config)
-        elif ext in [".yaml", ".yml"]:
-            content = "\n".join(serialize_yaml(config))
-        elif ext == ".toml":
-            content = "\n".join(serialize_toml(config))
-        elif ext == ".ini":
-            content = "\n".join(serialize_ini(config))
-        else:
-            raise ValueError(f"Unsupported file format: {ext}")
+        content = config_format.get_writer()(config)
+        if not isinstance(content, str):
+            content = "\n".join(content)
     except (TypeError, ValueError) as exc:
-        raise ValueError(f"Failed to serialize config to {ext}: {exc}") from exc
+        raise ValueError(f"Failed to serialize config to {name}: {exc}") from exc
 
     try:
         with open(file_path, "w", encoding="utf-8") as f:
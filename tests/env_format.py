@@ -0,0 +1,10 @@
+"""A minimal KEY=value format used to test the format registry."""
+
+
+def parse_env(file_path, intern_keys=None):
+    with open(file_path, encoding="utf-8") as f:
+        return dict(line.rstrip("\n").split("=", 1) for line in f if line.strip())
+
+
+def serialize_env(config):
+    return [f"{key}={value}" for key, value in config.items()]
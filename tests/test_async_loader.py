@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config_lib import async_loader
+from config_lib.async_loader import AsyncConfigManager, load_config_async
+
+
+def write_large_ini(path, sections=20000, keys=10):
+    with open(path, "w", encoding="utf-8") as f:
+        for section in range(sections):
+            f.write(f"[service{section}]\n")
+            for key in range(keys):
+                f.write(f"description{key} = {'x' * 80} {section}\n")
+
+
+def test_event_loop_stays_responsive_during_large_load(tmp_path):
+    path = tmp_path / "large.ini"
+    write_large_ini(path)
+    assert path.stat().st_size > 20_000_000
+
+    async def main():
+        gaps = []
+        loading = True
+
+        async def heartbeat():
+            last = time.perf_counter()
+            while loading:
+                await asyncio.sleep(0.001)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        beat = asyncio.create_task(heartbeat())
+        start = time.perf_counter()
+        config = await load_config_async(str(path))
+        elapsed = time.perf_counter() - start
+        loading = False
+        await beat
+        return config, elapsed, gaps
+
+    config, elapsed, gaps = asyncio.run(main())
+
+    assert len(config) == 20000
+    assert len(gaps) >= 10
+    assert max(gaps) < elapsed / 2
+
+
+def test_concurrent_loads_of_one_path_are_coalesced(tmp_path, monkeypatch):
+    path = tmp_path / "app.json"
+    path.write_text('{"a": {"b": 1}}', encoding="utf-8")
+    calls = []
+    release = threading.Event()
+    real_load_config = async_loader.load_config
+
+    def slow_load_config(*args, **kwargs):
+        calls.append(args)
+        release.wait(5)
+        return real_load_config(*args, **kwargs)
+
+    monkeypatch.setattr(async_loader, "load_config", slow_load_config)
+
+    async def main():
+        tasks = [asyncio.create_task(load_config_async(str(path))) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(result == {"a": {"b": 1}} for result in results)
+    assert len({id(result) for result in results}) == 5
+
+
+def test_coalesced_callers_do_not_share_results(tmp_path, monkeypatch):
+    path = tmp_path / "app.json"
+    path.write_text('{"a": {"b": 1}}', encoding="utf-8")
+    release = threading.Event()
+    real_load_config = async_loader.load_config
+
+    def slow_load_config(*args, **kwargs):
+        release.wait(5)
+        return real_load_config(*args, **kwargs)
+
+    monkeypatch.setattr(async_loader, "load_config", slow_load_config)
+
+    async def mutate_first():
+        config = await load_config_async(str(path))
+        config["a"]["b"] = "MUTATED"
+        return config
+
+    async def main():
+        first = asyncio.create_task(mutate_first())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(load_config_async(str(path)))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await first, await second
+
+    first, second = asyncio.run(main())
+
+    assert first == {"a": {"b": "MUTATED"}}
+    assert second == {"a": {"b": 1}}
+
+
+def test_different_options_are_loaded_separately(tmp_path):
+    path = tmp_path / "app.json"
+    path.write_text('{"a": 1, "b": 2}', encoding="utf-8")
+
+    async def main():
+        return await asyncio.gather(load_config_async(str(path)),
+                                    load_config_async(str(path), select=["a"]))
+
+    assert asyncio.run(main()) == [{"a": 1, "b": 2}, {"a": 1}]
+
+
+def test_errors_reach_every_waiter(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"a": }', encoding="utf-8")
+
+    async def main():
+        return await asyncio.gather(load_config_async(str(path)), load_config_async(str(path)),
+                                    return_exceptions=True)
+
+    assert all(isinstance(result, Exception) for result in asyncio.run(main()))
+
+
+def test_async_config_manager(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text("network:\n  retries: 3\n", encoding="utf-8")
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await AsyncConfigManager.from_file(str(path), executor=executor)
+
+    manager = asyncio.run(main())
+    assert manager.get_config() == {"network": {"retries": 3}}
+    assert manager.file_path == str(path)
+
+
+def test_async_config_manager_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(AsyncConfigManager.from_file(str(tmp_path / "missing.json")))
+
+
+def test_async_config_manager_parse_error(tmp_path):
+    path = tmp_path / "broken.json"
+    path.write_text('{"a": }', encoding="utf-8")
+    with pytest.raises(RuntimeError, match="Parse error from"):
+        asyncio.run(AsyncConfigManager.from_file(str(path)))
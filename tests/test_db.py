@@ -1,6 +1,10 @@
+import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import MagicMock, patch
 from pymongo import errors
+from config_lib import ConfigManager
 from config_lib.db import MongoDBHandler
 
 
@@ -90,5 +94,28 @@ class TestMongoDBHandler(unittest.TestCase):
         self.assertIn("MongoDB delete error", str(cm.exception))
 
 
+class TestLazyMongoDBImport(unittest.TestCase):
+    def test_package_import_does_not_import_pymongo(self):
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = "import sys, config_lib; print('pymongo' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                                cwd=repo_root)
+        self.assertEqual(result.stdout.strip(), "False")
+
+    def test_config_manager_imports_handler_on_use(self):
+        manager = ConfigManager()
+        manager.config = {"a": 1}
+        with patch("config_lib.db.MongoClient") as mock_client:
+            collection = mock_client.return_value.__getitem__.return_value.__getitem__.return_value
+            collection.update_one.return_value = MagicMock(upserted_id="1", modified_count=0)
+            manager.save_to_db("config1", "mongodb://test", "testdb")
+
+        collection.update_one.assert_called_once()
+
+    def test_handler_is_still_exported(self):
+        import config_lib
+        self.assertIs(config_lib.MongoDBHandler, MongoDBHandler)
+
+
 if __name__ == "__main__":
     unittest.main()
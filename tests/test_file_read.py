@@ -0,0 +1,127 @@
+import pytest
+
+from config_lib.parser import parse_ini, parse_json, parse_toml, parse_yaml
+from config_lib.parsers.reading import (
+    iter_file_blocks, iter_line_blocks, read_text, split_block_lines, split_buffer_lines,
+)
+from config_lib.parsers.parser_ini import INISyntaxError, INIValueResolver, parse_ini_bytes, parse_ini_string
+
+
+def text_mode_lines(data):
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n").splitlines()
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"a\nb\n",
+    b"a\r\nb\rc",
+    b"a\r\r\nb\n\n",
+    b"k = caf\xc3\xa9\nl\x0cm\n",
+    b"x\xe2\x80\xa8y\n\x1fz\n",
+])
+@pytest.mark.parametrize("block_size", [1, 3, 1 << 20])
+def test_split_buffer_lines_matches_text_mode(data, block_size):
+    expected = text_mode_lines(data)
+    lines = [line if isinstance(line, str) else line.decode()
+             for line in split_buffer_lines(data, block_size=block_size)]
+    assert lines == expected
+    assert list(split_buffer_lines(data, decode=True, block_size=block_size)) == expected
+
+
+def test_blocks_end_at_line_breaks():
+    data = b"short\n" + b"x" * 50 + b"\nend"
+    blocks = list(iter_line_blocks(data, block_size=8))
+    assert b"".join(blocks) == data
+    assert all(block.endswith(b"\n") for block in blocks[:-1])
+
+
+@pytest.mark.parametrize("block_size", [1, 4, 1 << 20])
+def test_file_blocks_end_at_line_breaks(tmp_path, block_size):
+    data = b"short\r\n" + b"x" * 50 + b"\nk = caf\xc3\xa9\nend"
+    path = tmp_path / "app.ini"
+    path.write_bytes(data)
+
+    blocks = list(iter_file_blocks(str(path), block_size=block_size))
+
+    assert b"".join(blocks) == data
+    assert all(block.endswith(b"\n") for block in blocks[:-1])
+    assert list(split_block_lines(blocks, decode=True)) == text_mode_lines(data)
+
+
+def test_file_truncated_while_read_ends_the_input(tmp_path):
+    path = tmp_path / "app.ini"
+    data = b"[a]\nk = 1\n" * 100_000
+    path.write_bytes(data)
+
+    blocks = iter_file_blocks(str(path), block_size=64)
+    first = next(blocks)
+    with open(path, "r+b") as f:
+        f.truncate(100)
+
+    read = first + b"".join(blocks)
+    assert len(read) < len(data)
+    assert data.startswith(read)
+
+
+def test_read_text(tmp_path):
+    path = tmp_path / "app.json"
+    path.write_bytes(b'{"a":\r\n 1}\r')
+    assert read_text(str(path)) == '{"a":\n 1}\n'
+
+    path.write_bytes(b"")
+    assert read_text(str(path)) == ""
+
+
+def test_parse_ini_bytes_decodes_like_text():
+    data = "; comment\n[server]\nhost = café.local\r\nport = 8080\n[server.tls]\nenabled = true\n".encode()
+    assert parse_ini_bytes(data) == parse_ini_string(data.decode())
+
+
+def test_parse_ini_bytes_error_positions():
+    with pytest.raises(INISyntaxError) as bytes_error:
+        parse_ini_bytes(b"[a]\n   broken line\n")
+    with pytest.raises(INISyntaxError) as text_error:
+        parse_ini_string("[a]\n   broken line\n")
+    assert (bytes_error.value.line_num, bytes_error.value.column) == (2, 4)
+    assert str(bytes_error.value) == str(text_error.value)
+
+
+def test_parse_ini_bytes_with_value_resolver():
+    resolver = INIValueResolver({"server": {"port": int, "name": str}})
+    assert parse_ini_bytes(b"[server]\nport = 80\nname = 42\n", value_resolver=resolver) == {
+        "server": {"port": 80, "name": "42"}}
+    with pytest.raises(INISyntaxError) as error:
+        parse_ini_bytes(b"[server]\nport =  eighty\n", value_resolver=resolver)
+    assert (error.value.line_num, error.value.column) == (2, 9)
+
+
+def test_parse_functions_read_crlf_files(tmp_path):
+    files = {
+        "app.json": '{"name": "api",\r\n "ports": [80, 443]}\r\n',
+        "app.yaml": "name: api\r\nports:\r\n  - 80\r\n  - 443\r\n",
+        "app.toml": 'name = "api"\r\nports = [80, 443]\r\n',
+        "app.ini": "name = api\r\nports = 80, 443\r\n",
+    }
+    for name, text in files.items():
+        (tmp_path / name).write_bytes(text.encode())
+
+    expected = {"name": "api", "ports": [80, 443]}
+    assert parse_json(str(tmp_path / "app.json")) == expected
+    assert parse_yaml(str(tmp_path / "app.yaml")) == expected
+    assert parse_toml(str(tmp_path / "app.toml")) == expected
+    assert parse_ini(str(tmp_path / "app.ini")) == {"name": "api", "ports": ["80", "443"]}
+
+
+def test_parse_functions_read_empty_files(tmp_path):
+    for name in ("app.yaml", "app.toml", "app.ini"):
+        (tmp_path / name).write_bytes(b"")
+    assert parse_yaml(str(tmp_path / "app.yaml")) == {}
+    assert parse_toml(str(tmp_path / "app.toml")) == {}
+    assert parse_ini(str(tmp_path / "app.ini")) == {}
+
+
+def test_invalid_utf8_is_reported(tmp_path):
+    path = tmp_path / "app.ini"
+    path.write_bytes(b"name = \xff\n")
+    with pytest.raises(RuntimeError, match="Error reading INI"):
+        parse_ini(str(path))
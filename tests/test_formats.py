@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from config_lib import formats
+from config_lib.formats import ConfigFormat, detect_format, get_format, register_format, sniff_format
+from config_lib.loader import load_config
+from config_lib.writer import save_config_to_file
+
+
+@pytest.mark.parametrize("head, expected", [
+    (b'{"a": 1}', "json"),
+    (b'\xef\xbb\xbf[1, 2]', "json"),
+    (b'["a"]\n', "json"),
+    (b'# app\nname: app\nports:\n  - 80\n', "yaml"),
+    (b'---\nkind: Service\n', "yaml"),
+    (b'[server]\nhost = "example.com"\nport = 80\n', "toml"),
+    (b'ports = [\n  80,\n  443,\n]\n[[servers]]\nname = "a"\n', "toml"),
+    (b'[server]\nhost = example.com\nport = 80\n', "ini"),
+    (b'; comment\nurl = http://example.com:80/\n', "ini"),
+    (b'[alpha]\n[beta]\n', "ini"),
+    (b'[1, 2]\n', "json"),
+    (b'[[1, 2], [3]]\n', "json"),
+])
+def test_sniff_format(head, expected):
+    assert sniff_format(head).name == expected
+
+
+def test_sniff_format_unknown_content():
+    assert sniff_format(b"just some text") is None
+
+
+def test_extension_wins_over_content(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    assert detect_format(str(path)).name == "yaml"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a": {"b": 1}}', {"a": {"b": 1}}),
+    ("a:\n  b: 1\n", {"a": {"b": 1}}),
+    ('[a]\nb = 1\nc = "x"\n', {"a": {"b": 1, "c": "x"}}),
+    ("[a]\nb = 1\nc = x, y\n", {"a": {"b": 1, "c": ["x", "y"]}}),
+])
+def test_load_extensionless_file(tmp_path, text, expected):
+    path = tmp_path / "config"
+    path.write_text(text, encoding="utf-8")
+    assert load_config(str(path)) == expected
+
+
+def test_load_unsupported_content(tmp_path):
+    path = tmp_path / "config"
+    path.write_text("just some text", encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        load_config(str(path))
+
+
+def test_load_sections_without_keys(tmp_path):
+    path = tmp_path / "config"
+    path.write_text("[alpha]\n\n[beta]\n", encoding="utf-8")
+    assert load_config(str(path)) == {"alpha": {}, "beta": {}}
+
+
+def test_load_missing_file_with_unknown_extension(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        load_config(str(tmp_path / "missing.conf"))
+
+
+def test_load_with_explicit_format(tmp_path):
+    path = tmp_path / "config.txt"
+    path.write_text("[a]\nb = 1\n", encoding="utf-8")
+    assert load_config(str(path), file_format="ini") == {"a": {"b": 1}}
+
+
+def test_unknown_format_name():
+    with pytest.raises(ValueError, match="Unknown config format: xml"):
+        get_format("xml")
+
+
+def test_registered_format_is_imported_on_first_use(tmp_path, monkeypatch):
+    monkeypatch.setattr(formats, "_FORMATS", dict(formats._FORMATS))
+    monkeypatch.setattr(formats, "_EXTENSIONS", dict(formats._EXTENSIONS))
+    register_format(ConfigFormat(
+        "env", (".env",),
+        parser="tests.env_format:parse_env",
+        writer="tests.env_format:serialize_env",
+    ))
+    assert "tests.env_format" not in sys.modules
+
+    path = tmp_path / "app.env"
+    save_config_to_file({"HOST": "localhost", "PORT": "80"}, str(path))
+    assert path.read_text(encoding="utf-8") == "HOST=localhost\nPORT=80"
+    assert load_config(str(path)) == {"HOST": "localhost", "PORT": "80"}
+
+
+def test_loading_json_does_not_import_other_parsers(tmp_path):
+    path = tmp_path / "app.json"
+    path.write_text('{"a": 1}', encoding="utf-8")
+    script = (
+        "import sys\n"
+        "from config_lib.loader import load_config\n"
+        f"assert load_config({str(path)!r}) == {{'a': 1}}\n"
+        "print(sorted(name for name in sys.modules if name.startswith('config_lib.parsers.')))\n"
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                            cwd=repo_root).stdout
+
+    assert "config_lib.parsers.parser_json" in output
+    for name in ("parser_yaml", "parser_toml", "parser_ini"):
+        assert name not in output
@@ -0,0 +1,77 @@
+import io
+
+import pytest
+from config_lib.parser import iter_ini_sections, process_ini_sections
+from config_lib.parsers.parser_ini import INISyntaxError, parse_ini_sections
+
+INVENTORY = """\
+owner = ops
+; hosts
+[hosts.web1]
+ip = 10.0.0.1
+roles = web, cache
+
+[hosts.web2]
+ip = 10.0.0.2
+
+[empty]
+[hosts.web1]
+port = 8080
+"""
+
+
+def test_parse_ini_sections_yields_each_section():
+    assert list(parse_ini_sections(io.StringIO(INVENTORY))) == [
+        ((), {"owner": "ops"}),
+        (("hosts", "web1"), {"ip": "10.0.0.1", "roles": ["web", "cache"]}),
+        (("hosts", "web2"), {"ip": "10.0.0.2"}),
+        (("empty",), {}),
+        (("hosts", "web1"), {"port": 8080}),
+    ]
+
+
+def test_parse_ini_sections_is_lazy():
+    lines_read = []
+
+    def lines():
+        for line in io.StringIO("[a]\nx = 1\n[b]\ny = 2\n[c]\n"):
+            lines_read.append(line)
+            yield line
+
+    sections = parse_ini_sections(lines())
+    assert next(sections) == (("a",), {"x": 1})
+    assert len(lines_read) == 3
+    assert next(sections) == (("b",), {"y": 2})
+    assert len(lines_read) == 5
+
+
+def test_parse_ini_sections_without_root_keys():
+    assert list(parse_ini_sections(["[a]", "k = v"])) == [(("a",), {"k": "v"})]
+    assert list(parse_ini_sections([])) == []
+
+
+def test_parse_ini_sections_error_line_number():
+    sections = parse_ini_sections(["[a]", "k = 1", "[b]", "broken line"])
+    assert next(sections) == (("a",), {"k": 1})
+    with pytest.raises(INISyntaxError) as exc_info:
+        next(sections)
+    assert exc_info.value.line_num == 4
+
+
+def test_iter_ini_sections_from_path(tmp_path):
+    file_path = tmp_path / "inventory.ini"
+    file_path.write_text(INVENTORY, encoding="utf-8")
+    paths = [section_path for section_path, _ in iter_ini_sections(str(file_path))]
+    assert paths == [(), ("hosts", "web1"), ("hosts", "web2"), ("empty",), ("hosts", "web1")]
+
+
+def test_iter_ini_sections_missing_file(tmp_path):
+    with pytest.raises(RuntimeError, match="Error reading INI"):
+        list(iter_ini_sections(str(tmp_path / "missing.ini")))
+
+
+def test_process_ini_sections_callback():
+    seen = []
+    count = process_ini_sections(io.StringIO(INVENTORY), lambda path, values: seen.append((path, len(values))))
+    assert count == 5
+    assert seen[1] == (("hosts", "web1"), 2)
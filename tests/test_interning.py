@@ -0,0 +1,90 @@
+import unittest
+
+from config_lib.parsers.interning import KeyInterner, resolve_interner, default_key_interner
+from config_lib.parsers.parser_json import parse_json_string
+from config_lib.parsers.parser_json_stream import parse_json_stream
+from config_lib.parsers.parser_yaml import parse_yaml_string
+from config_lib.parsers.parser_toml import parse_toml_string
+from config_lib.parsers.parser_ini import parse_ini_string
+
+
+def fresh_key(text):
+    # Build an equal but distinct str object
+    return ''.join(list(text))
+
+
+class TestKeyInterner(unittest.TestCase):
+    def test_returns_shared_object(self):
+        interner = KeyInterner()
+        first = interner(fresh_key("host"))
+        second = interner(fresh_key("host"))
+        self.assertIs(first, second)
+        self.assertEqual(len(interner), 1)
+
+    def test_table_is_bounded(self):
+        interner = KeyInterner(max_size=2)
+        interner("a")
+        interner("b")
+        key = fresh_key("cc")
+        self.assertIs(interner(key), key)
+        self.assertEqual(len(interner), 2)
+
+    def test_clear(self):
+        interner = KeyInterner()
+        interner("a")
+        interner.clear()
+        self.assertEqual(len(interner), 0)
+
+    def test_resolve_interner(self):
+        interner = KeyInterner()
+        self.assertIsNone(resolve_interner(None))
+        self.assertIsNone(resolve_interner(False))
+        self.assertIs(resolve_interner(True), default_key_interner)
+        self.assertIs(resolve_interner(interner), interner)
+
+
+class TestParsersShareKeys(unittest.TestCase):
+    def assert_keys_shared(self, first, second):
+        for key_a, key_b in zip(first, second):
+            self.assertEqual(key_a, key_b)
+            self.assertIs(key_a, key_b)
+
+    def test_json(self):
+        interner = KeyInterner()
+        first = parse_json_string('{"host": "a", "port": 1}', intern_keys=interner)
+        second = parse_json_string('{"host": "b", "port": 2}', intern_keys=interner)
+        self.assert_keys_shared(first, second)
+
+    def test_json_stream(self):
+        interner = KeyInterner()
+        first = parse_json_stream(['{"host": "a",', ' "port": 1}'], intern_keys=interner)
+        second = parse_json_stream(['{"host": "b", "port": 2}'], intern_keys=interner)
+        self.assert_keys_shared(first, second)
+
+    def test_yaml(self):
+        interner = KeyInterner()
+        first = parse_yaml_string("db:\n  host: a\n  port: 1\n", intern_keys=interner)
+        second = parse_yaml_string("db:\n  host: b\n  port: 2\n", intern_keys=interner)
+        self.assert_keys_shared(first, second)
+        self.assert_keys_shared(first["db"], second["db"])
+
+    def test_toml(self):
+        interner = KeyInterner()
+        first = parse_toml_string("[db]\nhost = \"a\"\nport = 1\n", intern_keys=interner)
+        second = parse_toml_string("[db]\nhost = \"b\"\nport = 2\n", intern_keys=interner)
+        self.assert_keys_shared(first, second)
+        self.assert_keys_shared(first["db"], second["db"])
+
+    def test_ini(self):
+        interner = KeyInterner()
+        first = parse_ini_string("[db.main]\nhost = a\nport = 1\n", intern_keys=interner)
+        second = parse_ini_string("[db.main]\nhost = b\nport = 2\n", intern_keys=interner)
+        self.assert_keys_shared(first["db"], second["db"])
+        self.assert_keys_shared(first["db"]["main"], second["db"]["main"])
+
+    def test_without_interning_results_are_unchanged(self):
+        self.assertEqual(parse_json_string('{"a": {"b": 1}}', intern_keys=True), {"a": {"b": 1}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+import glob
+import os
+import random
+
+import pytest
+from config_lib.parser import parse_json
+from config_lib.parsers.parser_json import (
+    parse_json_string,
+    parse_json_with_engine,
+    decode_json_fast,
+    JSONSyntaxError,
+)
+from config_lib.parsers.interning import KeyInterner
+
+EXAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "example")
+
+# Valid documents from the parser test suite, plus a few extra edge cases.
+VALID_CORPUS = [
+    '{}',
+    '[]',
+    'true',
+    'false',
+    'null',
+    '{"key": "value"}',
+    '{ \n"key"\t:\r"value"\n }',
+    '[1, 2, 3]',
+    '[1, "2", 3]',
+    '[ \n1,\t2,\r3 \n]',
+    '[1, "text", null, true, false]',
+    r'"He said: \"Hi!\""',
+    r'"string with \"quotes\" and \\backslash"',
+    r'"C:\\\\path\\\\to\\\\file"',
+    r'"https:\/\/example.com"',
+    r'"a\b"',
+    r'"a\f"',
+    r'"line1\nline2"',
+    r'"a\rb"',
+    r'"a\tb"',
+    '"\\u041f\\u0440\\u0438\\u0432\\u0456\\u0442"',
+    '"\\u00F6\\u00E4\\u00FC"',
+    '"\\b\\f\\n\\r\\t"',
+    r'"\ud83d\ude00 and a lone \ud83d surrogate"',
+    '123',
+    '-468',
+    '999999999',
+    '0',
+    '-0',
+    '-2147483648',
+    '123456789012345678901234567890',
+    '3.14',
+    '-15.96',
+    '0.0',
+    '123.456',
+    '-99759.9549',
+    '1e10',
+    '2.5E-5',
+    '-3.14e+2',
+    '1e3',
+    '5E-1',
+    '{"outer": {"inner": 123}}',
+    '{"a": {"b": {"c": {"d": {"e": {"f": {"g": 42}}}}}}}',
+    '{"config": {"version": 1, "settings": {"features": ["a", "b", "c"], "enabled": true}}}',
+    '[{"id": 1}, {"id": 2}, {"id": 3}]',
+    '{"name": "Alice", "age": 30, "height": 1.65, "isStudent": false, '
+    '"skills": ["Python", "C++"], "extra": null}',
+    '{"a": 1, "a": 2, "b": 3}',
+    '{"a": {"b": "}]"}, "c": ["[{", "\\\\"]}',
+    '[[[[[]]]], {}]',
+]
+
+INVALID_CORPUS = [
+    '{"key": value"}',
+    '{"key": "value}',
+    '{"key": "value", d"another": 2}',
+    '+-1',
+    '1e',
+    '0123',
+    '1.2.3',
+    '12.',
+    '-12.',
+    '.16',
+    '-.16',
+    '[1, 2, 3',
+    '[1; 2]',
+    '{"numbers": [1, 2, 3}',
+    '{"key": "value"',
+    '{"a": 1; "b": 2}',
+    '{key": "value"}',
+    '{"key: "value"}',
+    '{"key" "value"}',
+    r'"bad\escape"',
+    r'"\u12"',
+    r'"\uZZZZ"',
+    '{"a": NaN}',
+    '[Infinity]',
+    '{\n"a": 1,\n"b": \n[2,3,4}}',
+]
+
+# Inputs that only the pure-Python parser accepts; ``auto`` must fall back to it.
+LENIENT_CORPUS = [
+    '',
+    '   \n',
+    '[1, 2,]',
+    '{"a": 1,}',
+    '42 trailing',
+    '+5',
+]
+
+
+def assert_identical(first, second):
+    assert type(first) is type(second), (first, second)
+    if isinstance(first, dict):
+        assert list(first) == list(second)
+        for key in first:
+            assert_identical(first[key], second[key])
+    elif isinstance(first, list):
+        assert len(first) == len(second)
+        for item_a, item_b in zip(first, second):
+            assert_identical(item_a, item_b)
+    else:
+        assert first == second
+
+
+def random_document(rng, depth=0):
+    choice = rng.random()
+    if depth > 4 or choice < 0.4:
+        return rng.choice([0, -7, 10 ** 20, 2.5, -1e-7, 1e300, "", "text", "ü€\n\"\\", True, False, None])
+    if choice < 0.7:
+        return [random_document(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"key{rng.randint(0, 9)}": random_document(rng, depth + 1) for _ in range(rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize("document", VALID_CORPUS)
+def test_engines_agree_on_valid_corpus(document):
+    strict = parse_json_string(document)
+    assert_identical(decode_json_fast(document), strict)
+    for engine in ("auto", "fast", "strict"):
+        assert_identical(parse_json_with_engine(document, engine), strict)
+
+
+@pytest.mark.parametrize("path", sorted(glob.glob(os.path.join(EXAMPLE_DIR, "*.json"))))
+def test_engines_agree_on_example_files(path):
+    results = [parse_json(path, engine=engine) for engine in ("auto", "fast", "strict")]
+    for result in results[1:]:
+        assert_identical(result, results[0])
+
+
+def test_engines_agree_on_generated_documents():
+    import json
+
+    rng = random.Random(7)
+    for _ in range(500):
+        text = json.dumps(random_document(rng), indent=rng.choice([None, 2]), ensure_ascii=rng.random() < 0.5)
+        assert_identical(decode_json_fast(text), parse_json_string(text))
+
+
+@pytest.mark.parametrize("document", INVALID_CORPUS)
+def test_auto_engine_reports_strict_errors(document):
+    with pytest.raises(JSONSyntaxError) as strict_error:
+        parse_json_with_engine(document, "strict")
+    with pytest.raises(JSONSyntaxError) as auto_error:
+        parse_json_with_engine(document, "auto")
+    assert str(auto_error.value) == str(strict_error.value)
+
+
+@pytest.mark.parametrize("document", INVALID_CORPUS)
+def test_fast_engine_raises_syntax_errors(document):
+    with pytest.raises(JSONSyntaxError):
+        parse_json_with_engine(document, "fast")
+
+
+@pytest.mark.parametrize("document", LENIENT_CORPUS)
+def test_auto_engine_falls_back_for_lenient_input(document):
+    assert_identical(parse_json_with_engine(document, "auto"), parse_json_string(document))
+
+
+def test_fast_engine_error_has_position():
+    with pytest.raises(JSONSyntaxError, match="line 2, column 6") as exc_info:
+        parse_json_with_engine('{"a": 1,\n "b" 2}', "fast")
+    assert exc_info.value.line_number == 2
+
+
+def test_engines_share_interned_keys():
+    interner = KeyInterner()
+    fast = parse_json_with_engine('{"host": {"port": 1}}', "fast", intern_keys=interner)
+    strict = parse_json_with_engine('{"host": {"port": 2}}', "strict", intern_keys=interner)
+    assert list(fast)[0] is list(strict)[0]
+    assert list(fast["host"])[0] is list(strict["host"])[0]
+
+
+def test_selection_uses_strict_engine():
+    assert parse_json_with_engine('{"a": 1, "b": 2}', "fast", select=["b"]) == {"b": 2}
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError, match="Unknown JSON engine"):
+        parse_json_with_engine('{}', "turbo")
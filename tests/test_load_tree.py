@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from config_lib.loader import load_config_tree
+from config_lib.snapshot import compile_snapshot
+
+
+@pytest.fixture
+def config_tree(tmp_path):
+    files = {
+        "app.json": '{"name": "app"}',
+        "services/api.yaml": "name: api\nport: 8080\n",
+        "services/worker.toml": '[queue]\nname = "jobs"\n',
+        "legacy/old.ini": "[db]\nport = 5432\n",
+        "legacy/broken.json": '{"name": }',
+        "notes.txt": "not a config",
+    }
+    for name, text in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_config_tree(config_tree, workers):
+    results = load_config_tree(config_tree, workers=workers)
+
+    assert sorted(os.path.relpath(path, config_tree) for path in results) == [
+        "app.json",
+        os.path.join("legacy", "broken.json"),
+        os.path.join("legacy", "old.ini"),
+        os.path.join("services", "api.yaml"),
+        os.path.join("services", "worker.toml"),
+    ]
+
+    assert results[str(config_tree / "app.json")].config == {"name": "app"}
+    assert results[str(config_tree / "services" / "api.yaml")].config == {"name": "api", "port": 8080}
+    assert results[str(config_tree / "legacy" / "old.ini")].config == {"db": {"port": 5432}}
+
+    broken = results[str(config_tree / "legacy" / "broken.json")]
+    assert broken.config is None
+    assert broken.error.startswith("JSONSyntaxError: ")
+
+    assert all(result.seconds >= 0 for result in results.values())
+
+
+def test_load_config_tree_pattern_and_options(config_tree):
+    results = load_config_tree(config_tree, pattern="services/*.yaml", workers=1, select=["port"])
+    assert {path: result.config for path, result in results.items()} == {
+        str(config_tree / "services" / "api.yaml"): {"port": 8080},
+    }
+
+
+def test_load_config_tree_skips_snapshots_by_default(config_tree):
+    source = config_tree / "services" / "api.yaml"
+    snapshot = config_tree / "services" / "api.cfgc"
+    compile_snapshot(str(source), str(snapshot))
+    before = snapshot.read_bytes()
+
+    results = load_config_tree(config_tree, workers=1)
+
+    assert str(source) in results
+    assert str(snapshot) not in results
+    assert snapshot.read_bytes() == before
+
+    results = load_config_tree(config_tree, pattern="**/*.cfgc", workers=1)
+    assert results[str(snapshot)].config == {"name": "api", "port": 8080}
+
+
+def test_load_config_tree_missing_root(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_config_tree(tmp_path / "missing")
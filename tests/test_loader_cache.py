@@ -0,0 +1,178 @@
+import os
+
+import pytest
+
+from config_lib import loader
+from config_lib.loader import ConfigCache, load_config
+from config_lib.parsers.parser_toml import LazyTOMLDocument
+
+
+@pytest.fixture(autouse=True)
+def no_racy_window(monkeypatch):
+    # Files written by the tests are always "recent"; trust their mtime
+    monkeypatch.setattr(loader, "_RACY_WINDOW_NS", 0)
+
+
+def write(path, text, mtime_ns=None):
+    path.write_text(text, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_repeated_loads_hit_the_cache(tmp_path):
+    path = tmp_path / "app.json"
+    write(path, '{"a": {"b": 1}}')
+    cache = ConfigCache()
+
+    assert load_config(str(path), cache=cache) == {"a": {"b": 1}}
+    assert load_config(str(path), cache=cache) == {"a": {"b": 1}}
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.currsize) == (1, 1, 1)
+
+
+def test_results_are_copies(tmp_path):
+    path = tmp_path / "app.yaml"
+    write(path, "a:\n  b: 1\n")
+    cache = ConfigCache()
+
+    first = load_config(str(path), cache=cache)
+    first["a"]["b"] = 2
+
+    assert load_config(str(path), cache=cache) == {"a": {"b": 1}}
+
+
+def test_frozen_results_are_shared_and_read_only(tmp_path):
+    path = tmp_path / "app.json"
+    write(path, '{"a": {"b": [1, 2]}}')
+    cache = ConfigCache(frozen=True)
+
+    first = load_config(str(path), cache=cache)
+    assert load_config(str(path), cache=cache) is first
+    assert first["a"]["b"] == (1, 2)
+    with pytest.raises(TypeError):
+        first["a"]["b"] = 3
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = tmp_path / "app.ini"
+    write(path, "[a]\nb = 1\n", mtime_ns=1_000_000_000)
+    cache = ConfigCache()
+    load_config(str(path), cache=cache)
+
+    write(path, "[a]\nb = 22\n", mtime_ns=2_000_000_000)
+
+    assert load_config(str(path), cache=cache) == {"a": {"b": 22}}
+    assert cache.stats().misses == 2
+
+
+def test_touched_file_with_same_content_is_a_content_hit(tmp_path):
+    path = tmp_path / "app.toml"
+    write(path, "[a]\nb = 1\n", mtime_ns=1_000_000_000)
+    cache = ConfigCache()
+    load_config(str(path), cache=cache)
+
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+
+    assert load_config(str(path), cache=cache) == {"a": {"b": 1}}
+    stats = cache.stats()
+    assert (stats.content_hits, stats.misses) == (1, 1)
+
+
+def test_racy_entries_are_checked_by_content(tmp_path, monkeypatch):
+    monkeypatch.setattr(loader, "_RACY_WINDOW_NS", 10 ** 30)
+    path = tmp_path / "app.json"
+    write(path, '{"a": 1}', mtime_ns=1_000_000_000)
+    cache = ConfigCache()
+    load_config(str(path), cache=cache)
+
+    # Same size and mtime: only the content tells the versions apart
+    write(path, '{"a": 2}', mtime_ns=1_000_000_000)
+
+    assert load_config(str(path), cache=cache) == {"a": 2}
+
+
+def test_load_options_are_cached_separately(tmp_path):
+    path = tmp_path / "app.json"
+    write(path, '{"a": 1, "b": 2}')
+    cache = ConfigCache()
+
+    assert load_config(str(path), cache=cache) == {"a": 1, "b": 2}
+    assert load_config(str(path), select=["a"], cache=cache) == {"a": 1}
+    assert cache.stats().currsize == 2
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ConfigCache(max_entries=2)
+    paths = []
+    for name in "abc":
+        path = tmp_path / f"{name}.json"
+        write(path, f'{{"name": "{name}"}}')
+        paths.append(str(path))
+
+    load_config(paths[0], cache=cache)
+    load_config(paths[1], cache=cache)
+    load_config(paths[0], cache=cache)
+    load_config(paths[2], cache=cache)
+    load_config(paths[0], cache=cache)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.currsize) == (2, 3, 1, 2)
+
+
+def test_invalidate(tmp_path):
+    path = tmp_path / "app.json"
+    write(path, '{"a": 1}')
+    cache = ConfigCache()
+    load_config(str(path), cache=cache)
+    load_config(str(path), select=["a"], cache=cache)
+
+    cache.invalidate(str(path))
+    assert cache.stats().currsize == 0
+
+    load_config(str(path), cache=cache)
+    cache.invalidate()
+    assert cache.stats().currsize == 0
+
+
+def test_missing_file_raises_like_uncached_load(tmp_path):
+    with pytest.raises(RuntimeError):
+        load_config(str(tmp_path / "missing.json"), cache=ConfigCache())
+
+
+def test_file_removed_while_parsing_is_not_cached(tmp_path, monkeypatch):
+    path = tmp_path / "app.json"
+    write(path, '{"a": 1}')
+    real_load_config = loader.load_config
+
+    def load_then_remove(*args, **kwargs):
+        config = real_load_config(*args, **kwargs)
+        os.remove(path)
+        return config
+
+    monkeypatch.setattr(loader, "load_config", load_then_remove)
+    cache = ConfigCache()
+
+    assert cache.load(str(path)) == {"a": 1}
+    assert cache.stats().currsize == 0
+
+
+def test_cache_false_loads_without_caching(tmp_path, monkeypatch):
+    path = tmp_path / "app.json"
+    write(path, '{"a": 1}')
+    monkeypatch.setattr(loader, "default_config_cache", None)
+    assert load_config(str(path), cache=False) == {"a": 1}
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_lazy_loads_bypass_the_cache(tmp_path, frozen):
+    path = tmp_path / "app.toml"
+    write(path, '[server]\nport = 80\n[client]\nretries = 3\n')
+    cache = ConfigCache(frozen=frozen)
+
+    config = cache.load(str(path), lazy=True)
+
+    assert isinstance(config, LazyTOMLDocument)
+    assert sorted(config.pending_tables) == ["client", "server"]
+    assert config["server"] == {"port": 80}
+    assert cache.stats().currsize == 0
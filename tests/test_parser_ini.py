@@ -1,9 +1,14 @@
 import unittest
 
+from decimal import Decimal
+
 from config_lib.parsers.parser_ini import (
     parse_ini_string,
+    parse_ini_sections,
     INISyntaxError,
+    INIValueResolver,
 )
+from config_lib.schema import DEFAULT_SCHEMA
 
 class TestINIParser(unittest.TestCase):
     def test_empty_input(self):
@@ -157,5 +162,64 @@ class TestINIParser(unittest.TestCase):
         self.assertEqual(sec["only_commas"], ["", "", "", ""])
 
 
+class TestINIValueResolver(unittest.TestCase):
+    def test_default_schema_types(self):
+        ini = (
+            "date_of_creation = 2024-01-01T00:00:00Z\n"
+            "users = alice\n"
+            "[database]\n"
+            "password = 12345\n"
+            "port = 5432\n"
+            "is_active = TRUE\n"
+            "last_login = null\n"
+            "[logging]\n"
+            "output = a,b\n"
+            "log_rotation_interval = 24\n"
+        )
+        result = parse_ini_string(ini, value_resolver=INIValueResolver(DEFAULT_SCHEMA))
+
+        self.assertEqual(result["users"], ["alice"])
+        self.assertEqual(result["database"]["password"], "12345")
+        self.assertEqual(result["database"]["port"], 5432)
+        self.assertIs(result["database"]["is_active"], True)
+        self.assertIsNone(result["database"]["last_login"])
+        self.assertEqual(result["logging"]["output"], "a,b")
+        self.assertEqual(result["logging"]["log_rotation_interval"], 24)
+        self.assertIsInstance(result["logging"]["log_rotation_interval"], int)
+
+    def test_undeclared_keys_are_inferred(self):
+        resolver = INIValueResolver({"app.name": str})
+        result = parse_ini_string("[app]\nname = 42\nport = 42\nhosts = a, b", value_resolver=resolver)
+        self.assertEqual(result, {"app": {"name": "42", "port": 42, "hosts": ["a", "b"]}})
+
+    def test_per_key_type_map(self):
+        resolver = INIValueResolver({
+            "version": str,
+            "parent.child": {"ratio": float, "price": Decimal},
+            "ports": {"type": list, "items": {"type": int}},
+        })
+        ini = "version = 1.10\nports = 80, 443\n[parent.child]\nratio = 1\nprice = 9.99"
+        result = parse_ini_string(ini, value_resolver=resolver)
+
+        self.assertEqual(result["version"], "1.10")
+        self.assertEqual(result["ports"], [80, 443])
+        self.assertEqual(result["parent"]["child"]["ratio"], 1.0)
+        self.assertIsInstance(result["parent"]["child"]["ratio"], float)
+        self.assertEqual(result["parent"]["child"]["price"], Decimal("9.99"))
+
+    def test_value_not_matching_declared_type_raises(self):
+        resolver = INIValueResolver(DEFAULT_SCHEMA)
+        with self.assertRaises(INISyntaxError) as ctx:
+            parse_ini_string("[network]\nretries = three", value_resolver=resolver)
+        self.assertEqual(ctx.exception.line_num, 2)
+        self.assertEqual(ctx.exception.column, 11)
+        self.assertIn("expected int", str(ctx.exception))
+
+    def test_streaming_sections_use_resolver(self):
+        resolver = INIValueResolver({"logging.output": str})
+        sections = list(parse_ini_sections(["[logging]", "output = a,b"], value_resolver=resolver))
+        self.assertEqual(sections, [(("logging",), {"output": "a,b"})])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -199,6 +199,26 @@ def test_parse_complex_nested_structure():
     assert result["settings"]["features"] == [1, 2, 3]
 
 
+def test_parse_very_deeply_nested_arrays():
+    depth = 5000
+    result = parse_json_string('[' * depth + ']' * depth)
+    for _ in range(depth - 1):
+        result = result[0]
+    assert result == []
+
+
+def test_parse_closing_characters_inside_strings():
+    json_str = r'{"a": {"b": "}]"}, "c": ["[{", "\\"]}'
+    assert parse_json_string(json_str) == {"a": {"b": "}]"}, "c": ["[{", "\\"]}
+
+
+def test_parse_large_array_of_objects():
+    json_str = '[' + ', '.join(f'{{"id": {i}, "name": "item{i}"}}' for i in range(10000)) + ']'
+    result = parse_json_string(json_str)
+    assert len(result) == 10000
+    assert result[9999] == {"id": 9999, "name": "item9999"}
+
+
 def test_parse_line_number_reporting():
     json_str = '{\n"a": 1,\n"b": \n[2,3,4}}'
     try:
@@ -209,6 +229,55 @@ def test_parse_line_number_reporting():
         pytest.fail("Expected JSONSyntaxError")
 
 
+def test_parse_error_reports_line_and_column():
+    json_str = '{\n  "a": 1,\n  "b": tru\n}'
+    with pytest.raises(JSONSyntaxError, match="line 3, column 7") as exc_info:
+        parse_json_string(json_str)
+    assert exc_info.value.line_number == 3
+    assert exc_info.value.column == 7
+
+
+# === SELECTION ===
+
+SELECTION_JSON = '''
+{
+    "database": {"host": "localhost", "port": 5432},
+    "logging": {"level": "INFO", "handlers": [{"name": "}]\\"{["}]},
+    "network": {"timeout": 30, "retries": 3, "proxy": {"host": "p"}},
+    "users": ["user1", "user2"]
+}
+'''
+
+
+def test_parse_with_selected_subtrees():
+    result = parse_json_string(SELECTION_JSON, select=["database", "network.retries"])
+    assert result == {"database": {"host": "localhost", "port": 5432}, "network": {"retries": 3}}
+
+
+def test_parse_with_selection_keeps_document_order():
+    result = parse_json_string(SELECTION_JSON, select=["users", "logging.level"])
+    assert list(result) == ["logging", "users"]
+    assert result == {"logging": {"level": "INFO"}, "users": ["user1", "user2"]}
+
+
+def test_parse_with_selection_of_missing_or_non_object_paths():
+    assert parse_json_string(SELECTION_JSON, select=["missing", "users.first"]) == {}
+
+
+def test_parse_with_selection_on_array_root_returns_everything():
+    assert parse_json_string('[{"a": 1}]', select=["a"]) == [{"a": 1}]
+
+
+def test_parse_with_selection_still_checks_selected_values():
+    with pytest.raises(JSONSyntaxError, match="Expected value"):
+        parse_json_string('{"skipped": [1, 2], "kept": nope}', select=["kept"])
+
+
+def test_parse_with_selection_unclosed_skipped_value():
+    with pytest.raises(JSONSyntaxError, match=r"No matching closing brace for '\['"):
+        parse_json_string('{"skipped": [1, {"a": 2}, "kept": 1}', select=["kept"])
+
+
 # ====== INVALID CASES ======
 
 
@@ -295,6 +364,21 @@ def test_invalid_unclosed_array_in_object():
 
 # === OBJECTS ===
 
+def test_parse_invalid_trailing_content_after_object():
+    with pytest.raises(JSONSyntaxError, match="Invalid JSON object"):
+        parse_json_string('{"key": "value"} {"other": 1}')
+
+
+def test_parse_invalid_trailing_content_after_array():
+    with pytest.raises(JSONSyntaxError, match="Invalid JSON array"):
+        parse_json_string('[1]"a"]')
+
+
+def test_parse_invalid_top_level_literal():
+    with pytest.raises(JSONSyntaxError, match="Expected value. Possibly missing quotes for string."):
+        parse_json_string('fals')
+
+
 def test_parse_invalid_object_missing_closing_brace():
     with pytest.raises(JSONSyntaxError, match="Invalid JSON object"):
         parse_json_string('{"key": "value"')
@@ -340,3 +424,44 @@ def test_parse_invalid_unicode_escape_short():
 def test_parse_invalid_unicode_escape_non_hex():
     with pytest.raises(JSONSyntaxError, match="Invalid unicode escape"):
         parse_json_string(r'"\uZZZZ"')
+
+
+# === CHANGES FROM THE ORIGINAL PARSER ===
+# Each case below gave a different result before the single-pass scanner;
+# the trailing-content and root-literal cases are pinned above.
+
+def test_error_line_counts_leading_blank_lines():
+    with pytest.raises(JSONSyntaxError, match="line 3, column 6: Expected value"):
+        parse_json_string('\n\n{"a": x}')
+
+
+def test_error_line_is_the_line_of_the_offending_character():
+    with pytest.raises(JSONSyntaxError, match=r"line 3, column 3: Expected ',' or '\{'"):
+        parse_json_string('{\n  "a": 1\n  "b": 2\n}')
+
+
+def test_parse_brackets_inside_nested_strings():
+    assert parse_json_string('[{"a{": 1}]') == [{"a{": 1}]
+    assert parse_json_string('[{"}": 1}]') == [{"}": 1}]
+
+
+def test_parse_invalid_content_hidden_by_bracket_in_string():
+    with pytest.raises(JSONSyntaxError, match="column 36: Expected string key in double quotes"):
+        parse_json_string('{"a": [1, {"[": 2}], "c": {"d": 3, 4]}}')
+
+
+def test_nested_error_reported_before_unclosed_container():
+    with pytest.raises(JSONSyntaxError, match=r"column 20: Expected ',' or '\{' or quotes after value"):
+        parse_json_string('[[1, 2], {"a": [3] "s"]')
+    with pytest.raises(JSONSyntaxError, match="column 18: Invalid number: -"):
+        parse_json_string('[[1, 2], {"a": [-], "s"]')
+
+
+def test_nested_container_closed_by_other_bracket():
+    with pytest.raises(JSONSyntaxError, match=r"column 2: No matching closing brace for '\{'"):
+        parse_json_string('[{"a": ]}]')
+
+
+def test_unclosed_root_ending_in_nested_closer():
+    with pytest.raises(JSONSyntaxError, match="column 1: Invalid JSON object"):
+        parse_json_string('{"a": {"b": 1}')
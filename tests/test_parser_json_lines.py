@@ -0,0 +1,66 @@
+import pytest
+from config_lib.parser import load_json_lines
+from config_lib.parsers.parser_json import JSONSyntaxError
+
+
+def write_json_lines(tmp_path, lines):
+    file_path = tmp_path / "configs.jsonl"
+    file_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(file_path)
+
+
+def tenant_lines(count):
+    return [f'{{"tenant": "t{i}", "limits": {{"cpu": {i % 8}, "tags": ["a", "b"]}}}}' for i in range(count)]
+
+
+def test_load_json_lines_sequential(tmp_path):
+    path = write_json_lines(tmp_path, tenant_lines(5))
+    result = list(load_json_lines(path))
+    assert [line_number for line_number, _ in result] == [1, 2, 3, 4, 5]
+    assert result[3][1] == {"tenant": "t3", "limits": {"cpu": 3, "tags": ["a", "b"]}}
+
+
+def test_load_json_lines_skips_blank_lines(tmp_path):
+    path = write_json_lines(tmp_path, ['{"a": 1}', '', '   ', '{"a": 2}'])
+    assert list(load_json_lines(path)) == [(1, {"a": 1}), (4, {"a": 2})]
+
+
+def test_load_json_lines_parallel_ordered(tmp_path):
+    path = write_json_lines(tmp_path, tenant_lines(250))
+    result = list(load_json_lines(path, workers=2, batch_size=16))
+    assert [line_number for line_number, _ in result] == list(range(1, 251))
+    assert [config["tenant"] for _, config in result] == [f"t{i}" for i in range(250)]
+
+
+def test_load_json_lines_parallel_unordered(tmp_path):
+    path = write_json_lines(tmp_path, tenant_lines(250))
+    result = list(load_json_lines(path, workers=2, batch_size=16, ordered=False, max_pending_batches=3))
+    assert sorted(line_number for line_number, _ in result) == list(range(1, 251))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_load_json_lines_reports_failing_line(tmp_path, workers):
+    lines = tenant_lines(40)
+    lines[36] = '{"tenant": "broken", "limits": }'
+    path = write_json_lines(tmp_path, lines)
+
+    loaded = []
+    with pytest.raises(JSONSyntaxError, match="line 37, column 31: Unexpected end of input") as exc_info:
+        for line_number, _ in load_json_lines(path, workers=workers, batch_size=8):
+            loaded.append(line_number)
+
+    assert exc_info.value.line_number == 37
+    assert loaded == list(range(1, 37))
+
+
+def test_load_json_lines_missing_file(tmp_path):
+    with pytest.raises(RuntimeError, match="Error reading JSON Lines"):
+        list(load_json_lines(str(tmp_path / "missing.jsonl")))
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_load_json_lines_invalid_utf8(tmp_path, workers):
+    file_path = tmp_path / "configs.jsonl"
+    file_path.write_bytes(b'{"tenant": "t0"}\n{"tenant": "\xff"}\n')
+    with pytest.raises(RuntimeError, match="Error reading JSON Lines: 'utf-8' codec"):
+        list(load_json_lines(str(file_path), workers=workers))
@@ -0,0 +1,160 @@
+import pytest
+from config_lib.parser import parse_json
+from config_lib.parsers.parser_json import JSONSyntaxError
+from config_lib.parsers.parser_json_stream import (
+    JSONStreamParser,
+    JSONDocumentBuilder,
+    parse_json_stream,
+)
+
+
+def split_chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+COMPLEX_JSON = '''
+{
+    "users": [
+        {"id": 1, "name": "Alice", "tags": ["a", "b"], "score": -1.5e3},
+        {"id": 2, "name": "Bob \\"the builder\\"", "active": false, "extra": null}
+    ],
+    "settings": {"version": "1.2.3", "unicode": "\\u041f\\u0440\\u0438", "empty": {}, "list": []}
+}
+'''
+
+EXPECTED_COMPLEX = {
+    "users": [
+        {"id": 1, "name": "Alice", "tags": ["a", "b"], "score": -1.5e3},
+        {"id": 2, "name": 'Bob "the builder"', "active": False, "extra": None},
+    ],
+    "settings": {"version": "1.2.3", "unicode": "При", "empty": {}, "list": []},
+}
+
+
+# ====== VALID CASES ======
+
+def test_stream_events_for_simple_object():
+    parser = JSONStreamParser()
+    events = parser.feed('{"a": [1, true], "b": null}')
+    events += parser.close()
+    assert events == [
+        ('start_object', None),
+        ('key', 'a'),
+        ('start_array', None),
+        ('value', 1),
+        ('value', True),
+        ('end_array', None),
+        ('key', 'b'),
+        ('value', None),
+        ('end_object', None),
+    ]
+
+
+def test_stream_events_split_inside_tokens():
+    parser = JSONStreamParser()
+    assert parser.feed('{"ke') == [('start_object', None)]
+    assert parser.feed('y": tr') == [('key', 'key')]
+    assert parser.feed('ue, "n": 12') == [('value', True), ('key', 'n')]
+    assert parser.feed('34}') == [('value', 1234), ('end_object', None)]
+    assert parser.close() == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 4096])
+def test_stream_document_matches_for_any_chunk_size(chunk_size):
+    assert parse_json_stream(split_chunks(COMPLEX_JSON, chunk_size)) == EXPECTED_COMPLEX
+
+
+def test_stream_long_token_in_small_chunks():
+    parser = JSONStreamParser()
+    assert parser.feed('{"text": "') == [('start_object', None), ('key', 'text')]
+    for _ in range(1000):
+        assert parser.feed('ab\\"cd\\\\') == []
+    assert parser.feed('\\') == []
+    assert parser.feed('"') == []
+    assert parser.feed('", "n": 1') == [('value', 'ab"cd\\' * 1000 + '"'), ('key', 'n')]
+    assert parser.feed('2.5') == []
+    assert parser.feed('}') == [('value', 12.5), ('end_object', None)]
+    assert parser.close() == []
+
+
+def test_stream_accepts_utf8_bytes_split_inside_characters():
+    data = '{"greeting": "Привіт"}'.encode('utf-8')
+    chunks = [data[i:i + 1] for i in range(len(data))]
+    assert parse_json_stream(chunks) == {"greeting": "Привіт"}
+
+
+def test_stream_top_level_scalars():
+    assert parse_json_stream(['4', '2']) == 42
+    assert parse_json_stream(['"te', 'xt"']) == "text"
+    assert parse_json_stream(['fal', 'se']) is False
+
+
+def test_stream_empty_input():
+    assert parse_json_stream([]) == {}
+    assert parse_json_stream(['  ', '\n']) == {}
+
+
+def test_stream_trailing_commas_are_accepted():
+    assert parse_json_stream(['{"a": [1, 2,],', '}']) == {"a": [1, 2]}
+
+
+def test_document_builder_from_events():
+    builder = JSONDocumentBuilder()
+    for event in [('start_array', None), ('value', 1), ('start_object', None),
+                  ('key', 'x'), ('value', 'y'), ('end_object', None), ('end_array', None)]:
+        builder.handle(*event)
+    assert builder.document == [1, {"x": "y"}]
+
+
+def test_parse_json_file_in_blocks(tmp_path):
+    file_path = tmp_path / "config.json"
+    file_path.write_text(COMPLEX_JSON, encoding="utf-8")
+    assert parse_json(str(file_path), block_size=16) == EXPECTED_COMPLEX
+
+
+# ====== INVALID CASES ======
+
+def test_stream_error_reports_absolute_line_and_column():
+    parser = JSONStreamParser()
+    parser.feed('{\n  "a": 1,\n')
+    with pytest.raises(JSONSyntaxError, match="line 3, column 8: Expected value"):
+        parser.feed('  "b": nope\n}')
+
+
+def test_stream_unclosed_object():
+    with pytest.raises(JSONSyntaxError, match="Invalid JSON object"):
+        parse_json_stream(['{"key": ', '"value"'])
+
+
+def test_stream_unclosed_nested_array():
+    with pytest.raises(JSONSyntaxError, match=r"No matching closing brace for '\['"):
+        parse_json_stream(['{"numbers": [1, 2, ', '3}'])
+
+
+def test_stream_unterminated_string():
+    with pytest.raises(JSONSyntaxError, match="Unterminated string"):
+        parse_json_stream(['["abc', 'def'])
+
+
+def test_stream_invalid_separator():
+    with pytest.raises(JSONSyntaxError, match="Expected ',' or ']' or quotes after value"):
+        parse_json_stream(['[1; 2]'])
+
+
+def test_stream_trailing_data_after_document():
+    with pytest.raises(JSONSyntaxError, match="Invalid JSON object"):
+        parse_json_stream(['{"a": 1}', ' {"b": 2}'])
+
+
+def test_stream_document_requires_close():
+    parser = JSONStreamParser(build_document=True)
+    parser.feed('{}')
+    with pytest.raises(RuntimeError):
+        _ = parser.document
+
+
+def test_stream_feed_after_close():
+    parser = JSONStreamParser()
+    parser.close()
+    with pytest.raises(RuntimeError):
+        parser.feed('{}')
@@ -1,5 +1,8 @@
 import unittest
-from config_lib.parsers.parser_toml import TOMLParser, TOMLSyntaxError, parse_toml_string
+from datetime import date, datetime, time, timedelta, timezone
+from config_lib.parsers.parser_toml import (TOMLParser, TOMLSyntaxError, LazyTOMLDocument, parse_toml_string,
+                                            parse_toml_datetime)
+from config_lib.parsers.selection import apply_selection, build_selection
 
 
 class TestTOMLParser(unittest.TestCase):
@@ -125,6 +128,51 @@ class TestBasicValues(unittest.TestCase):
         self.assertEqual(result['date2'], '2025-12-31 23:59:59')
 
 
+class TestTypedDateTimes(unittest.TestCase):
+    """Test the optional conversion of dates and times."""
+
+    def setUp(self):
+        self.parser = TOMLParser(parse_datetimes=True)
+
+    def test_typed_values(self):
+        """Test offset, local datetimes, local dates and local times."""
+        toml = '''
+        utc = 2025-05-12T14:00:00Z
+        offset = 2025-05-12t14:00:00.5-05:30
+        local = 2025-12-31 23:59:59
+        day = 2025-01-02
+        clock = 07:32:00
+        history = [1979-05-27, 00:00:01]
+        '''
+        result = self.parser.parse(toml)
+        self.assertEqual(result['utc'], datetime(2025, 5, 12, 14, tzinfo=timezone.utc))
+        self.assertEqual(result['offset'],
+                         datetime(2025, 5, 12, 14, 0, 0, 500000, tzinfo=timezone(-timedelta(hours=5, minutes=30))))
+        self.assertEqual(result['local'], datetime(2025, 12, 31, 23, 59, 59))
+        self.assertEqual(result['day'], date(2025, 1, 2))
+        self.assertEqual(result['clock'], time(7, 32))
+        self.assertEqual(result['history'], [date(1979, 5, 27), time(0, 0, 1)])
+
+    def test_non_dates_stay_as_they_are(self):
+        """Test that numbers and free text are not mistaken for dates."""
+        result = self.parser.parse('a = 20250512\nb = 2025-1-01\nc = "2025-01-02"\nd = 12:30')
+        self.assertEqual(result, {'a': 20250512, 'b': '2025-1-01', 'c': '2025-01-02', 'd': '12:30'})
+
+    def test_out_of_range_date(self):
+        """Test error on a value shaped like a date but out of range."""
+        with self.assertRaises(TOMLSyntaxError) as cm:
+            self.parser.parse('\nday = 2025-02-30')
+        self.assertIn("Invalid date/time value: '2025-02-30'", str(cm.exception))
+        self.assertEqual(cm.exception.line_num, 2)
+
+    def test_parse_toml_datetime(self):
+        """Test the lexical pre-check on its own."""
+        self.assertIsNone(parse_toml_datetime('localhost'))
+        self.assertIsNone(parse_toml_datetime('2025-05-12T14:00'))
+        self.assertEqual(parse_toml_datetime('2025-05-12'), date(2025, 5, 12))
+        self.assertEqual(parse_toml_string('d = 2025-05-12', parse_datetimes=True), {'d': date(2025, 5, 12)})
+
+
 class TestArrays(unittest.TestCase):
     """Test parsing of arrays."""
     
@@ -170,6 +218,72 @@ class TestArrays(unittest.TestCase):
         expected = ['hello, world', "it's working", 'quote: "test"']
         self.assertEqual(result['tricky'], expected)
 
+    def test_multiline_arrays(self):
+        """Test arrays spanning several lines with comments and a trailing comma."""
+        toml = '''
+        hosts = [
+            "alpha",  # primary
+            "beta",
+
+            ["gamma", 3],
+        ]
+        after = 1
+        '''
+        result = self.parser.parse(toml)
+        self.assertEqual(result['hosts'], ['alpha', 'beta', ['gamma', 3]])
+        self.assertEqual(result['after'], 1)
+
+    def test_unterminated_multiline_array(self):
+        """Test error on an array that is never closed."""
+        with self.assertRaises(TOMLSyntaxError) as cm:
+            self.parser.parse('arr = [\n  1,\n  2\n')
+        self.assertIn('Unterminated array', str(cm.exception))
+
+    def test_large_array(self):
+        """Test an array with many elements."""
+        result = self.parser.parse('ids = [' + ', '.join(str(i) for i in range(10000)) + ']')
+        self.assertEqual(result['ids'], list(range(10000)))
+
+
+class TestInlineTables(unittest.TestCase):
+    """Test parsing of inline tables."""
+
+    def setUp(self):
+        self.parser = TOMLParser()
+
+    def test_inline_tables(self):
+        """Test inline tables, nested and inside arrays."""
+        toml = '''
+        point = { x = 1, y = 2.5 }
+        owner = { name = "Tom", tags = ["a", "b"], address = { city = "Kyiv" } }
+        empty = {}
+        points = [{ x = 1 }, { x = 2 }]
+        '''
+        result = self.parser.parse(toml)
+        self.assertEqual(result['point'], {'x': 1, 'y': 2.5})
+        self.assertEqual(result['owner'], {'name': 'Tom', 'tags': ['a', 'b'], 'address': {'city': 'Kyiv'}})
+        self.assertEqual(result['empty'], {})
+        self.assertEqual(result['points'], [{'x': 1}, {'x': 2}])
+
+    def test_inline_table_errors(self):
+        """Test errors inside inline tables."""
+        for toml, message in [('t = { a = 1, a = 2 }', 'Duplicate key'),
+                              ('t = { a = 1', 'Unterminated inline table'),
+                              ('t = { a = 1\n}', 'Unterminated inline table'),
+                              ('t = { a 1 }', "Expected '='")]:
+            with self.subTest(toml=toml):
+                with self.assertRaises(TOMLSyntaxError) as cm:
+                    self.parser.parse(toml)
+                self.assertIn(message, str(cm.exception))
+
+    def test_text_after_value(self):
+        """Test error on trailing text after a complete value."""
+        with self.assertRaises(TOMLSyntaxError) as cm:
+            self.parser.parse('\nkey = "value" extra')
+        self.assertIn('Unexpected text after value', str(cm.exception))
+        self.assertEqual(cm.exception.line_num, 2)
+        self.assertEqual(cm.exception.column, 15)
+
 
 class TestSections(unittest.TestCase):
     """Test parsing of sections and nested sections."""
@@ -337,6 +451,67 @@ class TestConvenienceFunction(unittest.TestCase):
         self.assertEqual(result['section']['nested_key'], 42)
 
 
+class TestLazyLoading(unittest.TestCase):
+    """Test on-demand parsing of top-level tables."""
+
+    TOML = '''title = "app"
+point = { x = 1 }
+
+[database]
+host = "localhost"
+
+[logging]
+level = "info"
+
+[database.replica]
+host = "replica"
+
+[point.extra]
+y = 2
+'''
+
+    def test_tables_parsed_on_access(self):
+        """Test that only accessed tables are parsed."""
+        document = parse_toml_string(self.TOML, lazy=True)
+        self.assertIsInstance(document, LazyTOMLDocument)
+        self.assertEqual(list(document), ['title', 'point', 'database', 'logging'])
+        self.assertEqual(document.pending_tables, ['database', 'logging', 'point'])
+        self.assertEqual(document['title'], 'app')
+
+        self.assertEqual(document['database'], {'host': 'localhost', 'replica': {'host': 'replica'}})
+        self.assertEqual(document.pending_tables, ['logging', 'point'])
+        self.assertEqual(document['point'], {'x': 1, 'extra': {'y': 2}})
+        self.assertIn('logging', document)
+        self.assertEqual(document.pending_tables, ['logging'])
+
+    def test_matches_full_parse(self):
+        """Test that a fully loaded lazy document equals a full parse."""
+        document = parse_toml_string(self.TOML, lazy=True)
+        self.assertEqual(document.to_dict(), parse_toml_string(self.TOML))
+        self.assertEqual(document.pending_tables, [])
+
+    def test_errors_raised_on_access(self):
+        """Test that errors inside a table surface with their line number when it is accessed."""
+        document = parse_toml_string('[ok]\na = 1\n[broken]\nb = \n', lazy=True)
+        self.assertEqual(document['ok'], {'a': 1})
+        with self.assertRaises(TOMLSyntaxError) as cm:
+            document['broken']
+        self.assertEqual(cm.exception.line_num, 4)
+
+    def test_header_like_lines_in_multiline_array(self):
+        """Test that array lines looking like headers do not split the document."""
+        toml = 'matrix = [\n  [1]\n]\n[table]\nkey = 1\n'
+        document = parse_toml_string(toml, lazy=True)
+        self.assertEqual(dict(document), {'matrix': [[1]], 'table': {'key': 1}})
+
+    def test_selection_only_parses_selected_tables(self):
+        """Test that selecting paths from a lazy document leaves other tables unparsed."""
+        document = parse_toml_string(self.TOML, lazy=True)
+        result = apply_selection(document, build_selection(['logging.level']))
+        self.assertEqual(result, {'logging': {'level': 'info'}})
+        self.assertEqual(document.pending_tables, ['database', 'point'])
+
+
 class TestStringEscaping(unittest.TestCase):
     """Test string escape sequence handling."""
     
@@ -1,6 +1,7 @@
 import unittest
 from datetime import datetime
 from config_lib.parsers.parser_yaml import (parse_yaml_string, YAMLSyntaxError,
+                                            YAMLScalarResolver,
                                             _parse_yaml_scalar,
                                             _parse_yaml_lines)
 
@@ -376,6 +377,157 @@ key2: value2
         expected = {"key1": {}, "key2": "value2"}
         self.assertEqual(parse_yaml_string(yaml_str), expected)
 
+    def test_empty_value_in_list_item(self):
+        """Test that an empty value of a list item's key is kept as an empty mapping"""
+        self.assertEqual(parse_yaml_string("items:\n  - k:\nother: 1\n"), {"items": [{"k": {}}], "other": 1})
+        self.assertEqual(parse_yaml_string("- k:\n- j: 1\n"), [{"k": {}}, {"j": 1}])
+
+    def test_key_aligned_with_list_item_key_is_a_sibling(self):
+        """Test that a key under '- k:' at k's column belongs to the same mapping"""
+        self.assertEqual(parse_yaml_string("- k:\n  j:\n"), [{"k": {}, "j": {}}])
+        self.assertEqual(parse_yaml_string("a:\n  - k:\n    v: 1\n"), {"a": [{"k": {}, "v": 1}]})
+
+    def test_four_space_indentation(self):
+        """Test that any consistent indentation width is accepted"""
+        yaml_str = """
+server:
+    host: localhost
+    ports:
+        - 80
+        - 443
+"""
+        expected = {"server": {"host": "localhost", "ports": [80, 443]}}
+        self.assertEqual(parse_yaml_string(yaml_str), expected)
+
+    def test_blank_lines_inside_nested_block(self):
+        """Test that blank lines and comments do not end a nested block"""
+        yaml_str = "a:\n  b: 1\n\n  # comment\n  c: 2\nd: 3\n"
+        self.assertEqual(parse_yaml_string(yaml_str), {"a": {"b": 1, "c": 2}, "d": 3})
+
+    def test_nested_sequences(self):
+        """Test a sequence item that opens another sequence on its line"""
+        yaml_str = "- - 1\n  - 2\n- - 3\n"
+        self.assertEqual(parse_yaml_string(yaml_str), [[1, 2], [3]])
+
+    def test_deeply_nested_mapping(self):
+        """Test a mapping nested ten levels deep"""
+        lines = [f"{'  ' * depth}level{depth}:" for depth in range(10)]
+        lines.append(f"{'  ' * 10}value: 42")
+        result = parse_yaml_string("\n".join(lines))
+        for depth in range(10):
+            result = result[f"level{depth}"]
+        self.assertEqual(result, {"value": 42})
+
+    def test_unexpected_deeper_indentation(self):
+        """Test a line indented deeper than its block without a parent key"""
+        with self.assertRaises(YAMLSyntaxError) as context:
+            parse_yaml_string("a:\n  b: 1\n   c: 2\n")
+        self.assertEqual(context.exception.line_number, 3)
+        self.assertEqual(context.exception.column, 4)
+
+    def test_value_errors_report_the_value_column(self):
+        """Test that errors in a value point at the value, not at its key"""
+        cases = [
+            ("config:\n  key:   *missing", 2, 10),
+            ("items:\n  - &a  *missing", 2, 9),
+            ("base: &b 1\nm:\n  <<: [*b]", 3, 8),
+            ("key: &", 1, 6),
+        ]
+        for yaml_str, line_number, column in cases:
+            with self.subTest(yaml_str=yaml_str):
+                with self.assertRaises(YAMLSyntaxError) as context:
+                    parse_yaml_string(yaml_str)
+                self.assertEqual(context.exception.line_number, line_number)
+                self.assertEqual(context.exception.column, column)
+
+    def test_parse_yaml_lines_base_index(self):
+        """Test that error line numbers are offset by base_index"""
+        with self.assertRaises(YAMLSyntaxError) as context:
+            _parse_yaml_lines(["- item", "key: value"], base_index=10)
+        self.assertEqual(context.exception.line_number, 12)
+
+    def test_resolver_without_datetimes(self):
+        """Test that datetime conversion can be turned off"""
+        resolver = YAMLScalarResolver(parse_datetimes=False)
+        yaml_str = "released: 2023-01-15\nbuild: 2023-01-15T14:30:45\ncount: 3\n"
+        result = parse_yaml_string(yaml_str, scalar_resolver=resolver)
+        self.assertEqual(result, {"released": "2023-01-15", "build": "2023-01-15T14:30:45", "count": 3})
+
+    def test_resolver_reuses_repeated_values(self):
+        """Test that repeated scalar text resolves to one shared object"""
+        resolver = YAMLScalarResolver()
+        result = parse_yaml_string("- host: localhost\n- host: localhost\n", scalar_resolver=resolver)
+        self.assertIs(result[0]["host"], result[1]["host"])
+        self.assertEqual(resolver.resolve.cache_info().hits, 1)
+
+    def test_resolver_without_cache(self):
+        """Test a resolver created with the cache disabled"""
+        resolver = YAMLScalarResolver(cache_size=0)
+        self.assertEqual(resolver.resolve("'quoted' # comment"), "quoted")
+        self.assertEqual(resolver.resolve("-1.5e2"), -150.0)
+        resolver.cache_clear()
+
+    def test_alias_shares_anchor_object(self):
+        """Test that every alias resolves to the anchored object itself"""
+        yaml_str = """
+pool: &pool
+  size: 10
+  timeout: 30
+services:
+  - name: api
+    pool: *pool
+  - name: worker
+    pool: *pool
+"""
+        result = parse_yaml_string(yaml_str)
+        self.assertEqual(result["services"][0]["pool"], {"size": 10, "timeout": 30})
+        self.assertIs(result["services"][0]["pool"], result["pool"])
+        self.assertIs(result["services"][1]["pool"], result["pool"])
+
+    def test_alias_copies_on_request(self):
+        """Test that copy_aliases gives each alias its own copy"""
+        yaml_str = "base: &base\n  tags:\n    - a\ncopy: *base\n"
+        result = parse_yaml_string(yaml_str, copy_aliases=True)
+        self.assertEqual(result["copy"], result["base"])
+        self.assertIsNot(result["copy"], result["base"])
+        self.assertIsNot(result["copy"]["tags"], result["base"]["tags"])
+
+    def test_scalar_and_sequence_item_anchors(self):
+        """Test anchors on scalar values and on sequence items"""
+        yaml_str = "port: &port 8080\nitems:\n  - &first\n    a: 1\n  - *first\n  - *port\n"
+        result = parse_yaml_string(yaml_str)
+        self.assertEqual(result, {"port": 8080, "items": [{"a": 1}, {"a": 1}, 8080]})
+        self.assertIs(result["items"][0], result["items"][1])
+
+    def test_merge_keys(self):
+        """Test '<<' merges with explicit keys taking precedence"""
+        yaml_str = """
+defaults: &defaults
+  timeout: 30
+  retries: 3
+extra: &extra
+  retries: 5
+  verbose: true
+service:
+  timeout: 10
+  <<: [*defaults, *extra]
+"""
+        result = parse_yaml_string(yaml_str)
+        self.assertEqual(result["service"], {"timeout": 10, "retries": 3, "verbose": True})
+
+    def test_unknown_alias(self):
+        """Test that an alias without a preceding anchor is an error"""
+        with self.assertRaises(YAMLSyntaxError) as context:
+            parse_yaml_string("a: 1\nb: *missing\n")
+        self.assertEqual(context.exception.line_number, 2)
+        self.assertIn("Unknown alias '*missing'", str(context.exception))
+
+    def test_merge_of_scalar_alias(self):
+        """Test that merging an alias of a scalar is an error"""
+        with self.assertRaises(YAMLSyntaxError) as context:
+            parse_yaml_string("port: &port 80\nservice:\n  <<: *port\n")
+        self.assertEqual(context.exception.line_number, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
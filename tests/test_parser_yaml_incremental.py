@@ -0,0 +1,77 @@
+import pytest
+from config_lib.parsers.parser_yaml import parse_yaml_string, YAMLSyntaxError
+from config_lib.parsers.parser_yaml_incremental import YAMLDocument
+
+BASE = """\
+# service settings
+database:
+  host: localhost
+  port: 5432
+logging:
+  level: INFO
+  handlers:
+    - console
+    - file
+network:
+  timeout: 30
+"""
+
+
+def test_initial_parse_matches_full_parse():
+    document = YAMLDocument(BASE)
+    assert document.data == parse_yaml_string(BASE)
+    assert document.reparsed_blocks == 3
+
+
+def test_update_reparses_only_changed_block():
+    document = YAMLDocument(BASE)
+    logging = document.data["logging"]
+    network = document.data["network"]
+
+    new_text = BASE.replace("port: 5432", "port: 6543")
+    data = document.update(new_text)
+
+    assert data == parse_yaml_string(new_text)
+    assert document.reparsed_blocks == 1
+    assert data["logging"] is logging
+    assert data["network"] is network
+
+
+def test_update_with_added_and_removed_blocks():
+    document = YAMLDocument(BASE)
+    new_text = BASE.replace("network:\n  timeout: 30\n", "") + "cache:\n  ttl: 60\n"
+    assert document.update(new_text) == parse_yaml_string(new_text)
+    assert list(document.data) == ["database", "logging", "cache"]
+    assert document.reparsed_blocks == 1
+
+
+def test_duplicate_top_level_keys_last_wins():
+    text = "a: 1\nb: 2\na: 3\n"
+    assert YAMLDocument(text).data == parse_yaml_string(text) == {"a": 3, "b": 2}
+
+
+def test_error_keeps_previous_version_and_line_number():
+    document = YAMLDocument(BASE)
+    broken = BASE.replace("  timeout: 30", "  timeout: 30\n - oops")
+    with pytest.raises(YAMLSyntaxError) as exc_info:
+        document.update(broken)
+    with pytest.raises(YAMLSyntaxError) as full_exc_info:
+        parse_yaml_string(broken)
+    assert exc_info.value.line_number == full_exc_info.value.line_number
+    assert document.data == parse_yaml_string(BASE)
+
+
+@pytest.mark.parametrize("text", [
+    "base: &base\n  a: 1\ncopy: *base\n",
+    "- a\n- b\n",
+    "  a: 1\nb: 2\n",
+    "",
+])
+def test_documents_parsed_whole(text):
+    try:
+        expected = parse_yaml_string(text)
+    except YAMLSyntaxError:
+        with pytest.raises(YAMLSyntaxError):
+            YAMLDocument(text)
+        return
+    assert YAMLDocument(text).data == expected
@@ -0,0 +1,42 @@
+import unittest
+
+from config_lib.parsers.position import LineIndex, format_location, get_indent_column
+
+
+class TestLineIndex(unittest.TestCase):
+    def test_locate_first_line(self):
+        index = LineIndex("abc\ndef")
+        self.assertEqual(index.locate(0), (1, 1))
+        self.assertEqual(index.locate(2), (1, 3))
+
+    def test_locate_after_newlines(self):
+        index = LineIndex("abc\ndef\n\nxyz")
+        self.assertEqual(index.locate(3), (1, 4))
+        self.assertEqual(index.locate(4), (2, 1))
+        self.assertEqual(index.locate(8), (3, 1))
+        self.assertEqual(index.locate(11), (4, 3))
+
+    def test_locate_end_of_text(self):
+        index = LineIndex("a\nb\n")
+        self.assertEqual(index.locate(4), (3, 1))
+        self.assertEqual(index.line_number(4), 3)
+
+    def test_index_is_built_lazily(self):
+        index = LineIndex("a\nb")
+        self.assertIsNone(index._line_starts)
+        index.locate(2)
+        self.assertEqual(index._line_starts, [0, 2])
+
+
+class TestFormatting(unittest.TestCase):
+    def test_format_location(self):
+        self.assertEqual(format_location(3), "line 3")
+        self.assertEqual(format_location(3, 7), "line 3, column 7")
+
+    def test_get_indent_column(self):
+        self.assertEqual(get_indent_column("key: value"), 1)
+        self.assertEqual(get_indent_column("    key: value"), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
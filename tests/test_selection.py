@@ -0,0 +1,51 @@
+import unittest
+
+from config_lib.parsers.selection import build_selection, apply_selection
+
+
+class TestBuildSelection(unittest.TestCase):
+    def test_dotted_paths(self):
+        self.assertEqual(
+            build_selection(["database", "network.retries"]),
+            {"database": None, "network": {"retries": None}},
+        )
+
+    def test_shorter_path_covers_longer_path(self):
+        self.assertEqual(build_selection(["network.retries", "network"]), {"network": None})
+        self.assertEqual(build_selection(["network", "network.retries"]), {"network": None})
+
+    def test_sequence_paths_allow_dots_in_keys(self):
+        self.assertEqual(build_selection([("hosts", "a.example.com")]), {"hosts": {"a.example.com": None}})
+
+    def test_invalid_paths(self):
+        with self.assertRaises(ValueError):
+            build_selection(["network..retries"])
+        with self.assertRaises(ValueError):
+            build_selection([()])
+
+
+class TestApplySelection(unittest.TestCase):
+    def setUp(self):
+        self.config = {
+            "database": {"host": "localhost", "port": 5432},
+            "network": {"timeout": 30, "retries": 3},
+            "users": ["a", "b"],
+        }
+
+    def test_select_subtrees(self):
+        selection = build_selection(["database", "network.retries"])
+        self.assertEqual(
+            apply_selection(self.config, selection),
+            {"database": {"host": "localhost", "port": 5432}, "network": {"retries": 3}},
+        )
+
+    def test_missing_and_non_mapping_paths_are_omitted(self):
+        selection = build_selection(["missing", "users.first"])
+        self.assertEqual(apply_selection(self.config, selection), {})
+
+    def test_no_selection_returns_data(self):
+        self.assertIs(apply_selection(self.config, None), self.config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import os
+import pickle
+from datetime import datetime
+
+import pytest
+
+from config_lib import snapshot as snapshot_module
+from config_lib.__main__ import main
+from config_lib.loader import load_config
+from config_lib.snapshot import SnapshotError, compile_snapshot, load_snapshot
+
+VALID_CONFIG = """\
+database:
+  host: localhost
+  port: 5432
+  user: admin
+  password: secret
+  is_active: true
+  last_login: null
+logging:
+  level: INFO
+  output: stdout
+  log_rotation_interval: 24.0
+network:
+  retries: 3
+date_of_creation: 2024-05-31T12:00:00Z
+users:
+  - alice
+"""
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "app.yaml"
+    path.write_text("service:\n  name: api\n  ports:\n    - 80\n    - 443\nreleased: 2024-05-31T12:00:00\n",
+                    encoding="utf-8")
+    return path
+
+
+def test_snapshot_round_trip(source):
+    config = compile_snapshot(str(source))
+    snapshot = source.with_suffix(".cfgc")
+
+    assert snapshot.read_bytes().startswith(b"CFGC")
+    assert load_config(str(snapshot)) == config
+    assert config["released"] == datetime(2024, 5, 31, 12, 0)
+
+
+def test_snapshot_is_sniffed_without_extension(source, tmp_path):
+    output = tmp_path / "app-config"
+    compile_snapshot(str(source), str(output))
+    assert load_config(str(output))["service"]["name"] == "api"
+
+
+def test_stale_snapshot_is_rebuilt(source):
+    snapshot = source.with_suffix(".cfgc")
+    compile_snapshot(str(source))
+
+    source.write_text("service:\n  name: worker\n", encoding="utf-8")
+
+    assert load_config(str(snapshot)) == {"service": {"name": "worker"}}
+    os.remove(source)
+    assert load_config(str(snapshot)) == {"service": {"name": "worker"}}
+
+
+def test_touched_source_with_same_content_keeps_snapshot(source, monkeypatch):
+    snapshot = source.with_suffix(".cfgc")
+    compile_snapshot(str(source))
+    before = snapshot.read_bytes()
+
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+
+    assert load_config(str(snapshot))["service"]["ports"] == [80, 443]
+    after = snapshot.read_bytes()
+    assert after[14:22] == (1_000_000_000).to_bytes(8, "big")
+    assert after[:14] == before[:14] and after[22:] == before[22:]
+
+    # The refreshed mtime spares later loads from hashing the source again
+    monkeypatch.setattr(snapshot_module.hashlib, "blake2b", None)
+    assert load_config(str(snapshot))["service"]["ports"] == [80, 443]
+
+
+def test_snapshot_without_source_is_used_as_is(source):
+    snapshot = source.with_suffix(".cfgc")
+    compile_snapshot(str(source))
+    os.remove(source)
+    assert load_config(str(snapshot))["service"]["name"] == "api"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+def test_snapshot_mode_leaves_process_umask_alone(source, monkeypatch):
+    def fail(mask):
+        raise AssertionError("os.umask must not be called")
+
+    monkeypatch.setattr(os, "umask", fail)
+    compile_snapshot(str(source))
+    assert not [name for name in os.listdir(source.parent) if name.endswith(".tmp")]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+def test_snapshot_mode_follows_umask_and_existing_file(source):
+    snapshot = source.with_suffix(".cfgc")
+    umask = os.umask(0o027)
+    try:
+        compile_snapshot(str(source))
+    finally:
+        os.umask(umask)
+    assert snapshot.stat().st_mode & 0o777 == 0o640
+
+    snapshot.chmod(0o600)
+    compile_snapshot(str(source))
+    assert snapshot.stat().st_mode & 0o777 == 0o600
+
+
+def test_corrupt_snapshot(tmp_path):
+    path = tmp_path / "bad.cfgc"
+    path.write_bytes(b"CFGC")
+    with pytest.raises(SnapshotError, match="Not a config snapshot"):
+        load_snapshot(str(path))
+
+
+def test_snapshot_may_not_contain_arbitrary_classes(source):
+    snapshot = source.with_suffix(".cfgc")
+    compile_snapshot(str(source))
+    data = snapshot.read_bytes()
+    header_end = data.index(b"app.yaml") + len("app.yaml")
+    snapshot.write_bytes(data[:header_end] + pickle.dumps(os.getcwd))
+    os.remove(source)
+
+    with pytest.raises(SnapshotError, match="may not contain"):
+        load_snapshot(str(snapshot))
+
+
+def test_compile_validates_on_request(source):
+    with pytest.raises(ValueError, match="Missing required key"):
+        compile_snapshot(str(source), validate=True)
+    assert not source.with_suffix(".cfgc").exists()
+
+
+def test_command_line_compile(tmp_path, capsys):
+    source = tmp_path / "app.yaml"
+    source.write_text(VALID_CONFIG, encoding="utf-8")
+    output = tmp_path / "build" / "app.cfgc"
+    output.parent.mkdir()
+
+    assert main(["compile", str(source), "-o", str(output), "--validate"]) == 0
+    assert load_config(str(output))["database"]["port"] == 5432
+
+    assert main(["compile", str(tmp_path / "missing.yaml")]) == 1
+    assert "Failed to compile" in capsys.readouterr().err
@@ -1,5 +1,6 @@
 import pytest
-from config_lib.utils import fill_defaults, mask_secrets
+from config_lib import ConfigManager
+from config_lib.utils import fill_defaults, mask_secrets, merge_layers
 
 
 def test_fill_defaults_simple():
@@ -118,3 +119,81 @@ def test_mask_secrets_custom_mask():
 
     result = mask_secrets(config, secret_fields, mask="XXX")
     assert result == {"secret": "XXX"}
+
+
+def test_merge_layers_overrides_nested_keys():
+    base = {"db": {"host": "localhost", "port": 5432}, "debug": False}
+    env = {"db": {"host": "db.prod"}}
+    host = {"debug": True}
+
+    assert merge_layers([base, env, host]) == {"db": {"host": "db.prod", "port": 5432}, "debug": True}
+    assert base == {"db": {"host": "localhost", "port": 5432}, "debug": False}
+
+
+def test_merge_layers_shares_unchanged_subtrees():
+    base = {"services": {f"svc{i}": {"port": i} for i in range(100)}, "logging": {"level": "INFO"}}
+    overlay = {"logging": {"level": "DEBUG"}}
+
+    merged = merge_layers([base, overlay])
+
+    assert merged["services"] is base["services"]
+    assert merged["logging"] is not base["logging"]
+    assert merged["logging"] == {"level": "DEBUG"}
+
+
+def test_merge_layers_without_changes_returns_base():
+    base = {"a": {"b": 1, "c": [1, 2]}}
+    assert merge_layers([base, {"a": {"b": 1}}]) is base
+
+
+def test_merge_layers_value_types_replace():
+    merged = merge_layers([{"a": {"b": 1}, "c": 1}, {"a": "flat", "c": True}])
+    assert merged == {"a": "flat", "c": True}
+    assert merged["c"] is True
+
+
+def test_merge_layers_list_strategies():
+    base = {"hosts": ["a", "b"], "rules": [{"name": "r1", "allow": True}, {"name": "r2"}]}
+    overlay = {"hosts": ["c"], "rules": [{"allow": False}]}
+
+    assert merge_layers([base, overlay]) == {"hosts": ["c"], "rules": [{"allow": False}]}
+    assert merge_layers([base, overlay], list_strategy="append") == {
+        "hosts": ["a", "b", "c"],
+        "rules": [{"name": "r1", "allow": True}, {"name": "r2"}, {"allow": False}],
+    }
+    assert merge_layers([base, overlay], list_strategy="merge") == {
+        "hosts": ["c", "b"],
+        "rules": [{"name": "r1", "allow": False}, {"name": "r2"}],
+    }
+
+
+def test_merge_layers_list_strategy_per_path():
+    base = {"server": {"hosts": ["a"], "ports": [80]}}
+    overlay = {"server": {"hosts": ["b"], "ports": [443]}}
+
+    merged = merge_layers([base, overlay], list_strategy={"server.hosts": "append"})
+    assert merged == {"server": {"hosts": ["a", "b"], "ports": [443]}}
+
+
+def test_merge_layers_unknown_list_strategy():
+    with pytest.raises(ValueError, match="Unknown list strategy"):
+        merge_layers([{}, {}], list_strategy="union")
+
+
+def test_merge_layers_empty():
+    assert merge_layers([]) == {}
+
+
+def test_config_manager_from_layers(tmp_path):
+    base = tmp_path / "base.yaml"
+    base.write_text("db:\n  host: localhost\n  port: 5432\n", encoding="utf-8")
+    env = tmp_path / "prod.json"
+    env.write_text('{"db": {"host": "db.prod"}}', encoding="utf-8")
+
+    manager = ConfigManager.from_layers([str(base), str(env), {"db": {"port": 6432}}])
+    assert manager.get_config() == {"db": {"host": "db.prod", "port": 6432}}
+
+
+def test_config_manager_from_layers_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ConfigManager.from_layers([str(tmp_path / "missing.yaml")])
@@ -0,0 +1,97 @@
+import io
+
+import pytest
+from config_lib.loader import load_config
+from config_lib.parser import iter_yaml_documents
+from config_lib.parsers.parser_yaml import YAMLSyntaxError
+
+MANIFEST = """\
+---
+kind: Service
+metadata:
+  name: web
+---
+# second document
+kind: Deployment
+spec:
+  replicas: 3
+...
+---
+---
+kind: ConfigMap
+"""
+
+
+def write_manifest(tmp_path, text=MANIFEST, name="manifest.yaml"):
+    file_path = tmp_path / name
+    file_path.write_text(text, encoding="utf-8")
+    return str(file_path)
+
+
+def test_iter_yaml_documents_from_path(tmp_path):
+    documents = list(iter_yaml_documents(write_manifest(tmp_path)))
+    assert documents == [
+        {"kind": "Service", "metadata": {"name": "web"}},
+        {"kind": "Deployment", "spec": {"replicas": 3}},
+        {"kind": "ConfigMap"},
+    ]
+
+
+def test_iter_yaml_documents_is_lazy():
+    lines_read = []
+
+    def lines():
+        for line in io.StringIO("a: 1\n---\nb: 2\n---\nc: [\n"):
+            lines_read.append(line)
+            yield line
+
+    documents = iter_yaml_documents(lines())
+    assert next(documents) == {"a": 1}
+    assert len(lines_read) == 2
+    assert next(documents) == {"b": 2}
+    assert len(lines_read) == 4
+
+
+def test_iter_yaml_documents_without_markers():
+    assert list(iter_yaml_documents(io.StringIO("a: 1\nb:\n  c: 2\n"))) == [{"a": 1, "b": {"c": 2}}]
+
+
+def test_iter_yaml_documents_error_line_is_absolute():
+    stream = io.StringIO("a: 1\n---\nb: 2\n---\n- x\ny: 1\n")
+    documents = iter_yaml_documents(stream)
+    assert next(documents) == {"a": 1}
+    assert next(documents) == {"b": 2}
+    with pytest.raises(YAMLSyntaxError) as exc_info:
+        next(documents)
+    assert exc_info.value.line_number == 6
+
+
+@pytest.mark.parametrize("marker_line, column", [("--- {a: 1}", 5), ("---   value", 7), ("... trailing", 5)])
+def test_iter_yaml_documents_rejects_content_on_marker_line(marker_line, column):
+    documents = iter_yaml_documents(io.StringIO(f"a: 1\n{marker_line}\nb: 2\n"))
+    with pytest.raises(YAMLSyntaxError, match="after document marker") as exc_info:
+        list(documents)
+    assert (exc_info.value.line_number, exc_info.value.column) == (2, column)
+
+
+def test_iter_yaml_documents_marker_with_comment():
+    stream = io.StringIO("--- # first\na: 1\n---\t# second\nb: 2\n")
+    assert list(iter_yaml_documents(stream)) == [{"a": 1}, {"b": 2}]
+
+
+def test_iter_yaml_documents_missing_file(tmp_path):
+    with pytest.raises(RuntimeError, match="Error reading YAML"):
+        list(iter_yaml_documents(str(tmp_path / "missing.yaml")))
+
+
+def test_load_config_all_documents(tmp_path):
+    path = write_manifest(tmp_path)
+    assert [document["kind"] for document in load_config(path, all_documents=True)] == [
+        "Service", "Deployment", "ConfigMap"]
+    assert load_config(path, all_documents=True, select=["kind"])[1] == {"kind": "Deployment"}
+
+
+def test_load_config_all_documents_single_document_format(tmp_path):
+    file_path = tmp_path / "app.json"
+    file_path.write_text('{"a": 1}', encoding="utf-8")
+    assert load_config(str(file_path), all_documents=True) == [{"a": 1}]